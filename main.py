@@ -1,29 +1,6 @@
-import logging
-import logging.config
-import os
+import sys
 
-from naval_warfare.game import prepare_game
-from naval_warfare.game import show_final_boards
-from naval_warfare.game import start
-
-logging.config.dictConfig(
-    {
-        "version": 1,
-        "disable_existing_loggers": False,
-        "formatters": {
-            "standard": {
-                "()": logging.Formatter,
-                "format": "%(levelname)-8s [%(asctime)s] %(name)s: %(message)s",
-            }
-        },
-        "handlers": {"console": {"class": "logging.StreamHandler", "formatter": "standard"}},
-        "loggers": {
-            "": {"level": os.getenv("LOG_LEVEL", "WARNING"), "handlers": ["console"]},
-        },
-    }
-)
+from naval_warfare.cli import main
 
 if __name__ == "__main__":
-    game = prepare_game()
-    start(game)
-    show_final_boards(game)
+    sys.exit(main(["play"]))
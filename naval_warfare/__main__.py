@@ -0,0 +1,5 @@
+import sys
+
+from naval_warfare.cli import main
+
+sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Benchmarks of the board memory and of the main operations of a game. Run them with `python -m naval_warfare.benchmark`
+(see `--help`): a run can be saved as a JSON baseline and a later run compared against it, failing when a scenario
+got slower than the allowed slowdown.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from functools import partial
+from random import Random
+from typing import Callable
+from typing import Dict
+from typing import Generator
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from naval_warfare.actions import bomb_position_quietly
+from naval_warfare.bitboard import BitBoard
+from naval_warfare.exceptions import NoPositionsLeft
+from naval_warfare.fleet import generate_random_fleet
+from naval_warfare.fleet import generate_random_fleets
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import AvailableShip
+from naval_warfare.game import BoardFactory
+from naval_warfare.game import GameOption
+from naval_warfare.game import Player
+from naval_warfare.game import place_available_ship
+from naval_warfare.models import Board2D
+from naval_warfare.numpy_board import NumpyBoard2D
+from naval_warfare.scheduler import TargetScheduler
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.simulation import simulate
+from naval_warfare.sparse_board import SparseBoard
+
+BOARD_FACTORIES: Sequence[BoardFactory] = (Board2D, NumpyBoard2D, BitBoard, SparseBoard)
+
+BenchmarkResult = namedtuple("BenchmarkResult", ["scenario", "size", "fleet_scale", "ops_per_second", "peak_bytes"])
+
+# A scenario yields the operations to time: whatever runs between two operations (e.g. a new board) isn't timed
+Scenario = Callable[[int, int, GameOption, BoardFactory, Random], Generator[Callable[[], object], None, None]]
+
+
+def measure_allocated_bytes(function: Callable[[], object]) -> int:
+    """Return how many bytes are still allocated by what `function` returns (measured with `tracemalloc`)."""
+    tracemalloc.start()
+    try:
+        result = function()
+        allocated_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return allocated_bytes
+
+
+def measure_peak_bytes(function: Callable[[], object]) -> int:
+    """Return the peak of bytes allocated while `function` runs (measured with `tracemalloc`)."""
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak_bytes
+
+
+def measure_board_memory(length: int, width: int, board_factory: BoardFactory = Board2D) -> int:
+    return measure_allocated_bytes(lambda: board_factory(length, width))
+
+
+def format_bytes(count: int) -> str:
+    return f"{count / 2**10:.1f} KB" if count < 2**20 else f"{count / 2**20:.2f} MB"
+
+
+def show_board_memory(
+    sizes: Sequence[int] = (10, 100, 1000), board_factories: Sequence[BoardFactory] = BOARD_FACTORIES
+):
+    for board_factory in board_factories:
+        for size in sizes:
+            allocated_bytes = measure_board_memory(size, size, board_factory)
+            print(
+                f"{board_factory.__name__} {size}x{size}: {format_bytes(allocated_bytes)} "
+                f"({allocated_bytes / (size * size):.1f} bytes per position)"
+            )
+
+
+def scale_game_option(game_option: GameOption, fleet_scale: int) -> GameOption:
+    return {
+        ship_slug: AvailableShip(
+            kind=ship_option["kind"], length=ship_option["length"], quantity=ship_option["quantity"] * fleet_scale
+        )
+        for ship_slug, ship_option in game_option.items()
+    }
+
+
+def allocate_board_scenario(length, width, game_option, board_factory, rng):
+    while True:
+        yield partial(board_factory, length, width)
+
+
+def place_fleet_scenario(length, width, game_option, board_factory, rng):
+    def place_fleet(player: Player):
+        for ship_slug, position, direction in generate_random_fleet(game_option, length, width, rng):
+            place_available_ship(player, player.game_option[ship_slug], position, direction)
+
+    while True:
+        yield partial(
+            place_fleet,
+            Player("Player", game_option=game_option, length=length, width=width, board_factory=board_factory),
+        )
+
+
+def bomb_scenario(length, width, game_option, board_factory, rng):
+    while True:
+        fleet = generate_random_fleet(game_option, length, width, rng)
+        player = prepare_headless_player(
+            "Player", game_option, fleet, length=length, width=width, board_factory=board_factory
+        )
+        scheduler = TargetScheduler(length, width, rng)
+        try:
+            while True:
+                yield partial(bomb_position_quietly, player.board, scheduler.next_position())
+        except NoPositionsLeft:
+            continue
+
+
+def self_play_game_scenario(length, width, game_option, board_factory, rng):
+    while True:
+        fleets = generate_random_fleets(game_option, length, width, rng)
+        yield partial(
+            simulate, game_option, fleets, rng.getrandbits(64), length=length, width=width, board_factory=board_factory
+        )
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "allocate board": allocate_board_scenario,
+    "place fleet": place_fleet_scenario,
+    "bomb": bomb_scenario,
+    "self-play game": self_play_game_scenario,
+}
+
+
+def run_scenario(
+    scenario: Scenario,
+    size: int,
+    fleet_scale: int = 1,
+    *,
+    game_option: Optional[GameOption] = None,
+    board_factory: BoardFactory = Board2D,
+    min_time: float = 0.2,
+    seed: int = 0,
+) -> BenchmarkResult:
+    """Time the operations of a scenario on a `size` x `size` board for at least `min_time` seconds (and once)."""
+    game_option = scale_game_option(game_option or DEFAULT_GAME_OPTION, fleet_scale)
+    operations = scenario(size, size, game_option, board_factory, Random(seed))
+
+    peak_bytes = measure_peak_bytes(next(operations))
+
+    count, elapsed = 0, 0.0
+    while not count or elapsed < min_time:
+        operation = next(operations)
+        start = time.perf_counter()
+        operation()
+        elapsed += time.perf_counter() - start
+        count += 1
+    operations.close()
+
+    name = next(name for name, known_scenario in SCENARIOS.items() if known_scenario is scenario)
+    return BenchmarkResult(name, size, fleet_scale, count / elapsed, peak_bytes)
+
+
+def fits_on_board(game_option: GameOption, size: int, fleet_scale: int) -> bool:
+    """Crowded boards are left out: a fleet can take at most half of the positions."""
+    fleet_positions = sum(ship_option["length"] * ship_option["quantity"] for ship_option in game_option.values())
+    return fleet_positions * fleet_scale <= size * size // 2
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = (10, 100, 1000),
+    fleet_scales: Sequence[int] = (1, 10),
+    scenarios: Optional[Sequence[str]] = None,
+    **kwargs,
+) -> List[BenchmarkResult]:
+    game_option = kwargs.get("game_option") or DEFAULT_GAME_OPTION
+    return [
+        run_scenario(SCENARIOS[name], size, fleet_scale, **kwargs)
+        for name in scenarios or SCENARIOS
+        for size in sizes
+        for fleet_scale in fleet_scales
+        if fits_on_board(game_option, size, fleet_scale)
+    ]
+
+
+def benchmark_key(result: BenchmarkResult) -> str:
+    return f"{result.scenario} {result.size}x{result.size} fleet x{result.fleet_scale}"
+
+
+def save_baseline(results: Sequence[BenchmarkResult], path: str):
+    with open(path, "w") as baseline_file:
+        json.dump({benchmark_key(result): result._asdict() for result in results}, baseline_file, indent=2)
+
+
+def load_baseline(path: str) -> Dict[str, BenchmarkResult]:
+    with open(path) as baseline_file:
+        return {key: BenchmarkResult(**result) for key, result in json.load(baseline_file).items()}
+
+
+def compare_with_baseline(
+    results: Sequence[BenchmarkResult], baseline: Dict[str, BenchmarkResult], max_slowdown: float = 0.1
+) -> List[str]:
+    """Describe every scenario whose ops/sec dropped more than `max_slowdown` (e.g. 0.1 for 10%) from the baseline."""
+    regressions = []
+    for result in results:
+        baseline_result = baseline.get(benchmark_key(result))
+        if not baseline_result:
+            continue
+        slowdown = 1 - result.ops_per_second / baseline_result.ops_per_second
+        if slowdown > max_slowdown:
+            regressions.append(
+                f"{benchmark_key(result)}: {result.ops_per_second:.1f} ops/sec, "
+                f"{slowdown:.0%} slower than {baseline_result.ops_per_second:.1f}"
+            )
+    return regressions
+
+
+def show_benchmark_results(results: Sequence[BenchmarkResult]):
+    for result in results:
+        print(
+            f"{benchmark_key(result):<40} {result.ops_per_second:>14.1f} ops/sec"
+            f" {result.peak_bytes / 2**20:>10.2f} MB peak"
+        )
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m naval_warfare.benchmark", description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--fleet-scales", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS))
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds spent timing each scenario")
+    parser.add_argument("--save", metavar="PATH", help="save the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results with a JSON baseline")
+    parser.add_argument("--max-slowdown", type=float, default=10, help="allowed slowdown, in percent")
+    parser.add_argument("--board-memory", action="store_true", help="only show how much memory a board takes")
+    options = parser.parse_args(arguments)
+
+    if options.board_memory:
+        show_board_memory(options.sizes)
+        return 0
+
+    results = run_benchmarks(options.sizes, options.fleet_scales, options.scenarios, min_time=options.min_time)
+    show_benchmark_results(results)
+    if options.save:
+        save_baseline(results, options.save)
+
+    if not options.compare:
+        return 0
+    regressions = compare_with_baseline(results, load_baseline(options.compare), options.max_slowdown / 100)
+    for regression in regressions:
+        print(f"Slower than the baseline: {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
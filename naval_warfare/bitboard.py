@@ -0,0 +1,181 @@
+from collections import namedtuple
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from naval_warfare.actions import BombOutcome
+from naval_warfare.exceptions import CannotBombPosition
+from naval_warfare.models import STATUS_CHARS
+from naval_warfare.models import Position
+from naval_warfare.models import PositionStatus
+from naval_warfare.models import Ship
+from naval_warfare.models import ShipDirection
+
+if TYPE_CHECKING:
+    from naval_warfare.placements import PlacementIndex
+
+BitBoardSnapshot = namedtuple(
+    "BitBoardSnapshot", ["occupied", "bombed", "ship_masks", "ships_count", "ships_afloat", "hits_taken"]
+)
+
+
+@dataclass(eq=False)
+class BitBoard:
+    """
+    Board where every per-position question is answered with integer bit operations. Position (x, y) is the bit
+    `x * width + y` of:
+        - `occupied`: positions with a ship
+        - `bombed`: bombed positions
+        - `ship_masks[ship_id]`: positions of each ship
+
+    Python integers have arbitrary precision, so any size works, but every update copies the whole mask: it's meant
+    for standard-size games (up to 64 or 128 positions per side).
+    """
+
+    length: int  # horizontal - x
+    width: int  # vertical - y
+    occupied: int = field(default=0, init=False)
+    bombed: int = field(default=0, init=False)
+    ship_masks: List[int] = field(default_factory=list, init=False)
+    ships: List[Ship] = field(default_factory=list, init=False)
+    ships_afloat: int = field(default=0, init=False)
+    _known_ships: List[Ship] = field(default_factory=list, init=False, repr=False)
+    _known_ship_ids: Dict[int, int] = field(default_factory=dict, init=False, repr=False)
+    _ship_id_at: Dict[int, int] = field(default_factory=dict, init=False, repr=False)  # bit index -> ship id
+    placement_index: Optional["PlacementIndex"] = field(default=None, init=False, repr=False)
+
+    def __str__(self) -> str:
+        return "\n".join(self.rows())
+
+    def rows(self) -> Iterator[str]:
+        status_chars = STATUS_CHARS
+        for i in range(self.length):
+            yield " ".join([status_chars[self.status_at(Position(i, j))] for j in range(self.width)])
+
+    def bit_index(self, position: Position) -> int:
+        return position.x * self.width + position.y
+
+    def span_mask(self, front_position: Position, length: int, direction: ShipDirection) -> int:
+        if direction == ShipDirection.H:
+            return ((1 << length) - 1) << self.bit_index(front_position)
+
+        mask, first_index = 0, self.bit_index(front_position)
+        for offset in range(length):
+            mask |= 1 << (first_index + offset * self.width)
+        return mask
+
+    def status_at(self, position: Position) -> PositionStatus:
+        bit = 1 << self.bit_index(position)
+        if self.bombed & bit:
+            return PositionStatus.BOMBED
+        if self.occupied & bit:
+            return PositionStatus.OCCUPIED
+        return PositionStatus.FREE
+
+    def ship_at(self, position: Position) -> Optional[Ship]:
+        ship_id = self._ship_id_at.get(self.bit_index(position))
+        return self._known_ships[ship_id] if ship_id is not None else None
+
+    def ship_id_of(self, ship: Ship) -> int:
+        ship_id = self._known_ship_ids.get(id(ship))
+        if ship_id is None:
+            ship_id = self._known_ship_ids[id(ship)] = len(self._known_ships)
+            self._known_ships.append(ship)
+            self.ship_masks.append(0)
+        return ship_id
+
+    def occupy_position(self, position: Position, ship: Ship):
+        self._occupy_mask(1 << self.bit_index(position), ship)
+
+    def mark_bombed(self, position: Position) -> bool:
+        bit = 1 << self.bit_index(position)
+        self.bombed |= bit
+        return bool(self.occupied & bit)
+
+    def is_span_free(self, front_position: Position, length: int, direction: ShipDirection) -> bool:
+        return not (self.occupied | self.bombed) & self.span_mask(front_position, length, direction)
+
+    def occupy_span(self, front_position: Position, length: int, direction: ShipDirection, ship: Ship):
+        self._occupy_mask(self.span_mask(front_position, length, direction), ship)
+
+    def _occupy_mask(self, mask: int, ship: Ship):
+        ship_id = self.ship_id_of(ship)
+        self.occupied |= mask
+        self.ship_masks[ship_id] |= mask
+
+        while mask:
+            lowest_bit = mask & -mask
+            self._ship_id_at[lowest_bit.bit_length() - 1] = ship_id
+            mask ^= lowest_bit
+
+    def snapshot(self) -> BitBoardSnapshot:
+        """Same as `Board2D.snapshot`, but nothing is journaled: the masks are immutable integers."""
+        return BitBoardSnapshot(
+            self.occupied,
+            self.bombed,
+            tuple(self.ship_masks),
+            len(self.ships),
+            self.ships_afloat,
+            tuple(ship.hits_taken for ship in self.ships),
+        )
+
+    def restore(self, snapshot: BitBoardSnapshot):
+        for ship_id, ship_mask in enumerate(self.ship_masks):
+            added_mask = ship_mask & ~snapshot.ship_masks[ship_id] if ship_id < len(snapshot.ship_masks) else ship_mask
+            while added_mask:
+                lowest_bit = added_mask & -added_mask
+                del self._ship_id_at[lowest_bit.bit_length() - 1]
+                added_mask ^= lowest_bit
+
+        for ship in self._known_ships[len(snapshot.ship_masks) :]:
+            del self._known_ship_ids[id(ship)]
+        del self._known_ships[len(snapshot.ship_masks) :]
+        self.ship_masks = list(snapshot.ship_masks)
+
+        self.occupied, self.bombed = snapshot.occupied, snapshot.bombed
+        del self.ships[snapshot.ships_count :]
+        for ship, hits_taken in zip(self.ships, snapshot.hits_taken):
+            ship.hits_taken = hits_taken
+        self.ships_afloat = snapshot.ships_afloat
+        self.placement_index = None  # Not rolled back, so it would be stale
+
+    def discard_snapshots(self):
+        """Nothing to release, snapshots of a `BitBoard` hold no journal."""
+
+
+def is_bitboard_ship_destroyed(board: BitBoard, ship_id: int) -> bool:
+    return not board.ship_masks[ship_id] & ~board.bombed
+
+
+def has_bitboard_all_ships_destroyed(board: BitBoard) -> bool:
+    return not board.occupied & ~board.bombed
+
+
+def bomb_bitboard_position(board: BitBoard, position: Position) -> BombOutcome:
+    """Same as `actions.bomb_position_quietly`, but working directly on the masks of a `BitBoard`."""
+    x, y = position
+    if not (0 <= x < board.length and 0 <= y < board.width):
+        raise CannotBombPosition
+
+    index = x * board.width + y
+    bit = 1 << index
+    if board.bombed & bit:
+        raise CannotBombPosition
+
+    board.bombed |= bit
+    if board.placement_index is not None:
+        board.placement_index.block_position(position)
+    if not board.occupied & bit:
+        return BombOutcome(False, False)
+
+    ship_id = board._ship_id_at[index]
+    board._known_ships[ship_id].hits_taken += 1
+    if board.ship_masks[ship_id] & ~board.bombed:
+        return BombOutcome(True, False)
+
+    board.ships_afloat -= 1
+    return BombOutcome(True, True)
@@ -1,10 +1,11 @@
 import logging
 from typing import List
 from typing import Sequence
+from typing import Tuple
 
 from naval_warfare.exceptions import CannotOccupyPositions
 from naval_warfare.exceptions import UnknownDirection
-from naval_warfare.models import Board2D
+from naval_warfare.models import Board
 from naval_warfare.models import Position
 from naval_warfare.models import PositionStatus
 from naval_warfare.models import Ship
@@ -15,30 +16,67 @@ from naval_warfare.ship import is_ship_destroyed
 logger = logging.getLogger(__name__)
 
 
-def is_position_inside_the_board(board: Board2D, position: Position) -> bool:
+def is_position_inside_the_board(board: Board, position: Position) -> bool:
     return 0 <= position.x < board.length and 0 <= position.y < board.width
 
 
-def is_position_bombed(board: Board2D, position: Position) -> bool:
+def is_position_bombed(board: Board, position: Position) -> bool:
     return board.status_at(position) == PositionStatus.BOMBED
 
 
-def can_bomb_board_position(board: Board2D, position: Position) -> bool:
+def can_bomb_board_position(board: Board, position: Position) -> bool:
     return is_position_inside_the_board(board, position) and not is_position_bombed(board, position)
 
 
-def is_position_occuppied(board: Board2D, position: Position) -> bool:
+def is_position_occuppied(board: Board, position: Position) -> bool:
     return board.status_at(position) == PositionStatus.OCCUPIED
 
 
-def cannot_occupy_board_in_the_positions(board: Board2D, positions: Sequence[Position]) -> bool:
-    return any(
-        not is_position_inside_the_board(board, position) or board.status_at(position) != PositionStatus.FREE
-        for position in positions
+def is_ship_span_inside_the_board(
+    board: Board, ship_length: int, front_position: Position, direction: ShipDirection
+) -> bool:
+    """Check, only with arithmetic, if a ship placed at `front_position` towards `direction` fits in the board."""
+    if direction == ShipDirection.H:
+        last_position = Position(front_position.x, front_position.y + ship_length - 1)
+    elif direction == ShipDirection.V:
+        last_position = Position(front_position.x + ship_length - 1, front_position.y)
+    else:
+        raise UnknownDirection
+
+    return is_position_inside_the_board(board, front_position) and is_position_inside_the_board(board, last_position)
+
+
+def cannot_occupy_board_span(
+    board: Board, ship_length: int, front_position: Position, direction: ShipDirection
+) -> bool:
+    return not is_ship_span_inside_the_board(board, ship_length, front_position, direction) or not board.is_span_free(
+        front_position, ship_length, direction
     )
 
 
+def cannot_occupy_board_in_the_positions(board: Board, positions: Sequence[Position]) -> bool:
+    """Any positions, each checked as a span of length 1 (see `cannot_occupy_board_span`)."""
+    return any(cannot_occupy_board_span(board, 1, position, ShipDirection.H) for position in positions)
+
+
+def occupy_board_span(board: Board, front_position: Position, span_length: int, direction: ShipDirection, ship: Ship):
+    if cannot_occupy_board_span(board, span_length, front_position, direction):
+        raise CannotOccupyPositions
+
+    board.occupy_span(front_position, span_length, direction, ship)
+    if board.placement_index is not None:
+        board.placement_index.block_span(front_position, span_length, direction)
+    board.ships.append(ship)
+    board.ships_afloat += 1
+
+
+def occupy_board_span_with_ship(board: Board, front_position: Position, direction: ShipDirection, ship: Ship):
+    """Check and occupy the ship positions as a single row/column span."""
+    occupy_board_span(board, front_position, ship.length, direction, ship)
+
+
 def retrieve_affected_positions(ship_length: int, front_position: Position, direction: ShipDirection) -> List[Position]:
+    """The positions of a span, one by one: placing a ship doesn't need them (see `occupy_board_span`)."""
     if direction == ShipDirection.H:
         return [Position(front_position.x, j) for j in range(front_position.y, front_position.y + ship_length)]
 
@@ -48,30 +86,46 @@ def retrieve_affected_positions(ship_length: int, front_position: Position, dire
     raise UnknownDirection
 
 
-def occupy_board_positions_with_ship(board: Board2D, positions: Sequence[Position], ship: Ship):
-    logger.info("Possible positions that will be occupied: %s", positions)
-    if cannot_occupy_board_in_the_positions(board, positions):
+def retrieve_span(positions: Sequence[Position]) -> Tuple[Position, int, ShipDirection]:
+    """Front position, length and direction of `positions`, which must be a single row or column span in order."""
+    if not positions:
+        raise CannotOccupyPositions
+    front_position = positions[0]
+    direction = ShipDirection.V if len(positions) > 1 and positions[1].x != front_position.x else ShipDirection.H
+    if list(positions) != retrieve_affected_positions(len(positions), front_position, direction):
         raise CannotOccupyPositions
+    return front_position, len(positions), direction
 
-    for position in positions:
-        board.chart[position.x][position.y].status = PositionStatus.OCCUPIED
-        board.chart[position.x][position.y].ship = ship
 
-    board.ships.append(ship)
-    logger.info("Board positions occupied!")
+def occupy_board_positions_with_ship(board: Board, positions: Sequence[Position], ship: Ship):
+    """Same as `occupy_board_span`, with the span given as its positions."""
+    is_logging = logger.isEnabledFor(logging.INFO)
+    if is_logging:
+        logger.info("Possible positions that will be occupied: %s", positions)
+    front_position, span_length, direction = retrieve_span(positions)
+    occupy_board_span(board, front_position, span_length, direction, ship)
+    if is_logging:
+        logger.info("Board positions occupied!")
 
 
-def bomb_board_position(board: Board2D, position: Position) -> bool:
-    has_hit_something = is_position_occuppied(board, position)
-    board.chart[position.x][position.y].status = PositionStatus.BOMBED
-    return has_hit_something
+def bomb_board_position(board: Board, position: Position) -> bool:
+    if board.placement_index is not None:
+        board.placement_index.block_position(position)
+    return board.mark_bombed(position)
 
 
-def has_destroyed_ship_on_position(board: Board2D, position: Position) -> bool:
+def has_destroyed_ship_on_position(board: Board, position: Position) -> bool:
     affected_ship = board.ship_at(position)
+    if affected_ship is None:
+        return False
+    was_destroyed = is_ship_destroyed(affected_ship)
     increase_ship_hits_taken(affected_ship)
-    return is_ship_destroyed(affected_ship)
+
+    is_destroyed = is_ship_destroyed(affected_ship)
+    if is_destroyed and not was_destroyed:
+        board.ships_afloat -= 1
+    return is_destroyed
 
 
-def has_all_ships_destroyed(board: Board2D) -> bool:
-    return all(is_ship_destroyed(ship) for ship in board.ships)
+def has_all_ships_destroyed(board: Board) -> bool:
+    return board.ships_afloat <= 0
@@ -0,0 +1,97 @@
+"""
+Serialized checkpoints of a game, e.g. to persist a long-running server match and resume it later. A checkpoint only
+holds what's needed to rebuild the game: the board size, the game option, each player's fleet and the positions
+bombed on each board, as a JSON-compatible `dict`.
+"""
+
+import json
+from typing import Any
+from typing import Dict
+from typing import TextIO
+
+from naval_warfare.actions import bomb_position_quietly
+from naval_warfare.game import AvailableShip
+from naval_warfare.game import BoardFactory
+from naval_warfare.game import Game
+from naval_warfare.game import GameOption
+from naval_warfare.game import Player
+from naval_warfare.models import Board
+from naval_warfare.models import Board2D
+from naval_warfare.models import Position
+from naval_warfare.models import PositionStatus
+from naval_warfare.models import ShipDirection
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.sparse_board import SparseBoard
+
+CHECKPOINT_VERSION = 1
+
+Checkpoint = Dict[str, Any]
+
+
+def retrieve_original_game_option(player: Player) -> GameOption:
+    """The game option the player started with: ships still available plus the ones already placed."""
+    return {
+        ship_slug: AvailableShip(
+            kind=ship_option["kind"],
+            length=ship_option["length"],
+            quantity=ship_option["quantity"] + sum(1 for placement in player.placements if placement[0] == ship_slug),
+        )
+        for ship_slug, ship_option in player.game_option.items()
+    }
+
+
+def retrieve_bombed_positions(board: Board) -> list:
+    """The bombed positions, row by row. Dense boards are scanned, sparse ones only list what they hold."""
+    if isinstance(board, SparseBoard):
+        return [[x, y] for x, y in board.bombed_positions()]
+    return [
+        [x, y]
+        for x in range(board.length)
+        for y in range(board.width)
+        if board.status_at(Position(x, y)) == PositionStatus.BOMBED
+    ]
+
+
+def create_checkpoint(game: Game) -> Checkpoint:
+    return {
+        "version": CHECKPOINT_VERSION,
+        "length": game.player_1.board.length,
+        "width": game.player_1.board.width,
+        "game_option": retrieve_original_game_option(game.player_1),
+        "players": [
+            {
+                "name": player.name,
+                "placements": [[ship_slug, x, y, direction.name] for ship_slug, (x, y), direction in player.placements],
+                "bombed": retrieve_bombed_positions(player.board),
+            }
+            for player in game.players
+        ],
+    }
+
+
+def restore_checkpoint(checkpoint: Checkpoint, board_factory: BoardFactory = Board2D) -> Game:
+    """Rebuild a game from its checkpoint, placing the fleets and bombing the positions again."""
+    length, width, game_option = checkpoint["length"], checkpoint["width"], checkpoint["game_option"]
+    players = []
+    for player_checkpoint in checkpoint["players"]:
+        placements = [
+            (ship_slug, Position(x, y), ShipDirection[direction])
+            for ship_slug, x, y, direction in player_checkpoint["placements"]
+        ]
+        player = prepare_headless_player(
+            player_checkpoint["name"], game_option, placements, length=length, width=width, board_factory=board_factory
+        )
+        for x, y in player_checkpoint["bombed"]:
+            bomb_position_quietly(player.board, Position(x, y))
+        players.append(player)
+
+    player_1, player_2 = players
+    return Game(player_1, player_2)
+
+
+def dump_checkpoint(checkpoint: Checkpoint, stream: TextIO):
+    json.dump(checkpoint, stream, separators=(",", ":"))
+
+
+def load_checkpoint(stream: TextIO) -> Checkpoint:
+    return json.load(stream)
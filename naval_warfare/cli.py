@@ -0,0 +1,204 @@
+"""
+Entry point of `python -m naval_warfare`, with a subcommand per job:
+    - `play`: the interactive game, reading the placements from stdin (as `main.py`)
+    - `simulate`: a headless campaign of random games (see `tournament.run_campaign`)
+    - `bench`: the benchmarks of `naval_warfare.benchmark`, taking the same arguments
+    - `compare`: which of two attack strategies sinks fleets faster (see `naval_warfare.comparison`)
+    - `replay`: check and summarize the games of a replay file (see `naval_warfare.replay`)
+
+Processes are often short-lived, so startup matters: this module only imports the standard library pieces needed
+to parse the arguments, and each subcommand imports what it needs when it runs. `play` never loads NumPy, asyncio
+nor `logging.config`, and its imports stay under `PLAY_IMPORT_BUDGET_MS`. Logging is only configured when a level
+is asked for, with `--log-level` or the `LOG_LEVEL` environment variable.
+"""
+
+import argparse
+import os
+import sys
+from importlib import import_module
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+PLAY_IMPORT_BUDGET_MS = 150  # `python -X importtime` of this module and `naval_warfare.game`, over a bare interpreter
+
+LOG_FORMAT = "%(levelname)-8s [%(asctime)s] %(name)s: %(message)s"
+
+STRATEGY_NAMES = ("random", "density")  # the keys of `strategies.STRATEGIES`, without importing it
+
+BOARD_FACTORIES: Dict[str, Tuple[str, str]] = {
+    "list": ("naval_warfare.models", "Board2D"),
+    "numpy": ("naval_warfare.numpy_board", "NumpyBoard2D"),
+    "bit": ("naval_warfare.bitboard", "BitBoard"),
+    "sparse": ("naval_warfare.sparse_board", "SparseBoard"),
+}
+
+
+def configure_logging(level: Optional[str]):
+    """Configure the root logger only when a level is given, as `logging` is fine unconfigured otherwise."""
+    level = level or os.getenv("LOG_LEVEL")
+    if level:
+        import logging
+
+        logging.basicConfig(level=level.upper(), format=LOG_FORMAT)
+
+
+def load_board_factory(name: str):
+    module_name, attribute = BOARD_FACTORIES[name]
+    return getattr(import_module(module_name), attribute)
+
+
+def play(options: argparse.Namespace) -> int:
+    from naval_warfare.game import prepare_game
+    from naval_warfare.game import show_final_boards
+    from naval_warfare.game import start
+
+    stats = None
+    if options.stats:
+        from naval_warfare.stats import GameStats
+
+        stats = GameStats()
+
+    game = prepare_game(stats=stats)
+    start(game)
+    show_final_boards(game)
+    if stats is not None:
+        print(stats, file=sys.stderr)
+    return 0
+
+
+def simulate(options: argparse.Namespace) -> int:
+    from naval_warfare.strategies import STRATEGIES
+    from naval_warfare.tournament import run_campaign
+
+    result = run_campaign(
+        options.games,
+        options.seed,
+        workers=options.workers,
+        chunk_size=options.chunk_size,
+        length=options.length,
+        width=options.width,
+        strategy_factory=STRATEGIES[options.strategy],
+        results_directory=options.results,
+        lockstep=options.lockstep,
+    )
+
+    mean_turns = sum(turns * games for turns, games in result.turns_histogram.items()) / max(1, result.games)
+    print(f"Seed: {result.seed}")
+    print(f"Games: {result.games}")
+    print(f"Win rates: {result.win_rates[0]:.3f} / {result.win_rates[1]:.3f}")
+    print(f"Mean turns: {mean_turns:.2f}")
+    return 0
+
+
+def compare(options: argparse.Namespace) -> int:
+    from naval_warfare.comparison import compare_strategies
+    from naval_warfare.strategies import STRATEGIES
+
+    result = compare_strategies(
+        STRATEGIES[options.strategy_a],
+        STRATEGIES[options.strategy_b],
+        options.seed,
+        length=options.length,
+        width=options.width,
+        confidence=options.confidence,
+        min_games=options.min_games,
+        check_every=options.check_every,
+        max_games=options.max_games,
+    )
+    print(result)
+    return 0
+
+
+def bench(options: argparse.Namespace) -> int:
+    from naval_warfare.benchmark import main as run_benchmark
+
+    return run_benchmark(options.benchmark_arguments)
+
+
+def describe_replays(records, board_factory, show_boards: bool = False) -> Iterator[str]:
+    from naval_warfare.board import has_all_ships_destroyed
+    from naval_warfare.replay import iterate_shots
+    from naval_warfare.replay import replay_game
+
+    for games, record in enumerate(records, start=1):
+        game = replay_game(record, board_factory)
+        winner = game.player_1 if has_all_ships_destroyed(game.player_2.board) else game.player_2
+        yield f"Game {games}: {winner.name} won after {sum(1 for _ in iterate_shots(record))} shots"
+        if show_boards:
+            for player in game.players:
+                yield f"Final board from {player.name}\n{player.board}\n"
+
+
+def replay(options: argparse.Namespace) -> int:
+    from naval_warfare.exceptions import InvalidReplay
+    from naval_warfare.replay import open_replays
+
+    board_factory = load_board_factory(options.board)
+    try:
+        with open_replays(options.path) as records:
+            for description in describe_replays(records, board_factory, options.show_boards):
+                print(description)
+    except InvalidReplay as error:
+        print(f"Invalid replay: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m naval_warfare", description="Naval Warfare")
+    parser.add_argument("--log-level", help="configure logging with this level (default: $LOG_LEVEL, if set)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    play_parser = subparsers.add_parser("play", help="play a game reading the placements from stdin")
+    play_parser.add_argument("--stats", action="store_true", help="print how long each phase took on stderr")
+    play_parser.set_defaults(run=play)
+
+    simulate_parser = subparsers.add_parser("simulate", help="play headless games with random fleets")
+    simulate_parser.add_argument("--games", type=int, default=1000)
+    simulate_parser.add_argument("--seed", type=int)
+    simulate_parser.add_argument("--strategy", choices=STRATEGY_NAMES, default="random")
+    simulate_parser.add_argument("--length", type=int, default=10)
+    simulate_parser.add_argument("--width", type=int, default=10)
+    simulate_parser.add_argument("--workers", type=int, default=1)
+    simulate_parser.add_argument("--chunk-size", type=int, default=1000)
+    simulate_parser.add_argument("--lockstep", action="store_true", help="play each chunk as NumPy batches")
+    simulate_parser.add_argument("--results", metavar="DIRECTORY", help="keep the summary of every game there")
+    simulate_parser.set_defaults(run=simulate)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="attack the same fleets with two strategies until one sinks them faster"
+    )
+    compare_parser.add_argument("strategy_a", choices=STRATEGY_NAMES)
+    compare_parser.add_argument("strategy_b", choices=STRATEGY_NAMES)
+    compare_parser.add_argument("--seed", type=int)
+    compare_parser.add_argument("--length", type=int, default=10)
+    compare_parser.add_argument("--width", type=int, default=10)
+    compare_parser.add_argument("--confidence", type=float, default=0.95)
+    compare_parser.add_argument("--min-games", type=int, default=1000)
+    compare_parser.add_argument("--check-every", type=int, default=500)
+    compare_parser.add_argument("--max-games", type=int, default=1_000_000)
+    compare_parser.set_defaults(run=compare)
+
+    bench_parser = subparsers.add_parser("bench", help="run the benchmarks, with the arguments of `benchmark.main`")
+    bench_parser.set_defaults(run=bench)
+
+    replay_parser = subparsers.add_parser("replay", help="check and summarize the games of a replay file")
+    replay_parser.add_argument("path")
+    replay_parser.add_argument("--board", choices=list(BOARD_FACTORIES), default="list")
+    replay_parser.add_argument("--show-boards", action="store_true")
+    replay_parser.set_defaults(run=replay)
+
+    return parser
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> int:
+    parser = create_parser()
+    options, unknown_arguments = parser.parse_known_args(arguments)
+    if unknown_arguments and options.command != "bench":
+        parser.error(f"unrecognized arguments: {' '.join(unknown_arguments)}")
+    options.benchmark_arguments = unknown_arguments  # parsed by `benchmark.main` itself
+    configure_logging(options.log_level)
+    return options.run(options)
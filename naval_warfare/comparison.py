@@ -0,0 +1,159 @@
+"""
+Which of two attack strategies sinks fleets faster, with as few games as needed to tell.
+
+The metric is the number of shots a strategy needs to sink a whole random fleet on its own, not the turns to win a
+game: no fleet shoots back, so there is no opponent to race. A strategy that needs fewer shots also wins more games
+against the same opponent, and the attack alone is about half the work of a whole game.
+
+Both strategies attack the same fleet of every game with the same random stream (common random numbers): most of
+the variance comes from the fleets and the luck of the shots, and it cancels out in the paired difference of shots
+to sink the fleet. The running confidence interval of the mean difference is checked every `check_every` games,
+and the comparison stops as soon as it excludes zero, or when `max_games` are played.
+
+Checking the interval several times would make a difference look significant by chance more often than the chosen
+confidence allows, so each check uses a stricter one, as if the error was split among all the checks (Bonferroni).
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from random import Random
+from statistics import NormalDist
+from typing import Optional
+from typing import Tuple
+
+from naval_warfare.fleet import generate_random_fleet
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import BoardFactory
+from naval_warfare.game import GameOption
+from naval_warfare.game import Player
+from naval_warfare.models import Board2D
+from naval_warfare.simulation import derive_game_seed
+from naval_warfare.simulation import play_headless_attack
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.strategies import StrategyFactory
+
+logger = logging.getLogger(__name__)
+
+
+class RunningDifference:
+    """Mean and variance of the paired differences seen so far (Welford's algorithm)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._squares = 0.0  # sum of the squared distances to the mean
+
+    def add(self, difference: float):
+        self.count += 1
+        delta = difference - self.mean
+        self.mean += delta / self.count
+        self._squares += delta * (difference - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return self._squares / (self.count - 1) if self.count > 1 else math.inf
+
+    def confidence_interval(self, z: float) -> Tuple[float, float]:
+        half_width = z * math.sqrt(self.variance / self.count) if self.count > 1 else math.inf
+        return self.mean - half_width, self.mean + half_width
+
+
+@dataclass
+class ComparisonResult:
+    games: int
+    mean_difference: float  # shots to sink a fleet of strategy A minus those of B: negative when A is faster
+    confidence_interval: Tuple[float, float]
+    is_significant: bool  # the interval excludes zero, so one strategy is faster
+    elapsed_seconds: float
+    saved_seconds: float  # how long the games left until `max_games` would have taken, at the same pace
+
+    def __str__(self) -> str:
+        low, high = self.confidence_interval
+        verdict = "significant" if self.is_significant else "not significant"
+        return (
+            f"Games: {self.games}\n"
+            f"Mean difference (A - B): {self.mean_difference:.3f} shots, CI [{low:.3f}, {high:.3f}] ({verdict})\n"
+            f"Wall time: {self.elapsed_seconds:.2f} s, saved: {self.saved_seconds:.2f} s"
+        )
+
+
+def prepare_paired_defender(
+    game_option: GameOption, length: int, width: int, board_factory: BoardFactory, rng: Random
+) -> Player:
+    fleet = generate_random_fleet(game_option, length, width, rng)
+    return prepare_headless_player(
+        "Defender", game_option, fleet, length=length, width=width, board_factory=board_factory
+    )
+
+
+def play_paired_attacks(
+    defender: Player, strategy_a: StrategyFactory, strategy_b: StrategyFactory, attack_seed: int
+) -> Tuple[int, int]:
+    """Shots each strategy needs to sink the fleet of `defender`, both playing from the same state and random stream."""
+    initial_state = defender.snapshot()
+    shots_a = play_headless_attack(defender, Random(attack_seed), strategy_a)
+    defender.restore(initial_state)
+    shots_b = play_headless_attack(defender, Random(attack_seed), strategy_b)
+    return shots_a, shots_b
+
+
+def compare_strategies(
+    strategy_a: StrategyFactory,
+    strategy_b: StrategyFactory,
+    seed: Optional[int] = None,
+    *,
+    game_option: GameOption = DEFAULT_GAME_OPTION,
+    length: int = 10,
+    width: int = 10,
+    board_factory: BoardFactory = Board2D,
+    confidence: float = 0.95,
+    min_games: int = 1000,
+    check_every: int = 500,
+    max_games: int = 1_000_000,
+) -> ComparisonResult:
+    """
+    Play paired games until the difference between the strategies is significant or `max_games` are played. Game
+    `i` is seeded with `derive_game_seed(seed, i)`, so the same seed always plays the same games.
+    """
+    if seed is None:
+        seed = Random().getrandbits(64)
+    checks = max(1, math.ceil((max_games - min_games) / check_every) + 1)
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / checks / 2)
+    logger.info(
+        "Comparing %s and %s over up to %s games with seed %s",
+        strategy_a.__name__,
+        strategy_b.__name__,
+        max_games,
+        seed,
+    )
+
+    differences = RunningDifference()
+    interval = differences.confidence_interval(z)
+    started_at = time.perf_counter()
+    for game_index in range(max_games):
+        rng = Random(derive_game_seed(seed, game_index))
+        defender = prepare_paired_defender(game_option, length, width, board_factory, rng)
+        shots_a, shots_b = play_paired_attacks(defender, strategy_a, strategy_b, rng.getrandbits(64))
+        differences.add(shots_a - shots_b)
+
+        games = game_index + 1
+        if games >= min_games and (games - min_games) % check_every == 0:
+            interval = differences.confidence_interval(z)
+            logger.info("After %s games: %.3f shots, CI [%.3f, %.3f]", games, differences.mean, *interval)
+            if interval[0] > 0 or interval[1] < 0:
+                break
+    else:
+        interval = differences.confidence_interval(z)
+
+    elapsed_seconds = time.perf_counter() - started_at
+    saved_seconds = elapsed_seconds / max(1, differences.count) * (max_games - differences.count)
+    return ComparisonResult(
+        differences.count,
+        differences.mean,
+        interval,
+        interval[0] > 0 or interval[1] < 0,
+        elapsed_seconds,
+        saved_seconds,
+    )
@@ -0,0 +1,17 @@
+"""
+Structured events emitted during a battle, as a cheaper alternative to string logging for per-shot traces.
+
+An event hook is any callable receiving the events, e.g. `list.append` to keep them or a `ReplayWriter` to store
+them. Events are plain named tuples: nothing is formatted unless the hook decides to.
+"""
+
+from collections import namedtuple
+from typing import Callable
+from typing import Union
+
+BattleStarted = namedtuple("BattleStarted", ["player_1", "player_2"])
+ShotFired = namedtuple("ShotFired", ["turn", "attacker", "defender", "position", "outcome"])
+BattleEnded = namedtuple("BattleEnded", ["winner", "turns"])
+
+Event = Union[BattleStarted, ShotFired, BattleEnded]
+EventHook = Callable[[Event], None]
@@ -16,3 +16,15 @@ class InputWithError(Exception):
 
 class UnavailableShip(Exception):
     pass
+
+
+class NoPositionsLeft(Exception):
+    pass
+
+
+class InvalidReplay(Exception):
+    pass
+
+
+class NoSnapshotToRestore(Exception):
+    pass
@@ -0,0 +1,130 @@
+from random import Random
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from naval_warfare.exceptions import CannotOccupyPositions
+from naval_warfare.game import GameOption
+from naval_warfare.game import Placement
+from naval_warfare.models import Position
+from naval_warfare.models import ShipDirection
+from naval_warfare.placements import PlacementIndex
+
+ShipToPlace = Tuple[str, int]  # slug and length of a ship
+
+
+def generate_random_fleet(
+    game_option: GameOption, length: int = 10, width: int = 10, rng: Optional[Random] = None
+) -> List[Placement]:
+    """
+    Generate placements for every ship from `game_option`, ready to be used on a `length` x `width` board.
+
+    Each ship is drawn uniformly among all the slots still legal for it (kept by a `PlacementIndex`), so there's no
+    guess-and-retry no matter how crowded the board is, nor any scan of the board. Bigger ships are placed first.
+
+    Earlier ships can leave no slot for a later one on a crowded board: the fleet is then searched with backtracking
+    (see `search_random_fleet`), so `CannotOccupyPositions` is only raised when no fleet fits.
+    """
+    rng = rng or Random()
+    ships = [
+        (ship_slug, ship_option["length"])
+        for ship_slug, ship_option in sorted(game_option.items(), key=lambda item: item[1]["length"], reverse=True)
+        for _ in range(ship_option["quantity"])
+    ]
+    try:
+        return draw_random_fleet(ships, length, width, rng)
+    except CannotOccupyPositions:
+        return search_random_fleet(ships, length, width, rng)
+
+
+def draw_random_fleet(ships: Sequence[ShipToPlace], length: int, width: int, rng: Random) -> List[Placement]:
+    """Place `ships` in order, each on a slot drawn uniformly, raising `CannotOccupyPositions` on a dead end."""
+    placement_index = PlacementIndex(length, width, (ship_length for _, ship_length in ships))
+
+    placements = []
+    for ship_index, (ship_slug, ship_length) in enumerate(ships):
+        front_position, direction = placement_index.choose(ship_length, rng)
+        placements.append((ship_slug, front_position, direction))
+        if ship_index + 1 == len(ships):
+            break
+        if ships[ship_index + 1][1] != ship_length:  # Lengths come in order: no other ship of this one is left
+            placement_index.forget(ship_length)
+        placement_index.block_span(front_position, ship_length, direction)
+
+    return placements
+
+
+def search_random_fleet(ships: Sequence[ShipToPlace], length: int, width: int, rng: Random) -> List[Placement]:
+    """
+    Depth-first search of a fleet, trying the slots of each ship in a random order and going back to the previous
+    ship on a dead end. Ships of the same length take slots in increasing order, so the search doesn't try the same
+    positions with the ships swapped. Only meant for crowded boards, where listing the slots of a ship is cheap.
+    """
+    if sum(ship_length for _, ship_length in ships) > length * width:
+        raise CannotOccupyPositions
+    if not ships:
+        return []
+
+    occupied = [[False] * width for _ in range(length)]
+
+    def list_slots(ship_index: int) -> List[Tuple[int, int, ShipDirection]]:
+        ship_length = ships[ship_index][1]
+        directions = (ShipDirection.H, ShipDirection.V) if ship_length > 1 else (ShipDirection.H,)
+        slots = [
+            (x, y, direction)
+            for direction in directions
+            for x in range(length - (ship_length - 1 if direction == ShipDirection.V else 0))
+            for y in range(width - (ship_length - 1 if direction == ShipDirection.H else 0))
+            if not any(occupied[i][j] for i, j in span_cells(x, y, ship_length, direction))
+        ]
+        if ship_index and ships[ship_index - 1][1] == ship_length:
+            previous_slot = order_slot(placements[-1])
+            slots = [slot for slot in slots if order_slot(slot) > previous_slot]
+        rng.shuffle(slots)
+        return slots
+
+    placements: List[Tuple[int, int, ShipDirection]] = []
+    pending = [list_slots(0)]  # Slots left to try for every ship placed, and for the one being placed
+    while pending:
+        slots = pending[-1]
+        if len(placements) == len(pending):  # Back from a dead end: free the slot of this ship to try another one
+            x, y, direction = placements.pop()
+            for i, j in span_cells(x, y, ships[len(pending) - 1][1], direction):
+                occupied[i][j] = False
+        if not slots:
+            pending.pop()
+            continue
+
+        x, y, direction = slots.pop()
+        for i, j in span_cells(x, y, ships[len(placements)][1], direction):
+            occupied[i][j] = True
+        placements.append((x, y, direction))
+        if len(placements) == len(ships):
+            return [
+                (ship_slug, Position(x, y), direction) for (ship_slug, _), (x, y, direction) in zip(ships, placements)
+            ]
+        pending.append(list_slots(len(placements)))
+
+    raise CannotOccupyPositions
+
+
+def order_slot(slot: Tuple[int, int, ShipDirection]) -> Tuple[bool, int, int]:
+    x, y, direction = slot
+    return direction == ShipDirection.V, x, y
+
+
+def span_cells(x: int, y: int, ship_length: int, direction: ShipDirection) -> List[Tuple[int, int]]:
+    if direction == ShipDirection.H:
+        return [(x, j) for j in range(y, y + ship_length)]
+    return [(i, y) for i in range(x, x + ship_length)]
+
+
+def generate_random_fleets(
+    game_option: GameOption, length: int = 10, width: int = 10, rng: Optional[Random] = None
+) -> Tuple[List[Placement], List[Placement]]:
+    """Generate one fleet per player, e.g. to be used as the placements factory of `simulate_batch`."""
+    rng = rng or Random()
+    return generate_random_fleet(game_option, length, width, rng), generate_random_fleet(
+        game_option, length, width, rng
+    )
@@ -1,8 +1,10 @@
 import logging
-from contextlib import suppress
-from copy import deepcopy
+from collections import namedtuple
 from dataclasses import dataclass
+from random import Random
 from random import randint
+from time import perf_counter_ns
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -13,47 +15,101 @@ from naval_warfare.actions import BombOutcome
 from naval_warfare.actions import bomb_position
 from naval_warfare.actions import place_ship_on_board
 from naval_warfare.board import has_all_ships_destroyed
+from naval_warfare.events import BattleEnded
+from naval_warfare.events import BattleStarted
+from naval_warfare.events import EventHook
+from naval_warfare.events import ShotFired
 from naval_warfare.exceptions import CannotBombPosition
 from naval_warfare.exceptions import CannotOccupyPositions
 from naval_warfare.exceptions import InputWithError
 from naval_warfare.exceptions import UnavailableShip
-from naval_warfare.helpers import convert_boolean_to_yes_no
+from naval_warfare.models import Board
 from naval_warfare.models import Board2D
 from naval_warfare.models import Position
 from naval_warfare.models import Ship
 from naval_warfare.models import ShipDirection
+from naval_warfare.render import BufferedRenderer
+from naval_warfare.render import format_outcome
 from naval_warfare.ship import is_ship_destroyed
+from naval_warfare.stats import GameStats
+from naval_warfare.strategies import AttackStrategy
+from naval_warfare.strategies import RandomStrategy
+from naval_warfare.strategies import StrategyFactory
 
 logger = logging.getLogger(__name__)
 
 AvailableShip = TypedDict("AvailableShip", {"kind": str, "length": int, "quantity": int})
 GameOption = Dict[str, AvailableShip]
+Placement = Tuple[str, Position, ShipDirection]  # ship slug, front position and direction
+
+
+BoardFactory = Callable[[int, int], Board]  # e.g. `Board2D` itself, `numpy_board.NumpyBoard2D` or `bitboard.BitBoard`
+
+PlayerSnapshot = namedtuple("PlayerSnapshot", ["board", "quantities", "placements_count"])
+GameSnapshot = namedtuple("GameSnapshot", ["player_1", "player_2"])
+
+
+def copy_game_option(game_option: GameOption) -> GameOption:
+    """Copy each ship option, the only mutable part of a game option (cheaper than a `deepcopy`)."""
+    return {ship_slug: AvailableShip(**ship_option) for ship_slug, ship_option in game_option.items()}
 
 
 class Player:
-    def __init__(self, name: str, *, game_option: GameOption, length: int = 10, width: int = 10):
+    def __init__(
+        self,
+        name: str,
+        *,
+        game_option: GameOption,
+        length: int = 10,
+        width: int = 10,
+        board_factory: BoardFactory = Board2D,
+    ):
         self.name = name
-        self.board = Board2D(length, width)
-        self.game_option = deepcopy(game_option)
+        self.board = board_factory(length, width)
+        self.game_option = copy_game_option(game_option)
+        self.placements: List[Placement] = []  # ships placed so far, in order
 
     @property
     def remaining_ships(self) -> List[str]:
         return [ship.kind for ship in self.board.ships if not is_ship_destroyed(ship)]
 
+    @property
+    def remaining_ships_count(self) -> int:
+        return self.board.ships_afloat
+
+    def snapshot(self) -> PlayerSnapshot:
+        quantities = tuple(ship_option["quantity"] for ship_option in self.game_option.values())
+        return PlayerSnapshot(self.board.snapshot(), quantities, len(self.placements))
+
+    def restore(self, snapshot: PlayerSnapshot):
+        self.board.restore(snapshot.board)
+        for ship_option, quantity in zip(self.game_option.values(), snapshot.quantities):
+            ship_option["quantity"] = quantity
+        del self.placements[snapshot.placements_count :]
+
 
 @dataclass
 class Game:
     player_1: Player
     player_2: Player
+    stats: Optional[GameStats] = None  # instrumentation is off unless given
 
     @property
     def has_ended(self) -> bool:
-        return any(has_all_ships_destroyed(player.board) for player in self.players)
+        return has_all_ships_destroyed(self.player_1.board) or has_all_ships_destroyed(self.player_2.board)
 
     @property
     def players(self) -> List[Player]:
         return [self.player_1, self.player_2]
 
+    def snapshot(self) -> GameSnapshot:
+        """Remember the state of both players, e.g. to look ahead and come back (see `Board2D.snapshot`)."""
+        return GameSnapshot(self.player_1.snapshot(), self.player_2.snapshot())
+
+    def restore(self, snapshot: GameSnapshot):
+        self.player_1.restore(snapshot.player_1)
+        self.player_2.restore(snapshot.player_2)
+
 
 DEFAULT_GAME_OPTION: GameOption = {
     "AIR": AvailableShip(kind="aircraft-carrier", length=5, quantity=1),
@@ -68,7 +124,19 @@ def retrieve_available_ships(game_option: GameOption) -> List[str]:
     return [ship_slug for ship_slug, ship_option in game_option.items() if ship_option["quantity"] > 0]
 
 
-def parse_line_input(line: str, game_option: GameOption) -> Tuple[AvailableShip, Position, ShipDirection]:
+def retrieve_ship_slug(game_option: GameOption, chosen_ship: AvailableShip) -> str:
+    """Find the slug of `chosen_ship`, which may be an entry of `game_option` or of another copy of it."""
+    for ship_slug, ship_option in game_option.items():
+        if ship_option is chosen_ship:
+            return ship_slug
+    for ship_slug, ship_option in game_option.items():
+        if ship_option["kind"] == chosen_ship["kind"] and ship_option["length"] == chosen_ship["length"]:
+            return ship_slug
+    raise UnavailableShip
+
+
+def parse_placement_line(line: str, game_option: GameOption) -> Tuple[AvailableShip, Position, ShipDirection]:
+    """Same as `parse_line_input`, but without printing the expected format when the line is invalid."""
     try:
         ship_slug, x, y, direction_slug = line.split(maxsplit=3)
         return (
@@ -77,6 +145,13 @@ def parse_line_input(line: str, game_option: GameOption) -> Tuple[AvailableShip,
             ShipDirection[direction_slug],
         )
     except (ValueError, KeyError):
+        raise InputWithError
+
+
+def parse_line_input(line: str, game_option: GameOption) -> Tuple[AvailableShip, Position, ShipDirection]:
+    try:
+        return parse_placement_line(line, game_option)
+    except InputWithError:
         print(
             """
             Couldn't understand the given input, please input in the following format:
@@ -90,20 +165,29 @@ def parse_line_input(line: str, game_option: GameOption) -> Tuple[AvailableShip,
         raise InputWithError
 
 
-def place_ship(player: Player, chosen_ship: AvailableShip, position: Position, direction: ShipDirection):
+def place_available_ship(player: Player, chosen_ship: AvailableShip, position: Position, direction: ShipDirection):
+    """Same as `place_ship`, but without printing anything (used by the headless flows)."""
     if chosen_ship["quantity"] < 1:
-        print("Ship is unavailable!")
         raise UnavailableShip
+    ship_slug = retrieve_ship_slug(player.game_option, chosen_ship)
+
+    place_ship_on_board(Ship(chosen_ship["kind"], chosen_ship["length"]), player.board, position, direction)
+    chosen_ship["quantity"] -= 1
+    player.placements.append((ship_slug, position, direction))
+
 
+def place_ship(player: Player, chosen_ship: AvailableShip, position: Position, direction: ShipDirection):
     try:
-        place_ship_on_board(Ship(chosen_ship["kind"], chosen_ship["length"]), player.board, position, direction)
-        chosen_ship["quantity"] -= 1
+        place_available_ship(player, chosen_ship, position, direction)
+    except UnavailableShip:
+        print("Ship is unavailable!")
+        raise
     except CannotOccupyPositions:
         print("Couldn't place ship on given position!")
         raise
 
 
-def prepare_player_game(player: Player):
+def prepare_player_game(player: Player, stats: Optional[GameStats] = None):
     print(
         """
         To place a ship, input in the following format:
@@ -121,69 +205,125 @@ def prepare_player_game(player: Player):
     while available_ships:
         print(f"Available ships: {available_ships}")
 
-        with suppress(InputWithError, CannotOccupyPositions, UnavailableShip):
+        try:
             line = input()
             chosen_ship, position, direction = parse_line_input(line, player.game_option)
             place_ship(player, chosen_ship, position, direction)
-            logger.debug(
-                """Updated %s board:
-                %s
-                """,
-                player.name,
-                player.board,
-            )
+        except (InputWithError, CannotOccupyPositions, UnavailableShip):
+            if stats is not None:
+                stats.rejected_placements += 1
+        else:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    """Updated %s board:
+                    %s
+                    """,
+                    player.name,
+                    player.board,
+                )
             available_ships = retrieve_available_ships(player.game_option)
 
 
-def prepare_game(game_option: Optional[GameOption] = None) -> Game:
+def prepare_game(game_option: Optional[GameOption] = None, stats: Optional[GameStats] = None) -> Game:
+    started_at = perf_counter_ns() if stats is not None else 0
     player_1, player_2 = Player("Player 1", game_option=game_option or DEFAULT_GAME_OPTION), Player(
         "Player 2", game_option=game_option or DEFAULT_GAME_OPTION
     )
 
     print("Player 1, please place your Ships on the board!")
-    prepare_player_game(player_1)
+    prepare_player_game(player_1, stats)
 
     print("Player 2, please place your Ships on the board!")
-    prepare_player_game(player_2)
+    prepare_player_game(player_2, stats)
 
-    return Game(player_1, player_2)
+    if stats is not None:
+        stats.placement_ns += perf_counter_ns() - started_at
+    return Game(player_1, player_2, stats)
 
 
-def get_random_position(length: int, width: int) -> Position:
-    return Position(randint(0, length), randint(0, width))
+def create_attack_strategy(
+    strategy_factory: StrategyFactory, opponent: Player, rng: Optional[Random] = None
+) -> AttackStrategy:
+    """Create the strategy used to attack `opponent`: the size of its board and of its ships are public."""
+    ship_lengths = [ship.length for ship in opponent.board.ships]
+    return strategy_factory(opponent.board.length, opponent.board.width, ship_lengths, rng)
 
 
-def print_outcome(player: Player, outcome: BombOutcome, position: Position):
-    hit_something, destroyed_ship = (
-        convert_boolean_to_yes_no(outcome.has_hit_something),
-        convert_boolean_to_yes_no(outcome.has_destroyed_a_ship),
-    )
-    print(
-        f"""
-        {player.name} attacked position ({position.x}, {position.y})...
-        Outcome:
-            - hit something: {hit_something}
-            - destroyed ship: {destroyed_ship}
-        """
-    )
+def get_random_position(length: int, width: int, rng: Optional[Random] = None) -> Position:
+    draw = rng.randint if rng else randint
+    return Position(draw(0, length - 1), draw(0, width - 1))
 
 
-def start(game: Game):
-    print("Time to battle!")
+def print_outcome(player: Player, outcome: BombOutcome, position: Position):
+    print(format_outcome(player.name, outcome, position), end="")
+
+
+def start(
+    game: Game,
+    event_hook: Optional[EventHook] = None,
+    strategy_factory: StrategyFactory = RandomStrategy,
+    renderer: Optional[BufferedRenderer] = None,
+) -> Optional[GameStats]:
+    """
+    Play the battle until a fleet is destroyed, returning the filled `game.stats` (if the game has them).
+
+    The output is buffered on `renderer`, or on a renderer over stdout flushed once the battle ends. The time spent
+    writing it, flushes included, goes to `stats.output_ns`: a given `renderer` is flushed by its owner, outside it.
+    """
+    stats = game.stats
+    started_at = perf_counter_ns() if stats is not None else 0
+    owns_renderer = renderer is None
+    renderer = renderer or BufferedRenderer()
+    renderer.write("Time to battle!\n")
     attacking_player, attacked_player = game.player_1, game.player_2
+    strategies = {
+        id(player): create_attack_strategy(strategy_factory, opponent)
+        for player, opponent in ((game.player_1, game.player_2), (game.player_2, game.player_1))
+    }
+    turns = 0
+    if event_hook:
+        event_hook(BattleStarted(game.player_1, game.player_2))
 
     while not game.has_ended:
-        with suppress(CannotBombPosition):
-            position = get_random_position(attacked_player.board.length, attacked_player.board.width)
+        strategy = strategies[id(attacking_player)]
+        position = strategy.next_position()
+        try:
             bomb_outcome = bomb_position(attacked_player.board, position)
-            print_outcome(attacking_player, bomb_outcome, position)
-            attacking_player, attacked_player = attacked_player, attacking_player
-
-    print(f"Battle result: {attacked_player.name} won!")
-    print(f"Remaining ships: {attacked_player.remaining_ships}", end="\n\n")
-
-
-def show_final_boards(game: Game):
-    for player in game.players:
-        print(f"Final board from {player.name}")
-        print(str(player.board), end="\n\n")
+        except CannotBombPosition:
+            if stats is not None:
+                stats.rejected_positions += 1
+            continue
+        strategy.register_outcome(position, bomb_outcome)
+        turns += 1
+        if event_hook:
+            event_hook(ShotFired(turns, attacking_player, attacked_player, position, bomb_outcome))
+
+        if stats is None:
+            renderer.write_outcome(attacking_player.name, bomb_outcome, position)
+        else:
+            stats.register_outcome(bomb_outcome)
+            output_started_at = perf_counter_ns()
+            renderer.write_outcome(attacking_player.name, bomb_outcome, position)
+            stats.output_ns += perf_counter_ns() - output_started_at
+        attacking_player, attacked_player = attacked_player, attacking_player
+
+    if event_hook:
+        event_hook(BattleEnded(attacked_player, turns))
+    output_started_at = perf_counter_ns() if stats is not None else 0
+    renderer.write(f"Battle result: {attacked_player.name} won!\n")
+    renderer.write(f"Remaining ships: {attacked_player.remaining_ships}\n\n")
+    if owns_renderer:
+        renderer.flush()
+
+    if stats is not None:
+        finished_at = perf_counter_ns()
+        stats.output_ns += finished_at - output_started_at
+        stats.battle_ns += finished_at - started_at
+    return stats
+
+
+def show_final_boards(game: Game, renderer: Optional[BufferedRenderer] = None):
+    with renderer or BufferedRenderer() as renderer:
+        for player in game.players:
+            renderer.write(f"Final board from {player.name}\n")
+            renderer.write_board(player.board)
@@ -0,0 +1,379 @@
+"""
+Lockstep engine: many headless games played at once as stacked NumPy arrays, one shot of every unfinished game per
+step. Game `g` has two boards, `2 * g` (player 1's fleet) and `2 * g + 1` (player 2's fleet), and board `b` keeps:
+    - `ship_ids[b]`: which ship is on each position (`x * width + y`), 0 meaning no ship
+    - `bombed[b]`: which positions were bombed
+    - `hits[b]` and `ship_lengths[b]`: hits taken and length of each ship (index 0 is unused)
+
+Bombing follows `actions.bomb_position`: a shot hits when there's a ship on the position and destroys it when it
+has taken as many hits as its length. Games are played as in `simulation.play_headless_battle` (player 1 shoots
+first, turns alternate, the game ends once a fleet is destroyed), but with NumPy random generators: the same seed
+plays different games than the scalar engine, with the same distributions.
+"""
+
+from collections import namedtuple
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+
+from naval_warfare.exceptions import CannotBombPosition
+from naval_warfare.exceptions import CannotOccupyPositions
+from naval_warfare.game import GameOption
+from naval_warfare.game import Placement
+from naval_warfare.models import Position
+from naval_warfare.models import ShipDirection
+from naval_warfare.simulation import FleetPlacements
+from naval_warfare.strategies import ProbabilityDensityStrategy
+from naval_warfare.strategies import RandomStrategy
+from naval_warfare.strategies import StrategyFactory
+
+# Arrays of `(games,)`, `(games,)` and `(games, 2)`, as the fields of `simulation.GameResult`
+LockstepResults = namedtuple("LockstepResults", ["winners", "turns", "shots"])
+ShotRecord = namedtuple("ShotRecord", ["games", "attacker", "positions", "hits", "destroyed"])  # one per step
+
+_MAX_PLACEMENT_ROUNDS = 1000
+
+
+class LockstepBoards:
+    """Stacked boards of `games` games, whose fleets are given by `place_fleets` or `place_random_fleets`."""
+
+    def __init__(self, game_option: GameOption, games: int, length: int = 10, width: int = 10):
+        self.game_option = game_option
+        self.games = games
+        self.length = length
+        self.width = width
+        self.ship_slugs = [
+            ship_slug
+            for ship_slug, ship_option in sorted(game_option.items(), key=lambda item: item[1]["length"], reverse=True)
+            for _ in range(ship_option["quantity"])
+        ]  # ship id - 1 -> slug, biggest ships first as in `fleet.generate_random_fleet`
+
+        boards, ships = 2 * games, len(self.ship_slugs) + 1
+        self.ship_ids = np.zeros((boards, length * width), dtype=np.uint16)
+        self.bombed = np.zeros((boards, length * width), dtype=bool)
+        self.hits = np.zeros((boards, ships), dtype=np.int16)
+        self.ship_lengths = np.zeros((boards, ships), dtype=np.int16)
+        self.ship_lengths[:, 1:] = [game_option[ship_slug]["length"] for ship_slug in self.ship_slugs]
+        self.ship_fronts = np.zeros((boards, ships), dtype=np.int64)  # position of each ship front
+        self.ship_vertical = np.zeros((boards, ships), dtype=bool)
+        self.ships_afloat = np.zeros(boards, dtype=np.int16)
+
+    def place_fleets(self, fleets: Sequence[FleetPlacements]):
+        """Place the fleets of every game, given as for `simulation.simulate`."""
+        for game, game_fleets in enumerate(fleets):
+            for player, fleet in enumerate(game_fleets):
+                ship_ids: Dict[str, List[int]] = {ship_slug: [] for ship_slug in self.game_option}
+                for ship_id, ship_slug in enumerate(self.ship_slugs, start=1):
+                    ship_ids[ship_slug].append(ship_id)
+                for ship_slug, position, direction in fleet:
+                    if not ship_ids[ship_slug]:
+                        raise CannotOccupyPositions
+                    self._place_ship(2 * game + player, ship_ids[ship_slug].pop(0), position, direction)
+
+    def _place_ship(self, board: int, ship_id: int, position: Position, direction: ShipDirection):
+        ship_length = int(self.ship_lengths[board, ship_id])
+        x, y = position
+        last_x, last_y = (x, y + ship_length - 1) if direction == ShipDirection.H else (x + ship_length - 1, y)
+        if not (0 <= x and 0 <= y and last_x < self.length and last_y < self.width):
+            raise CannotOccupyPositions
+
+        step = 1 if direction == ShipDirection.H else self.width
+        cells = np.arange(ship_length) * step + x * self.width + y
+        if self.ship_ids[board, cells].any():
+            raise CannotOccupyPositions
+        self.ship_ids[board, cells] = ship_id
+        self.ship_fronts[board, ship_id] = x * self.width + y
+        self.ship_vertical[board, ship_id] = direction == ShipDirection.V
+        self.ships_afloat[board] += 1
+
+    def place_random_fleets(self, rng: np.random.Generator):
+        """
+        Place every ship of every board in a slot drawn uniformly among the legal ones, biggest ships first (as
+        `fleet.generate_random_fleet` does): all boards draw a slot at once and only the colliding ones draw again.
+        """
+        length, width = self.length, self.width
+        for ship_id in range(1, len(self.ship_slugs) + 1):
+            ship_length = int(self.ship_lengths[0, ship_id])
+            horizontal_slots = length * max(0, width - ship_length + 1)
+            vertical_slots = max(0, length - ship_length + 1) * width if ship_length > 1 else 0
+            if not horizontal_slots + vertical_slots:
+                raise CannotOccupyPositions
+
+            pending = np.arange(2 * self.games)
+            for _ in range(_MAX_PLACEMENT_ROUNDS):
+                slots = rng.integers(0, horizontal_slots + vertical_slots, size=len(pending))
+                vertical = slots >= horizontal_slots
+                fronts = np.where(
+                    vertical,
+                    slots - horizontal_slots,
+                    (slots // max(1, width - ship_length + 1)) * width + slots % max(1, width - ship_length + 1),
+                )
+                cells = fronts[:, None] + np.arange(ship_length) * np.where(vertical, width, 1)[:, None]
+                free = ~self.ship_ids[pending[:, None], cells].any(axis=1)
+
+                placed = pending[free]
+                self.ship_ids[placed[:, None], cells[free]] = ship_id
+                self.ship_fronts[placed, ship_id] = fronts[free]
+                self.ship_vertical[placed, ship_id] = vertical[free]
+                self.ships_afloat[placed] += 1
+                pending = pending[~free]
+                if not len(pending):
+                    break
+            else:
+                raise CannotOccupyPositions
+
+    def retrieve_placements(self, board: int) -> List[Placement]:
+        """The fleet of a board, as given to `simulation.simulate`."""
+        return [
+            (
+                ship_slug,
+                Position(*divmod(int(self.ship_fronts[board, ship_id]), self.width)),
+                ShipDirection.V if self.ship_vertical[board, ship_id] else ShipDirection.H,
+            )
+            for ship_id, ship_slug in enumerate(self.ship_slugs, start=1)
+            if self.ship_ids[board, self.ship_fronts[board, ship_id]] == ship_id
+        ]
+
+    def bomb(self, boards: np.ndarray, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bomb one position (`x * width + y`) on each of the given boards, which must be distinct, as
+        `actions.bomb_position` would, returning whether each shot hit something and whether it destroyed a ship.
+        """
+        board_size = self.length * self.width
+        if (positions < 0).any() or (positions >= board_size).any():
+            raise CannotBombPosition
+        cells = boards * board_size + positions  # Flat indexes are much faster than pairs of index arrays
+        bombed = self.bombed.reshape(-1)
+        if bombed[cells].any():
+            raise CannotBombPosition
+
+        bombed[cells] = True
+        ship_ids = self.ship_ids.reshape(-1)[cells]
+        hits = ship_ids != 0
+
+        hit_ships = boards[hits] * self.hits.shape[1] + ship_ids[hits]
+        ship_hits = self.hits.reshape(-1)
+        ship_hits[hit_ships] += 1
+        destroyed = np.zeros_like(hits)
+        destroyed[hits] = ship_hits[hit_ships] == self.ship_lengths.reshape(-1)[hit_ships]
+        self.ships_afloat[boards[destroyed]] -= 1
+        return hits, destroyed
+
+
+class LockstepRandomStrategy:
+    """Same as `RandomStrategy`: every attacker shoots a random permutation of the positions, in order."""
+
+    def __init__(self, boards: LockstepBoards, attacker: int, rng: np.random.Generator):
+        self.orders = rng.random((boards.games, boards.length * boards.width)).argsort(axis=1)
+        self.shots = np.zeros(boards.games, dtype=np.int64)
+
+    def next_positions(self, games: np.ndarray) -> np.ndarray:
+        return self.orders[games, self.shots[games]]
+
+    def register_outcomes(self, games: np.ndarray, positions: np.ndarray, hits: np.ndarray, destroyed: np.ndarray):
+        self.shots[games] += 1
+
+
+class LockstepDensityStrategy:
+    """
+    Same hunt/target idea as `ProbabilityDensityStrategy`, computed for all games at once:
+        - target: shoot the densest unbombed neighbour of a hit not accounted for by a destroyed ship yet
+        - hunt: shoot the position covered by most placements (not crossing bombed positions) of the lengths afloat
+
+    It knows as much as the scalar strategy: a shot only tells if it hit and if it destroyed a ship. The destroyed
+    length is guessed from the hits since the last destroyed ship, the same way, and each length still afloat counts
+    once in the density. Ties are broken at random.
+
+    Its arrays are `(length, width, games)`, with the games last: shifting a grid along `x` or `y` then works on
+    contiguous blocks of games, which is several times faster than on 10 positions at a time. Every step scores all
+    games, finished ones included, which is cheaper than gathering the unfinished ones.
+    """
+
+    def __init__(self, boards: LockstepBoards, attacker: int, rng: np.random.Generator):
+        self.boards = boards
+        self.attacker = attacker
+        games, length, width = boards.games, boards.length, boards.width
+        ship_lengths = boards.ship_lengths[0, 1:]
+        self.lengths = sorted(set(int(ship_length) for ship_length in ship_lengths))
+        self.remaining = np.array(
+            [[np.count_nonzero(ship_lengths == ship_length)] * games for ship_length in self.lengths], dtype=np.int16
+        )  # Ships afloat per length and game
+        self.free = np.ones((length, width, games), dtype=bool)
+        self.free_counts = np.ones((length, width, games), dtype=np.int16)  # `free` as 0/1, for the coverages
+        self.open_hits = np.zeros((length, width, games), dtype=bool)  # Hits not accounted for by a destroyed ship
+        self.hits_since_destroyed = np.zeros(games, dtype=np.int16)
+
+        # Scores are `density * board size + priority`, where each game ranks its positions from 1 in a random order:
+        # the best score gives the position back and breaks the ties at random, and 0 is left for non-candidates
+        board_size = length * width
+        self.positions = rng.random((board_size, games)).argsort(axis=0)  # priority - 1 -> position, per game
+        self.priorities = np.empty((board_size, games), dtype=np.int32)
+        np.put_along_axis(self.priorities, self.positions, np.arange(1, board_size + 1, dtype=np.int32)[:, None], 0)
+
+    def next_positions(self, games: np.ndarray) -> np.ndarray:
+        free, open_hits = self.free, self.open_hits
+        targets = np.zeros_like(open_hits)
+        targets[1:] |= open_hits[:-1]
+        targets[:-1] |= open_hits[1:]
+        targets[:, 1:] |= open_hits[:, :-1]
+        targets[:, :-1] |= open_hits[:, 1:]
+        targets &= free
+        flat_targets = targets.reshape(-1, self.boards.games)
+        candidates = flat_targets | (free.reshape(flat_targets.shape) & ~flat_targets.any(axis=0))
+
+        board_size = flat_targets.shape[0]
+        scores = self._compute_density().reshape(flat_targets.shape).astype(np.int32)
+        scores *= board_size
+        scores += self.priorities
+        scores *= candidates
+        best_priorities = (scores.max(axis=0) - 1) % board_size
+        return self.positions[best_priorities[games], games]
+
+    def _compute_density(self) -> np.ndarray:
+        afloat = (self.remaining > 0).astype(np.int16)  # Each length still afloat counts once
+        density = _compute_coverage(self.free_counts, self.lengths, afloat, axis=1)
+        if self.lengths[-1] > 1:  # A ship of length 1 is the same in both directions
+            vertical = [index for index, ship_length in enumerate(self.lengths) if ship_length > 1]
+            density += _compute_coverage(
+                self.free_counts, [self.lengths[index] for index in vertical], afloat[vertical], axis=0
+            )
+        return density
+
+    def register_outcomes(self, games: np.ndarray, positions: np.ndarray, hits: np.ndarray, destroyed: np.ndarray):
+        boards = self.boards
+        xs, ys = np.divmod(positions, boards.width)
+        self.free[xs, ys, games] = False
+        self.free_counts[xs, ys, games] = 0
+        self.open_hits[xs[hits], ys[hits], games[hits]] = True
+        self.hits_since_destroyed[games[hits]] += 1
+        if destroyed.any():
+            self._remove_destroyed_ships(games[destroyed])
+
+    def _remove_destroyed_ships(self, games: np.ndarray):
+        """As `ProbabilityDensityStrategy`: the longest length afloat that fits the hits, else the shortest one."""
+        afloat = self.remaining[:, games] > 0
+        hits = self.hits_since_destroyed[games]
+        lengths = np.array(self.lengths)[:, None]
+        fitting = afloat & (lengths <= hits)
+        longest_fitting = len(self.lengths) - 1 - fitting[::-1].argmax(axis=0)
+        length_indexes = np.where(fitting.any(axis=0), longest_fitting, afloat.argmax(axis=0))
+        has_ship_afloat = afloat.any(axis=0)
+        games, length_indexes, hits = games[has_ship_afloat], length_indexes[has_ship_afloat], hits[has_ship_afloat]
+
+        self.remaining[length_indexes, games] -= 1
+        hits_left = np.maximum(0, hits - lengths[length_indexes, 0])
+        self.hits_since_destroyed[games] = hits_left
+        self.open_hits[..., games[hits_left == 0]] = False  # Every hit is accounted for: back to hunting
+
+
+def _compute_coverage(
+    free_counts: np.ndarray, ship_lengths: Sequence[int], quantities: np.ndarray, axis: int
+) -> np.ndarray:
+    """
+    For each position, how many placements along `axis` of the given ships (`quantities[i]` of `ship_lengths[i]`
+    per game) cover it on free positions only.
+
+    Placements are kept by their first position, one array per length, grown from the placements one shorter. A
+    position `offset` after the first one is covered by all placements longer than `offset`, so summing those from the
+    longest down needs one shifted addition per offset, whatever the number of lengths.
+    """
+    size = free_counts.shape[axis]
+    coverage = np.zeros(free_counts.shape, dtype=free_counts.dtype)
+
+    def along_axis(start: int, stop: Optional[int] = None) -> tuple:
+        return (slice(None),) * axis + (slice(start, stop),)
+
+    weighted_placements = {}
+    placements = free_counts.copy()  # Legal placements of length 1, by their first position
+    for ship_length in range(1, min(max(ship_lengths), size) + 1):
+        if ship_length > 1:
+            placements[along_axis(0, size - ship_length + 1)] *= free_counts[along_axis(ship_length - 1)]
+            placements[along_axis(size - ship_length + 1, size - ship_length + 2)] = 0
+        if ship_length in ship_lengths:
+            weighted_placements[ship_length] = placements * quantities[ship_lengths.index(ship_length)]
+
+    longer_placements = np.zeros_like(coverage)
+    for offset in reversed(range(max(weighted_placements, default=0))):
+        if offset + 1 in weighted_placements:
+            longer_placements += weighted_placements[offset + 1]
+        coverage[along_axis(offset)] += longer_placements[along_axis(0, size - offset)]
+    return coverage
+
+
+LOCKSTEP_STRATEGIES: Dict[StrategyFactory, type] = {
+    RandomStrategy: LockstepRandomStrategy,
+    ProbabilityDensityStrategy: LockstepDensityStrategy,
+}
+
+
+def play_lockstep_battles(
+    boards: LockstepBoards,
+    rng: np.random.Generator,
+    strategy_factory: StrategyFactory = RandomStrategy,
+    shot_records: Optional[List[ShotRecord]] = None,
+) -> LockstepResults:
+    """
+    Play every game of `boards` until a fleet is destroyed, one shot of each unfinished game per step. Each step
+    is appended to `shot_records` when given.
+    """
+    lockstep_strategy = LOCKSTEP_STRATEGIES[strategy_factory]
+    strategies = (lockstep_strategy(boards, 0, rng), lockstep_strategy(boards, 1, rng))
+
+    winners = np.zeros(boards.games, dtype=np.uint8)
+    shots = np.zeros((boards.games, 2), dtype=np.int32)
+    afloat = boards.ships_afloat.reshape(-1, 2)
+    winners[afloat[:, 0] == 0] = 2
+    winners[afloat[:, 1] == 0] = 1  # As `play_headless_battle`, player 1 wins if both fleets are empty
+    active = winners == 0
+
+    attacker = 0
+    while active.any():
+        games = np.flatnonzero(active)
+        defender_boards = 2 * games + (attacker ^ 1)
+        positions = strategies[attacker].next_positions(games)
+        hits, destroyed = boards.bomb(defender_boards, positions)
+        strategies[attacker].register_outcomes(games, positions, hits, destroyed)
+        shots[games, attacker] += 1
+        if shot_records is not None:
+            shot_records.append(ShotRecord(games, attacker, positions, hits, destroyed))
+
+        finished_games = games[destroyed & (boards.ships_afloat[defender_boards] == 0)]
+        winners[finished_games] = attacker + 1
+        active[finished_games] = False
+        attacker ^= 1
+
+    return LockstepResults(winners, shots.sum(axis=1), shots)
+
+
+def simulate_lockstep(
+    game_option: GameOption,
+    games: int,
+    seed: Optional[int] = None,
+    *,
+    length: int = 10,
+    width: int = 10,
+    strategy_factory: StrategyFactory = RandomStrategy,
+    fleets: Optional[Sequence[FleetPlacements]] = None,
+    batch_size: int = 2048,
+) -> LockstepResults:
+    """
+    Play `games` headless games, `batch_size` games at once (bigger batches stop fitting in the CPU caches), with
+    random fleets unless `fleets` gives the fleets of every game.
+    """
+    rng = np.random.default_rng(seed)
+    batches = []
+    for first_game in range(0, games, batch_size):
+        boards = LockstepBoards(game_option, min(batch_size, games - first_game), length, width)
+        if fleets is None:
+            boards.place_random_fleets(rng)
+        else:
+            boards.place_fleets(fleets[first_game : first_game + batch_size])
+        batches.append(play_lockstep_battles(boards, rng, strategy_factory))
+
+    if not batches:
+        return LockstepResults(np.zeros(0, dtype=np.uint8), np.zeros(0, dtype=np.int32), np.zeros((0, 2), np.int32))
+    return LockstepResults(*(np.concatenate(column) for column in zip(*batches)))
@@ -0,0 +1,220 @@
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from naval_warfare.exceptions import CannotOccupyPositions
+from naval_warfare.exceptions import NoSnapshotToRestore
+from naval_warfare.models import BoardPosition
+from naval_warfare.models import BoardSnapshot
+from naval_warfare.models import Position
+from naval_warfare.models import PositionStatus
+from naval_warfare.models import Ship
+from naval_warfare.models import ShipDirection
+
+if TYPE_CHECKING:
+    from naval_warfare.placements import PlacementIndex
+
+STATUSES = (PositionStatus.FREE, PositionStatus.OCCUPIED, PositionStatus.BOMBED)  # index is the status code
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+_STATUS_CHARS = np.array([ord(status.value) for status in STATUSES], dtype=np.uint8)
+_STATUS_TABLE = bytes.maketrans(bytes(range(len(STATUSES))), bytes(_STATUS_CHARS))  # for `bytes.translate`
+_NO_SHIP = 0
+_SHIP_ID_TYPE = np.uint16
+
+MAX_SHIPS = int(np.iinfo(_SHIP_ID_TYPE).max)  # ship ids are kept on `uint16`, 0 meaning no ship
+
+_GridIndex = Tuple[Union[int, slice], ...]
+
+
+@dataclass(eq=False)
+class NumpyBoard2D:
+    """
+    Same as `Board2D`, but the chart is kept as two compact grids instead of `length * width` `BoardPosition`:
+        - `status`: the `STATUS_CODES` of each position (`uint8`)
+        - `ship_ids`: which ship is on each position (`uint16`, where 0 means no ship, so up to `MAX_SHIPS` ships)
+    """
+
+    length: int  # horizontal - x
+    width: int  # vertical - y
+    status: np.ndarray = field(init=False, repr=False)
+    ship_ids: np.ndarray = field(init=False, repr=False)
+    chart: "NumpyChart2D" = field(init=False, repr=False)
+    ships: List[Ship] = field(default_factory=list, init=False)
+    ships_afloat: int = field(default=0, init=False)
+    _known_ships: List[Ship] = field(default_factory=list, init=False, repr=False)
+    _known_ship_ids: Dict[int, int] = field(default_factory=dict, init=False, repr=False)
+    _journal: Optional[List[Tuple[_GridIndex, np.ndarray, np.ndarray]]] = field(default=None, init=False, repr=False)
+    placement_index: Optional["PlacementIndex"] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self.status = np.zeros((self.length, self.width), dtype=np.uint8)
+        self.ship_ids = np.zeros((self.length, self.width), dtype=_SHIP_ID_TYPE)
+        self.chart = NumpyChart2D(self)
+
+    def __str__(self) -> str:
+        if not self.length or not self.width:
+            return ""
+
+        rendered = np.full((self.length, 2 * self.width), ord(" "), dtype=np.uint8)
+        rendered[:, 0::2] = _STATUS_CHARS[self.status]
+        rendered[:, -1] = ord("\n")
+        return rendered.tobytes()[:-1].decode("ascii")
+
+    def rows(self) -> Iterator[str]:
+        line = bytearray(b" " * (2 * self.width - 1))
+        for status_row in self.status:
+            line[0::2] = status_row.tobytes().translate(_STATUS_TABLE)
+            yield line.decode("ascii")
+
+    def status_at(self, position: Position) -> PositionStatus:
+        return STATUSES[self.status[position.x, position.y]]
+
+    def ship_at(self, position: Position) -> Optional[Ship]:
+        ship_id = self.ship_ids[position.x, position.y]
+        return self._known_ships[ship_id - 1] if ship_id != _NO_SHIP else None
+
+    def occupy_position(self, position: Position, ship: Ship):
+        ship_id = self.ship_id_of(ship)
+        self._journal_change((position.x, position.y))
+        self.status[position.x, position.y] = STATUS_CODES[PositionStatus.OCCUPIED]
+        self.ship_ids[position.x, position.y] = ship_id
+
+    def mark_bombed(self, position: Position) -> bool:
+        index = position.x, position.y
+        self._journal_change(index)
+        has_hit_something = self.status[index] == STATUS_CODES[PositionStatus.OCCUPIED]
+        self.status[index] = STATUS_CODES[PositionStatus.BOMBED]
+        return bool(has_hit_something)
+
+    def is_span_free(self, front_position: Position, length: int, direction: ShipDirection) -> bool:
+        return not self.status[_span_index(front_position, length, direction)].any()
+
+    def occupy_span(self, front_position: Position, length: int, direction: ShipDirection, ship: Ship):
+        ship_id = self.ship_id_of(ship)
+        span = _span_index(front_position, length, direction)
+        self._journal_change(span)
+        self.status[span] = STATUS_CODES[PositionStatus.OCCUPIED]
+        self.ship_ids[span] = ship_id
+
+    def ship_id_of(self, ship: Ship) -> int:
+        """Return the id used for `ship` on the `ship_ids` grid, assigning a new one if needed."""
+        ship_id = self._known_ship_ids.get(id(ship))
+        if ship_id is None:
+            if len(self._known_ships) == MAX_SHIPS:
+                raise CannotOccupyPositions(f"A NumpyBoard2D holds up to {MAX_SHIPS} ships")
+            self._known_ships.append(ship)
+            ship_id = self._known_ship_ids[id(ship)] = len(self._known_ships)
+        return ship_id
+
+    def _journal_change(self, index: _GridIndex):
+        if self._journal is not None:
+            self._journal.append((index, self.status[index].copy(), self.ship_ids[index].copy()))
+
+    def snapshot(self) -> BoardSnapshot:
+        """Same as `Board2D.snapshot`: the grids aren't copied, the previous values of changed positions are kept."""
+        if self._journal is None:
+            self._journal = []
+        return BoardSnapshot(
+            len(self._journal), len(self.ships), self.ships_afloat, tuple(ship.hits_taken for ship in self.ships)
+        )
+
+    def restore(self, snapshot: BoardSnapshot):
+        journal = self._journal
+        if journal is None:
+            raise NoSnapshotToRestore("No active snapshot: take one first (`discard_snapshots` drops them all)")
+        while len(journal) > snapshot.journal_length:
+            index, status, ship_ids = journal.pop()
+            self.status[index] = status
+            self.ship_ids[index] = ship_ids
+
+        del self.ships[snapshot.ships_count :]
+        for ship, hits_taken in zip(self.ships, snapshot.hits_taken):
+            ship.hits_taken = hits_taken
+        self.ships_afloat = snapshot.ships_afloat
+        self.placement_index = None  # Not rolled back, so it would be stale
+
+    def discard_snapshots(self):
+        self._journal = None
+
+
+def _span_index(front_position: Position, length: int, direction: ShipDirection) -> _GridIndex:
+    x, y = front_position
+    return (x, slice(y, y + length)) if direction == ShipDirection.H else (slice(x, x + length), y)
+
+
+class NumpyBoardPosition:
+    """A view over one position of a `NumpyBoard2D`, so it can be used like a `BoardPosition`."""
+
+    __slots__ = ("_board", "_x", "_y")
+
+    def __init__(self, board: NumpyBoard2D, x: int, y: int):
+        self._board, self._x, self._y = board, x, y
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (BoardPosition, NumpyBoardPosition)):
+            return self.status == other.status and self.ship == other.ship
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"NumpyBoardPosition(status={self.status}, ship={self.ship})"
+
+    @property
+    def status(self) -> PositionStatus:
+        return STATUSES[self._board.status[self._x, self._y]]
+
+    @status.setter
+    def status(self, status: PositionStatus):
+        self._board.status[self._x, self._y] = STATUS_CODES[status]
+
+    @property
+    def ship(self) -> Optional[Ship]:
+        return self._board.ship_at(Position(self._x, self._y))
+
+    @ship.setter
+    def ship(self, ship: Optional[Ship]):
+        self._board.ship_ids[self._x, self._y] = self._board.ship_id_of(ship) if ship is not None else _NO_SHIP
+
+
+class NumpyChartRow:
+    __slots__ = ("_board", "_x")
+
+    def __init__(self, board: NumpyBoard2D, x: int):
+        self._board, self._x = board, x
+
+    def __len__(self) -> int:
+        return self._board.width
+
+    def __getitem__(self, y: int) -> NumpyBoardPosition:
+        if not -self._board.width <= y < self._board.width:
+            raise IndexError("chart index out of range")
+        return NumpyBoardPosition(self._board, self._x, y)
+
+    def __setitem__(self, y: int, board_position: BoardPosition):
+        position = self[y]
+        position.status, position.ship = board_position.status, board_position.ship
+
+
+class NumpyChart2D:
+    """Gives the `chart[x][y]` access of `Board2D` over the grids of a `NumpyBoard2D`."""
+
+    __slots__ = ("_board",)
+
+    def __init__(self, board: NumpyBoard2D):
+        self._board = board
+
+    def __len__(self) -> int:
+        return self._board.length
+
+    def __getitem__(self, x: int) -> NumpyChartRow:
+        if not -self._board.length <= x < self._board.length:
+            raise IndexError("chart index out of range")
+        return NumpyChartRow(self._board, x)
@@ -0,0 +1,191 @@
+from random import Random
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from naval_warfare.exceptions import CannotOccupyPositions
+from naval_warfare.models import Board
+from naval_warfare.models import Position
+from naval_warfare.models import PositionStatus
+from naval_warfare.models import ShipDirection
+
+Slot = Tuple[Position, ShipDirection]  # front position and direction of a ship
+
+
+class ShipLengthSlots:
+    """
+    Legal slots for a ship length. Slot `x * width + y` is the horizontal slot with front (x, y) and
+    `length * width + x * width + y` the vertical one.
+
+    While at least half of the slots are legal, only the blocked ones are kept and a legal slot is drawn by rejection
+    (two draws on average), so nothing is built upfront. Past that, the legal slots are listed once, and then kept in
+    a list (to draw from) plus where each slot is in it (to remove it in O(1)).
+    """
+
+    def __init__(self, length: int, width: int, ship_length: int):
+        self.length = length
+        self.width = width
+        self.ship_length = ship_length
+        self.horizontal_total = length * max(0, width - ship_length + 1)
+        # A ship of length 1 is the same in both directions
+        self.vertical_total = max(0, length - ship_length + 1) * width if ship_length > 1 else 0
+        self.total = self.horizontal_total + self.vertical_total
+        self._blocked: Set[int] = set()
+        self._legal: Optional[List[int]] = None
+        self._where: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._legal) if self._legal is not None else self.total - len(self._blocked)
+
+    def _candidate(self, candidate_index: int) -> int:
+        """The `candidate_index`-th slot of the empty board: horizontal ones first, then vertical ones."""
+        if candidate_index < self.horizontal_total:
+            x, y = divmod(candidate_index, self.width - self.ship_length + 1)
+            return x * self.width + y
+        return self.length * self.width + candidate_index - self.horizontal_total
+
+    def __iter__(self) -> Iterator[int]:
+        if self._legal is not None:
+            return iter(list(self._legal))
+        blocked = self._blocked
+        return (slot for slot in map(self._candidate, range(self.total)) if slot not in blocked)
+
+    def __contains__(self, slot: int) -> bool:
+        if self._legal is not None:
+            return slot in self._where
+        return slot not in self._blocked
+
+    def draw(self, rng: Random) -> int:
+        if self._legal is None and 2 * len(self) < self.total:
+            self._list_legal_slots()
+        if self._legal is not None:
+            return self._legal[rng.randrange(len(self._legal))]
+
+        while True:
+            slot = self._candidate(rng.randrange(self.total))
+            if slot not in self._blocked:
+                return slot
+
+    def _list_legal_slots(self):
+        self._legal = list(self)
+        self._where = {slot: index for index, slot in enumerate(self._legal)}
+        self._blocked = set()
+
+    def remove(self, slots: range):
+        if self._legal is None:
+            self._blocked.update(slots)
+            return
+
+        legal, where = self._legal, self._where
+        for slot in slots:
+            index = where.pop(slot, None)
+            if index is None:
+                continue
+            last_slot = legal.pop()
+            if last_slot != slot:  # Move the last slot to the place of the removed one
+                legal[index] = last_slot
+                where[last_slot] = index
+
+
+class PlacementIndex:
+    """
+    Legal slots of a `length` x `width` board per ship length, i.e. where a ship of that length fits on free positions.
+
+    Blocking a position removes only the slots crossing it (O(ship length) per ship length), and counting, listing
+    or drawing slots doesn't scan the board (see `ShipLengthSlots`). Attached to a board (see
+    `attach_placement_index`), it's kept up to date by `board.py` when positions are occupied or bombed; a `restore`
+    on the board isn't tracked, so it detaches the index: attach a new one after it.
+    """
+
+    def __init__(self, length: int, width: int, ship_lengths: Iterable[int]):
+        self.length = length
+        self.width = width
+        self._slots = {ship_length: ShipLengthSlots(length, width, ship_length) for ship_length in set(ship_lengths)}
+
+    @classmethod
+    def from_board(cls, board: Board, ship_lengths: Iterable[int]) -> "PlacementIndex":
+        """Index the slots still legal on a board (O(board size), once)."""
+        index = cls(board.length, board.width, ship_lengths)
+        for x in range(board.length):
+            for y in range(board.width):
+                if board.status_at(Position(x, y)) != PositionStatus.FREE:
+                    index.block_position(Position(x, y))
+        return index
+
+    @property
+    def ship_lengths(self) -> Tuple[int, ...]:
+        return tuple(self._slots)
+
+    def count(self, ship_length: int) -> int:
+        return len(self._slots[ship_length])
+
+    def slot_of(self, slot: int) -> Slot:
+        direction, front_index = divmod(slot, self.length * self.width)
+        return Position(*divmod(front_index, self.width)), ShipDirection.V if direction else ShipDirection.H
+
+    def slots(self, ship_length: int) -> Iterator[Slot]:
+        """Legal slots for a ship of `ship_length`, in no particular order (O(answer))."""
+        return map(self.slot_of, self._slots[ship_length])
+
+    def is_legal(self, ship_length: int, front_position: Position, direction: ShipDirection) -> bool:
+        x, y = front_position
+        if direction == ShipDirection.H or ship_length == 1:
+            if not (0 <= x < self.length and 0 <= y <= self.width - ship_length):
+                return False
+            return x * self.width + y in self._slots[ship_length]
+        if not (0 <= x <= self.length - ship_length and 0 <= y < self.width):
+            return False
+        return (self.length + x) * self.width + y in self._slots[ship_length]
+
+    def choose(self, ship_length: int, rng: Random) -> Slot:
+        """Draw a legal slot for a ship of `ship_length` uniformly, raising `CannotOccupyPositions` if none is left."""
+        slots = self._slots[ship_length]
+        if not len(slots):
+            raise CannotOccupyPositions
+        return self.slot_of(slots.draw(rng))
+
+    def forget(self, ship_length: int):
+        """Stop indexing the slots of `ship_length`, e.g. once every ship of that length is placed."""
+        del self._slots[ship_length]
+
+    def block_position(self, position: Position):
+        """Remove, for every ship length, the slots crossing a position that can't hold a ship anymore."""
+        x, y = position
+        length, width = self.length, self.width
+        for ship_length, slots in self._slots.items():
+            first_y, last_y = max(0, y - ship_length + 1), min(y, width - ship_length)
+            slots.remove(range(x * width + first_y, x * width + last_y + 1))
+            if ship_length > 1:
+                first_x, last_x = max(0, x - ship_length + 1), min(x, length - ship_length)
+                slots.remove(range((length + first_x) * width + y, (length + last_x) * width + y + 1, width))
+
+    def block_span(self, front_position: Position, ship_length: int, direction: ShipDirection):
+        """Same as blocking every position of the span, but removing the slots along the span as whole ranges."""
+        x, y = front_position
+        length, width = self.length, self.width
+        last_x, last_y = (x, y + ship_length - 1) if direction == ShipDirection.H else (x + ship_length - 1, y)
+
+        for slot_length, slots in self._slots.items():
+            first_front_y, last_front_y = max(0, y - slot_length + 1), min(last_y, width - slot_length)
+            for row in range(x, last_x + 1):
+                slots.remove(range(row * width + first_front_y, row * width + last_front_y + 1))
+            if slot_length > 1:
+                first_front_x, last_front_x = max(0, x - slot_length + 1), min(last_x, length - slot_length)
+                for column in range(y, last_y + 1):
+                    slots.remove(
+                        range(
+                            (length + first_front_x) * width + column,
+                            (length + last_front_x) * width + column + 1,
+                            width,
+                        )
+                    )
+
+
+def attach_placement_index(board: Board, ship_lengths: Iterable[int]) -> PlacementIndex:
+    """Index the legal slots of a board and keep the index up to date as the board changes."""
+    board.placement_index = PlacementIndex.from_board(board, ship_lengths)
+    return board.placement_index
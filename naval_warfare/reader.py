@@ -0,0 +1,119 @@
+"""
+Streaming reader for files holding many games in the `games/` format: one `SLG X Y H|V` line per ship, the first
+player's ships then the second player's. Lines starting with `-` (between players) and `=` (between games) are
+separators and blank lines are skipped. An invalid game is reported and skipped, and reading goes on from the next
+games separator.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+
+from naval_warfare.exceptions import CannotOccupyPositions
+from naval_warfare.exceptions import InputWithError
+from naval_warfare.exceptions import UnavailableShip
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import BoardFactory
+from naval_warfare.game import Game
+from naval_warfare.game import GameOption
+from naval_warfare.game import Placement
+from naval_warfare.game import Player
+from naval_warfare.game import parse_placement_line
+from naval_warfare.game import place_available_ship
+from naval_warfare.game import retrieve_available_ships
+from naval_warfare.models import Board2D
+
+logger = logging.getLogger(__name__)
+
+PLAYERS_SEPARATOR = "-"
+GAMES_SEPARATOR = "="
+
+InvalidGameHook = Callable[[InputWithError], None]
+
+
+def format_placement_line(placement: Placement) -> str:
+    """Inverse of `parse_placement_line`."""
+    ship_slug, position, direction = placement
+    return f"{ship_slug} {position.x} {position.y} {direction.name}"
+
+
+def read_games(
+    lines: Iterable[str],
+    game_option: Optional[GameOption] = None,
+    *,
+    length: int = 10,
+    width: int = 10,
+    board_factory: BoardFactory = Board2D,
+    on_invalid_game: Optional[InvalidGameHook] = None,
+) -> Iterator[Game]:
+    """
+    Lazily build a `Game` for every game found in `lines`, keeping only the game being read in memory.
+
+    As on the interactive flow, lines that can't be parsed or placed are skipped and a player is ready once all
+    their ships are placed. The second fleet only starts at a players separator, which must come once the first fleet
+    is complete, so a missing or extra line never moves ships to the other player. A game that breaks this, or is
+    still incomplete at a games separator or at the end of the input, is invalid: it's given to `on_invalid_game`
+    (logged by default) and skipped up to the next games separator.
+    """
+    game_option = game_option or DEFAULT_GAME_OPTION
+    on_invalid_game = on_invalid_game or log_invalid_game
+
+    def new_player(name: str) -> Player:
+        return Player(name, game_option=game_option, length=length, width=width, board_factory=board_factory)
+
+    players = [new_player("Player 1")]
+    is_skipping_game = False
+    line_number = 0
+
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if line.startswith(GAMES_SEPARATOR):
+            if not is_skipping_game and (len(players) > 1 or players[0].board.ships):
+                on_invalid_game(InputWithError(f"Incomplete game before line {line_number}"))
+            players = [new_player("Player 1")]
+            is_skipping_game = False
+            continue
+        if not line or is_skipping_game:
+            continue
+        if line.startswith(PLAYERS_SEPARATOR):
+            if len(players) > 1 or retrieve_available_ships(players[0].game_option):
+                on_invalid_game(InputWithError(f"Unexpected players separator at line {line_number}"))
+                is_skipping_game = True
+            else:
+                players.append(new_player("Player 2"))
+            continue
+
+        player = players[-1]
+        if not retrieve_available_ships(player.game_option):
+            on_invalid_game(InputWithError(f"Fleet of Player 1 too big or missing separator at line {line_number}"))
+            is_skipping_game = True
+            continue
+        try:
+            chosen_ship, position, direction = parse_placement_line(line, player.game_option)
+            place_available_ship(player, chosen_ship, position, direction)
+        except (InputWithError, CannotOccupyPositions, UnavailableShip):
+            logger.debug("Skipping line %s: %r", line_number, line)
+            continue
+
+        if retrieve_available_ships(player.game_option) or len(players) == 1:
+            continue
+
+        yield Game(players[0], players[1])
+        players = [new_player("Player 1")]
+
+    if not is_skipping_game and (len(players) > 1 or players[0].board.ships):
+        on_invalid_game(InputWithError(f"Incomplete game at the end of the input (line {line_number})"))
+
+
+def log_invalid_game(error: InputWithError):
+    logger.warning("Skipping game: %s", error)
+
+
+@contextmanager
+def open_games(path: str, game_option: Optional[GameOption] = None, **kwargs) -> Iterator[Iterator[Game]]:
+    """Open a games file and stream its games with `read_games`, closing the file on exit."""
+    with open(path) as games_file:
+        yield read_games(games_file, game_option, **kwargs)
@@ -0,0 +1,68 @@
+"""
+Buffered output of the game. Everything `start` and `show_final_boards` print goes through a `BufferedRenderer`,
+which joins the text in memory and writes it in big blocks instead of once per shot, and writes boards row by row.
+"""
+
+import sys
+from typing import List
+from typing import Optional
+from typing import TextIO
+
+from naval_warfare.actions import BombOutcome
+from naval_warfare.helpers import convert_boolean_to_yes_no
+from naval_warfare.models import Board
+from naval_warfare.models import Position
+
+_OUTCOME_LINES = {
+    outcome: (
+        "\n        Outcome:"
+        f"\n            - hit something: {convert_boolean_to_yes_no(outcome.has_hit_something)}"
+        f"\n            - destroyed ship: {convert_boolean_to_yes_no(outcome.has_destroyed_a_ship)}"
+        "\n        \n"
+    )
+    for outcome in (BombOutcome(False, False), BombOutcome(True, False), BombOutcome(True, True))
+}
+
+
+def format_outcome(player_name: str, outcome: BombOutcome, position: Position) -> str:
+    """Text printed for every shot, with its trailing new line."""
+    return f"\n        {player_name} attacked position ({position.x}, {position.y})...{_OUTCOME_LINES[outcome]}"
+
+
+class BufferedRenderer:
+    """Collect the output and write it to `stream` (`sys.stdout` by default) every `buffer_size` characters."""
+
+    def __init__(self, stream: Optional[TextIO] = None, buffer_size: int = 1 << 16):
+        self.stream = stream if stream is not None else sys.stdout
+        self.buffer_size = buffer_size
+        self._chunks: List[str] = []
+        self._buffered = 0
+
+    def __enter__(self) -> "BufferedRenderer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+    def write(self, text: str):
+        self._chunks.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def write_outcome(self, player_name: str, outcome: BombOutcome, position: Position):
+        self.write(format_outcome(player_name, outcome, position))
+
+    def write_board(self, board: Board):
+        """Write the board followed by a blank line, one row at a time."""
+        for row in board.rows():
+            self.write(row)
+            self.write("\n")
+        self.write("\n")
+
+    def flush(self):
+        if self._chunks:
+            self.stream.write("".join(self._chunks))
+            self._chunks.clear()
+            self._buffered = 0
+        self.stream.flush()
@@ -0,0 +1,241 @@
+"""
+Compact binary replay logs. A replay file is the `MAGIC` followed by one record per game:
+
+    record size                               u32   (bytes of the record after this field)
+    board length, board width                 u16 u16
+    ship options                              u8, then per option:
+        slug, kind                            u8 size + UTF-8 each
+        length, quantity                      u16 u16
+    fleet of player 1, then of player 2       u16, then per ship:
+        option index, x, y, direction         u8 u16 u16 u8 (0 = H, 1 = V)
+    shots                                     u32, then per shot:
+        x, y, flags                           u16 u16 u8 (`HIT_FLAG`, `DESTROYED_FLAG`, `PLAYER_2_FLAG`)
+
+Integers are little-endian. A shot takes 5 bytes, against ~150 bytes on the `print_outcome` text. Sides and
+coordinates are u16, so boards up to `MAX_BOARD_SIDE` positions per side can be recorded.
+"""
+
+import mmap
+import os
+import struct
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import BinaryIO
+from typing import Generator
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from naval_warfare.actions import BombOutcome
+from naval_warfare.actions import bomb_position_quietly
+from naval_warfare.checkpoint import retrieve_original_game_option
+from naval_warfare.events import BattleEnded
+from naval_warfare.events import BattleStarted
+from naval_warfare.events import Event
+from naval_warfare.events import ShotFired
+from naval_warfare.exceptions import InvalidReplay
+from naval_warfare.game import AvailableShip
+from naval_warfare.game import BoardFactory
+from naval_warfare.game import Game
+from naval_warfare.game import GameOption
+from naval_warfare.game import Placement
+from naval_warfare.game import Player
+from naval_warfare.models import Board2D
+from naval_warfare.models import Position
+from naval_warfare.models import ShipDirection
+from naval_warfare.simulation import prepare_headless_player
+
+MAGIC = b"NWRP\x01"
+
+MAX_BOARD_SIDE = 0xFFFF
+
+HIT_FLAG, DESTROYED_FLAG, PLAYER_2_FLAG = 1, 2, 4
+
+_RECORD_SIZE = struct.Struct("<I")
+_BOARD_SIZE = struct.Struct("<HH")
+_COUNT_8 = struct.Struct("<B")
+_COUNT_16 = struct.Struct("<H")
+_COUNT_32 = struct.Struct("<I")
+_SHIP_OPTION = struct.Struct("<HH")
+_PLACEMENT = struct.Struct("<BHHB")
+_SHOT = struct.Struct("<HHB")
+
+_DIRECTIONS = (ShipDirection.H, ShipDirection.V)
+
+ReplayRecord = namedtuple("ReplayRecord", ["length", "width", "game_option", "placements", "shots"])
+ReplayShot = namedtuple("ReplayShot", ["attacker", "position", "outcome"])  # attacker is 1 or 2
+
+
+class ReplayWriter:
+    """
+    Event hook writing every battle it sees as a replay record, e.g. `start(game, event_hook=ReplayWriter(stream))`.
+
+    Shots are buffered per game and the record is written at once when the battle ends.
+    """
+
+    def __init__(self, stream: BinaryIO, *, write_magic: bool = True):
+        self.stream = stream
+        self._record = bytearray()
+        self._player_2: Optional[Player] = None
+        self._shots = 0
+        if write_magic:
+            stream.write(MAGIC)
+
+    def __call__(self, event: Event):
+        if isinstance(event, ShotFired):
+            self.record_shot(event)
+        elif isinstance(event, BattleStarted):
+            self.begin_game(event.player_1, event.player_2)
+        elif isinstance(event, BattleEnded):
+            self.end_game()
+
+    def begin_game(self, player_1: Player, player_2: Player):
+        self._record = encode_game_header(player_1, player_2)
+        self._player_2 = player_2
+        self._shots = 0
+
+    def record_shot(self, event: ShotFired):
+        flags = (
+            (HIT_FLAG if event.outcome.has_hit_something else 0)
+            | (DESTROYED_FLAG if event.outcome.has_destroyed_a_ship else 0)
+            | (PLAYER_2_FLAG if event.attacker is self._player_2 else 0)
+        )
+        self._record += _SHOT.pack(event.position.x, event.position.y, flags)
+        self._shots += 1
+
+    def end_game(self):
+        shots_offset = len(self._record) - self._shots * _SHOT.size - _COUNT_32.size
+        _COUNT_32.pack_into(self._record, shots_offset, self._shots)
+        self.stream.write(_RECORD_SIZE.pack(len(self._record)))
+        self.stream.write(self._record)
+        self._record, self._player_2 = bytearray(), None
+
+
+def encode_game_header(player_1: Player, player_2: Player) -> bytearray:
+    """Encode everything of a record but the shots, leaving the shots count as zero."""
+    length, width = player_1.board.length, player_1.board.width
+    if length > MAX_BOARD_SIDE or width > MAX_BOARD_SIDE:
+        raise ValueError(f"Can't record a {length}x{width} board: replays hold up to {MAX_BOARD_SIDE} per side")
+    record = bytearray(_BOARD_SIZE.pack(length, width))
+
+    game_option = retrieve_original_game_option(player_1)
+    ship_slugs = list(game_option)
+    record += _COUNT_8.pack(len(ship_slugs))
+    for ship_slug, ship_option in game_option.items():
+        for text in (ship_slug, ship_option["kind"]):
+            encoded = text.encode()
+            record += _COUNT_8.pack(len(encoded)) + encoded
+        record += _SHIP_OPTION.pack(ship_option["length"], ship_option["quantity"])
+
+    for player in (player_1, player_2):
+        record += _COUNT_16.pack(len(player.placements))
+        for ship_slug, position, direction in player.placements:
+            record += _PLACEMENT.pack(ship_slugs.index(ship_slug), position.x, position.y, _DIRECTIONS.index(direction))
+
+    record += _COUNT_32.pack(0)
+    return record
+
+
+def decode_record(record: bytes) -> ReplayRecord:
+    """Decode a record, raising `InvalidReplay` when it's truncated or inconsistent."""
+    try:
+        return _decode_record(record)
+    except (struct.error, IndexError, UnicodeDecodeError) as error:
+        raise InvalidReplay(f"Corrupted record: {error}") from error
+
+
+def _decode_record(record: bytes) -> ReplayRecord:
+    length, width = _BOARD_SIZE.unpack_from(record, 0)
+    offset = _BOARD_SIZE.size
+
+    (options_count,) = _COUNT_8.unpack_from(record, offset)
+    offset += _COUNT_8.size
+    game_option: GameOption = {}
+    for _ in range(options_count):
+        texts = []
+        for _ in range(2):
+            (size,) = _COUNT_8.unpack_from(record, offset)
+            offset += _COUNT_8.size
+            texts.append(bytes(record[offset : offset + size]).decode())
+            offset += size
+        ship_length, quantity = _SHIP_OPTION.unpack_from(record, offset)
+        offset += _SHIP_OPTION.size
+        game_option[texts[0]] = AvailableShip(kind=texts[1], length=ship_length, quantity=quantity)
+
+    ship_slugs = list(game_option)
+    placements: Tuple[List[Placement], ...] = ([], [])
+    for fleet in placements:
+        (ships_count,) = _COUNT_16.unpack_from(record, offset)
+        offset += _COUNT_16.size
+        for _ in range(ships_count):
+            option_index, x, y, direction_index = _PLACEMENT.unpack_from(record, offset)
+            offset += _PLACEMENT.size
+            fleet.append((ship_slugs[option_index], Position(x, y), _DIRECTIONS[direction_index]))
+
+    (shots_count,) = _COUNT_32.unpack_from(record, offset)
+    offset += _COUNT_32.size
+    shots = record[offset : offset + shots_count * _SHOT.size]
+    if len(shots) != shots_count * _SHOT.size:
+        raise InvalidReplay("Truncated shots")
+
+    return ReplayRecord(length, width, game_option, placements, shots)
+
+
+def iterate_shots(record: ReplayRecord) -> Iterator[ReplayShot]:
+    for x, y, flags in _SHOT.iter_unpack(record.shots):
+        outcome = BombOutcome(bool(flags & HIT_FLAG), bool(flags & DESTROYED_FLAG))
+        yield ReplayShot(2 if flags & PLAYER_2_FLAG else 1, Position(x, y), outcome)
+
+
+def iterate_records(buffer) -> Generator[ReplayRecord, None, None]:
+    """
+    Decode, one by one, the records of a whole replay file given as a buffer (e.g. a `mmap`). Each record is copied
+    out of the buffer, so records stay valid after it's closed.
+    """
+    with memoryview(buffer) as view:  # Released when the iteration ends, even on errors, so a `mmap` can be closed
+        if bytes(view[: len(MAGIC)]) != MAGIC:
+            raise InvalidReplay("Not a replay file")
+
+        offset = len(MAGIC)
+        while offset < len(view):
+            if offset + _RECORD_SIZE.size > len(view):
+                raise InvalidReplay("Truncated record")
+            (record_size,) = _RECORD_SIZE.unpack_from(view, offset)
+            offset += _RECORD_SIZE.size
+            if offset + record_size > len(view):
+                raise InvalidReplay("Truncated record")
+            record = bytes(view[offset : offset + record_size])
+            offset += record_size
+            yield decode_record(record)
+
+
+@contextmanager
+def open_replays(path: str) -> Iterator[Iterator[ReplayRecord]]:
+    """Memory-map a replay file and iterate its records: only the pages being read are loaded."""
+    with open(path, "rb") as replay_file:
+        if not os.fstat(replay_file.fileno()).st_size:  # An empty file can't be mapped
+            raise InvalidReplay("Not a replay file")
+        with mmap.mmap(replay_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            records = iterate_records(mapped)
+            try:
+                yield records
+            finally:
+                records.close()  # Releases the view over the mmap, otherwise it can't be closed
+
+
+def replay_game(record: ReplayRecord, board_factory: BoardFactory = Board2D) -> Game:
+    """Rebuild the final state of a recorded game, checking every shot gives the recorded outcome."""
+    player_1, player_2 = (
+        prepare_headless_player(
+            name, record.game_option, fleet, length=record.length, width=record.width, board_factory=board_factory
+        )
+        for name, fleet in (("Player 1", record.placements[0]), ("Player 2", record.placements[1]))
+    )
+    attacked_boards = {1: player_2.board, 2: player_1.board}
+
+    for attacker, position, outcome in iterate_shots(record):
+        if bomb_position_quietly(attacked_boards[attacker], position) != outcome:
+            raise InvalidReplay(f"Shot at {position} doesn't match the recorded outcome")
+
+    return Game(player_1, player_2)
@@ -0,0 +1,134 @@
+"""
+Columnar storage of game summaries. A `ResultsSink` keeps one typed NumPy array per column, preallocated for a chunk
+of games, and writes every full chunk to its own `.npz` file, so memory stays bounded however many games are played.
+
+Columns, one row per game:
+    - `seed` (`uint64`), `winner` (`uint8`, 1 or 2), `turns` (`uint32`)
+    - `shots` (`uint32`, `(games, 2)`): shots fired by each player
+    - `first_hit_turn` (`int32`, `(games, 2)`): turn of the first hit of each player, -1 when they hit nothing
+    - `sunk_turn` (`int32`, `(games, 2, ships per fleet)`): turn each ship of each fleet sank, in placement order,
+      -1 while it's afloat
+"""
+
+import glob
+import os
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+from naval_warfare.events import BattleStarted
+from naval_warfare.events import Event
+from naval_warfare.events import ShotFired
+from naval_warfare.game import GameOption
+from naval_warfare.game import Player
+from naval_warfare.models import Position
+from naval_warfare.simulation import GameResult
+
+NOT_YET = -1
+
+DEFAULT_PREFIX = "results"
+
+Columns = Dict[str, np.ndarray]
+
+
+def count_fleet_ships(game_option: GameOption) -> int:
+    return sum(ship_option["quantity"] for ship_option in game_option.values())
+
+
+class ResultsSink:
+    """
+    Collect the summary of every game simulated with `event_hook` given to it and the result passed to `append`, as
+    `simulate_batch(..., results_sink=sink)` does. Chunks are written as `<prefix>-<chunk number>.npz`.
+    """
+
+    def __init__(self, directory: str, ships_per_fleet: int, *, chunk_size: int = 65536, prefix: str = DEFAULT_PREFIX):
+        self.directory = directory
+        self.ships_per_fleet = ships_per_fleet
+        self.chunk_size = chunk_size
+        self.prefix = prefix
+        self.rows = 0
+        self.chunks_written = 0
+        self.columns: Columns = {
+            "seed": np.zeros(chunk_size, dtype=np.uint64),
+            "winner": np.zeros(chunk_size, dtype=np.uint8),
+            "turns": np.zeros(chunk_size, dtype=np.uint32),
+            "shots": np.zeros((chunk_size, 2), dtype=np.uint32),
+            "first_hit_turn": np.full((chunk_size, 2), NOT_YET, dtype=np.int32),
+            "sunk_turn": np.full((chunk_size, 2, ships_per_fleet), NOT_YET, dtype=np.int32),
+        }
+        self._players: Optional[Tuple[Player, Player]] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self) -> "ResultsSink":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+    def event_hook(self, event: Event):
+        """Record the first hits and the sunk ships of the game being played in the current row."""
+        if isinstance(event, ShotFired):
+            if event.outcome.has_hit_something:
+                self._record_hit(event)
+        elif isinstance(event, BattleStarted):
+            self._players = (event.player_1, event.player_2)
+
+    def _record_hit(self, event: ShotFired):
+        if self._players is None:
+            raise ValueError("A shot was fired before the battle started")
+        row, attacker = self.rows, 0 if event.attacker is self._players[0] else 1
+        first_hit_turn = self.columns["first_hit_turn"]
+        if first_hit_turn[row, attacker] == NOT_YET:
+            first_hit_turn[row, attacker] = event.turn
+
+        if event.outcome.has_destroyed_a_ship:
+            ship_index = retrieve_ship_index(event.defender, event.position)
+            self.columns["sunk_turn"][row, attacker ^ 1, ship_index] = event.turn
+
+    def append(self, result: GameResult):
+        """Complete the current row with the result of its game, writing the chunk once it's full."""
+        row, columns = self.rows, self.columns
+        columns["seed"][row] = result.seed
+        columns["winner"][row] = result.winner
+        columns["turns"][row] = result.turns
+        columns["shots"][row] = result.shots
+
+        self.rows += 1
+        self._players = None
+        if self.rows == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows as a new chunk file, then reuse the same arrays for the next rows."""
+        if not self.rows:
+            return
+
+        path = os.path.join(self.directory, f"{self.prefix}-{self.chunks_written:06d}.npz")
+        np.savez(path, **{name: column[: self.rows] for name, column in self.columns.items()})
+        self.chunks_written += 1
+
+        self.rows = 0
+        self.columns["first_hit_turn"].fill(NOT_YET)
+        self.columns["sunk_turn"].fill(NOT_YET)
+
+
+def retrieve_ship_index(player: Player, position: Position) -> int:
+    ship = player.board.ship_at(position)
+    return next(index for index, placed_ship in enumerate(player.board.ships) if placed_ship is ship)
+
+
+def load_results(directory: str, prefix: str = DEFAULT_PREFIX) -> Columns:
+    """
+    Load the chunks written with `prefix` in a directory (`<prefix>-<number>...npz`), in file name order, as a single
+    array per column. Other `.npz` files are left alone.
+    """
+    chunks = []
+    for path in sorted(glob.glob(os.path.join(directory, f"{glob.escape(prefix)}-[0-9]*.npz"))):
+        with np.load(path) as chunk:
+            chunks.append({name: chunk[name] for name in chunk.files})
+
+    if not chunks:
+        return {}
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
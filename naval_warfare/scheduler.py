@@ -0,0 +1,42 @@
+from random import Random
+from typing import Dict
+from typing import Optional
+
+from naval_warfare.exceptions import NoPositionsLeft
+from naval_warfare.models import Position
+
+
+class TargetScheduler:
+    """
+    Hands out every position of a `length` x `width` board exactly once, in random order.
+
+    It's a lazy Fisher-Yates shuffle over the position indexes: only the swapped indexes are stored, so creating it
+    is O(1) and each call to `next_position` is O(1), no matter the board size.
+    """
+
+    def __init__(self, length: int, width: int, rng: Optional[Random] = None):
+        self.length = length
+        self.width = width
+        self.remaining = length * width
+        self._swapped: Dict[int, int] = {}
+        self._random = (rng or Random()).random
+
+    def __len__(self) -> int:
+        return self.remaining
+
+    def next_position(self) -> Position:
+        if not self.remaining:
+            raise NoPositionsLeft
+
+        self.remaining -= 1
+        last = self.remaining
+        chosen = int(self._random() * (last + 1))
+
+        swapped = self._swapped
+        index = swapped.get(chosen, chosen)
+        if chosen != last:
+            swapped[chosen] = swapped.pop(last, last)
+        else:
+            swapped.pop(last, None)
+
+        return Position(*divmod(index, self.width))
@@ -0,0 +1,214 @@
+"""
+How long a fleet layout survives: the expected number of shots an attack strategy needs to sink it, estimated by
+playing many attacks against it with `simulation.play_headless_attack`.
+
+Rotating or mirroring a layout doesn't change its score, so layouts are scored in a canonical form, the smallest
+of its images under the board symmetries (8 for square boards, 4 otherwise), and every image shares the same entry
+of a `LayoutScoreCache`.
+"""
+
+import json
+import os
+import statistics
+from collections import OrderedDict
+from collections import namedtuple
+from dataclasses import dataclass
+from random import Random
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from naval_warfare.game import GameOption
+from naval_warfare.game import Placement
+from naval_warfare.models import Position
+from naval_warfare.models import ShipDirection
+from naval_warfare.simulation import derive_game_seed
+from naval_warfare.simulation import play_headless_attack
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.strategies import RandomStrategy
+from naval_warfare.strategies import StrategyFactory
+
+LayoutScore = namedtuple("LayoutScore", ["games", "mean_shots", "stdev_shots"])
+
+Symmetry = Callable[[int, int], Tuple[int, int]]
+CanonicalLayout = Tuple[Tuple[str, int, int, str], ...]  # sorted (ship slug, x, y, direction name)
+
+
+def retrieve_symmetries(length: int, width: int) -> List[Symmetry]:
+    """Maps of the positions of a `length` x `width` board onto itself: rotations and mirrors."""
+    last_x, last_y = length - 1, width - 1
+    symmetries = [
+        lambda x, y: (x, y),
+        lambda x, y: (last_x - x, y),
+        lambda x, y: (x, last_y - y),
+        lambda x, y: (last_x - x, last_y - y),
+    ]
+    if length == width:  # Quarter turns and diagonal mirrors only keep square boards in place
+        symmetries += [
+            lambda x, y: (y, x),
+            lambda x, y: (y, last_x - x),
+            lambda x, y: (last_y - y, x),
+            lambda x, y: (last_y - y, last_x - x),
+        ]
+    return symmetries
+
+
+def transform_placement(
+    placement: Placement, ship_length: int, symmetry: Symmetry
+) -> Tuple[str, int, int, ShipDirection]:
+    ship_slug, (x, y), direction = placement
+    step_x, step_y = (0, 1) if direction == ShipDirection.H else (1, 0)
+    positions = sorted(symmetry(x + offset * step_x, y + offset * step_y) for offset in range(ship_length))
+    front_x, front_y = positions[0]
+    if ship_length == 1 or positions[-1][0] == front_x:
+        return ship_slug, front_x, front_y, ShipDirection.H
+    return ship_slug, front_x, front_y, ShipDirection.V
+
+
+def canonicalize_layout(
+    game_option: GameOption, placements: Sequence[Placement], length: int, width: int
+) -> CanonicalLayout:
+    """The smallest image of a layout under the board symmetries: the same for all its rotations and mirrors."""
+    return min(
+        tuple(
+            sorted(
+                (ship_slug, x, y, direction.name)
+                for ship_slug, x, y, direction in (
+                    transform_placement(placement, game_option[placement[0]]["length"], symmetry)
+                    for placement in placements
+                )
+            )
+        )
+        for symmetry in retrieve_symmetries(length, width)
+    )
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LayoutScoreCache:
+    """
+    Bounded LRU of layout scores: past `max_entries`, the least recently used score is evicted. With `path`, the
+    scores are loaded from that JSON file and written back by `save` (or when leaving a `with` block).
+    """
+
+    def __init__(self, max_entries: int = 4096, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.path = path
+        self.stats = CacheStats()
+        self._scores: "OrderedDict[str, LayoutScore]" = OrderedDict()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __enter__(self) -> "LayoutScoreCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.save()
+
+    def get(self, key: str) -> Optional[LayoutScore]:
+        score = self._scores.get(key)
+        if score is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        self._scores.move_to_end(key)
+        return score
+
+    def put(self, key: str, score: LayoutScore):
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        while len(self._scores) > self.max_entries:
+            self._scores.popitem(last=False)
+            self.stats.evictions += 1
+
+    def load(self, path: str):
+        """Add the scores saved on `path`, from the least to the most recently used."""
+        with open(path) as cache_file:
+            for key, score in json.load(cache_file):
+                self.put(key, LayoutScore(*score))
+
+    def save(self, path: Optional[str] = None):
+        path = path or self.path
+        if not path:
+            return
+        with open(path, "w") as cache_file:
+            json.dump([[key, list(score)] for key, score in self._scores.items()], cache_file)
+
+
+class LayoutScorer:
+    """
+    Estimate the shots `strategy_factory` needs to sink a layout over `games` attacks. Attack `i` is seeded with
+    `derive_game_seed(seed, i)`, so a layout always gets the same score, which is kept in `cache` when given.
+    """
+
+    def __init__(
+        self,
+        game_option: GameOption,
+        length: int = 10,
+        width: int = 10,
+        *,
+        games: int = 200,
+        seed: int = 0,
+        strategy_factory: StrategyFactory = RandomStrategy,
+        cache: Optional[LayoutScoreCache] = None,
+    ):
+        self.game_option = game_option
+        self.length = length
+        self.width = width
+        self.games = games
+        self.seed = seed
+        self.strategy_factory = strategy_factory
+        self.cache = cache
+
+    def create_cache_key(self, canonical_layout: CanonicalLayout) -> str:
+        ship_lengths = {ship_slug: ship_option["length"] for ship_slug, ship_option in self.game_option.items()}
+        settings = [self.length, self.width, self.games, self.seed, self.strategy_factory.__name__, ship_lengths]
+        return json.dumps(settings + [list(placement) for placement in canonical_layout], sort_keys=True)
+
+    def score(self, placements: Sequence[Placement]) -> LayoutScore:
+        canonical_layout = canonicalize_layout(self.game_option, placements, self.length, self.width)
+        if self.cache is None:
+            return self._simulate_attacks(canonical_layout)
+
+        key = self.create_cache_key(canonical_layout)
+        score = self.cache.get(key)
+        if score is None:
+            score = self._simulate_attacks(canonical_layout)
+            self.cache.put(key, score)
+        return score
+
+    def _simulate_attacks(self, canonical_layout: CanonicalLayout) -> LayoutScore:
+        """Attack the canonical layout, so all images of a layout get the exact same score."""
+        placements = [
+            (ship_slug, Position(x, y), ShipDirection[direction]) for ship_slug, x, y, direction in canonical_layout
+        ]
+        defender = prepare_headless_player(
+            "Defender", self.game_option, placements, length=self.length, width=self.width
+        )
+        initial_state = defender.board.snapshot()
+
+        shots_to_sink = []
+        for game_index in range(self.games):
+            defender.board.restore(initial_state)
+            rng = Random(derive_game_seed(self.seed, game_index))
+            shots_to_sink.append(play_headless_attack(defender, rng, self.strategy_factory))
+
+        defender.board.discard_snapshots()
+        stdev = statistics.stdev(shots_to_sink) if len(shots_to_sink) > 1 else 0.0
+        return LayoutScore(self.games, statistics.fmean(shots_to_sink), stdev)
@@ -0,0 +1,381 @@
+"""
+Asyncio TCP server hosting many matches in a single process. Each connection speaks a line protocol:
+
+    client                      server
+                                WELCOME
+    JOIN | BOT                  WAITING (JOIN, until an opponent joins), then PLACE <available ships>
+    SLG X Y H|V                 PLACED <available ships> | FLEET READY
+                                BATTLE, then YOUR TURN to whoever shoots
+    FIRE X Y                    RESULT X Y MISS|HIT|SUNK (the opponent gets INCOMING X Y MISS|HIT|SUNK)
+                                WIN | LOSE | OPPONENT LEFT
+    QUIT                        BYE
+
+Placements use the same `SLG X Y H|V` grammar as `parse_line_input`. Invalid commands get `ERROR <reason>` and can
+be retried. A match only holds its two `Player` (on `BitBoard` by default, the smallest board) and their connections,
+and nothing runs while a connection is idle, so a process can hold a large number of them.
+"""
+
+import asyncio
+import logging
+from contextlib import suppress
+from random import Random
+from typing import TYPE_CHECKING
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from naval_warfare.actions import bomb_position
+from naval_warfare.bitboard import BitBoard
+from naval_warfare.board import has_all_ships_destroyed
+from naval_warfare.checkpoint import Checkpoint
+from naval_warfare.checkpoint import create_checkpoint
+from naval_warfare.checkpoint import restore_checkpoint
+from naval_warfare.exceptions import CannotBombPosition
+from naval_warfare.exceptions import CannotOccupyPositions
+from naval_warfare.exceptions import InputWithError
+from naval_warfare.exceptions import UnavailableShip
+from naval_warfare.fleet import generate_random_fleet
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import BoardFactory
+from naval_warfare.game import Game
+from naval_warfare.game import GameOption
+from naval_warfare.game import Player
+from naval_warfare.game import create_attack_strategy
+from naval_warfare.game import parse_placement_line
+from naval_warfare.game import place_available_ship
+from naval_warfare.game import retrieve_available_ships
+from naval_warfare.models import Position
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.strategies import AttackStrategy
+from naval_warfare.strategies import RandomStrategy
+from naval_warfare.strategies import StrategyFactory
+
+if TYPE_CHECKING:
+    from asyncio.base_events import Server  # Only exported as `asyncio.Server` from Python 3.9
+
+logger = logging.getLogger(__name__)
+
+BOT_SEAT = 1
+
+
+class Match:
+    """
+    Two players and the connections writing to them: seat 0 and 1. A bot takes seat 1 with no connection and shoots
+    right after the human does.
+    """
+
+    def __init__(
+        self,
+        player_1: Player,
+        player_2: Player,
+        bot_strategy_factory: Optional[StrategyFactory] = None,
+        rng: Optional[Random] = None,
+    ):
+        self.players = (player_1, player_2)
+        self.writers: List[Optional[asyncio.StreamWriter]] = [None, None]
+        self.bot_strategy_factory = bot_strategy_factory
+        self.bot_strategy: Optional[AttackStrategy] = None  # created once the human fleet is known
+        self.rng = rng
+        self.turn = 0
+        self.has_started = False
+        self.has_ended = False
+
+    def send(self, seat: int, message: str):
+        writer = self.writers[seat]
+        if writer and not writer.is_closing():
+            writer.write(f"{message}\n".encode())
+
+    def is_fleet_ready(self, seat: int) -> bool:
+        return not retrieve_available_ships(self.players[seat].game_option)
+
+    def seat(self, seat: int, writer: asyncio.StreamWriter):
+        self.writers[seat] = writer
+        self.ask_for_placements(seat)
+
+    def ask_for_placements(self, seat: int):
+        self.send(seat, f"PLACE {' '.join(retrieve_available_ships(self.players[seat].game_option))}")
+
+    def handle(self, seat: int, line: str):
+        command, *arguments = line.split()
+        if command == "FIRE":
+            self.fire(seat, arguments)
+        else:
+            self.place(seat, line)
+
+    def place(self, seat: int, line: str):
+        player = self.players[seat]
+        if self.is_fleet_ready(seat):
+            self.send(seat, "ERROR fleet already placed")
+            return
+        try:
+            chosen_ship, position, direction = parse_placement_line(line, player.game_option)
+            place_available_ship(player, chosen_ship, position, direction)
+        except InputWithError:
+            self.send(seat, "ERROR expected SLG X Y H|V or FIRE X Y")
+            return
+        except UnavailableShip:
+            self.send(seat, "ERROR ship is unavailable")
+            return
+        except CannotOccupyPositions:
+            self.send(seat, "ERROR cannot place ship on given position")
+            return
+
+        if not self.is_fleet_ready(seat):
+            self.send(seat, f"PLACED {' '.join(retrieve_available_ships(player.game_option))}")
+            return
+        self.send(seat, "FLEET READY")
+        has_opponent = self.bot_strategy_factory or self.writers[seat ^ 1]
+        if has_opponent and self.is_fleet_ready(seat ^ 1):
+            self.begin_battle()
+
+    def begin_battle(self):
+        self.has_started = True
+        if self.bot_strategy_factory:
+            self.bot_strategy = create_attack_strategy(self.bot_strategy_factory, self.players[0], self.rng)
+        for seat in (0, 1):
+            self.send(seat, "BATTLE")
+        self.send(self.turn, "YOUR TURN")
+
+    def fire(self, seat: int, arguments: List[str]):
+        if not self.has_started:
+            self.send(seat, "ERROR battle hasn't started")
+            return
+        if seat != self.turn:
+            self.send(seat, "ERROR not your turn")
+            return
+        try:
+            x, y = arguments
+            position = Position(int(x), int(y))
+        except ValueError:
+            self.send(seat, "ERROR expected FIRE X Y")
+            return
+
+        try:
+            self.shoot(seat, position)
+        except CannotBombPosition:
+            self.send(seat, "ERROR cannot bomb given position")
+            return
+        if self.has_ended:
+            return
+
+        if self.bot_strategy:
+            while not self.has_ended and self.turn == BOT_SEAT:
+                self.shoot_as_bot()
+        if not self.has_ended:
+            self.send(self.turn, "YOUR TURN")
+
+    def shoot(self, seat: int, position: Position):
+        defender = self.players[seat ^ 1]
+        outcome = bomb_position(defender.board, position)
+        result = "SUNK" if outcome.has_destroyed_a_ship else "HIT" if outcome.has_hit_something else "MISS"
+        self.send(seat, f"RESULT {position.x} {position.y} {result}")
+        self.send(seat ^ 1, f"INCOMING {position.x} {position.y} {result}")
+        if self.bot_strategy and seat == BOT_SEAT:
+            self.bot_strategy.register_outcome(position, outcome)
+
+        if outcome.has_destroyed_a_ship and has_all_ships_destroyed(defender.board):
+            self.has_ended = True
+            self.send(seat, "WIN")
+            self.send(seat ^ 1, "LOSE")
+        self.turn = seat ^ 1
+
+    def shoot_as_bot(self):
+        position = self.bot_strategy.next_position()
+        try:
+            self.shoot(BOT_SEAT, position)
+        except CannotBombPosition:
+            pass
+
+    def checkpoint(self) -> Checkpoint:
+        """Serializable state of the match (connections aside), see `from_checkpoint`."""
+        return {
+            "game": create_checkpoint(Game(*self.players)),
+            "turn": self.turn,
+            "has_started": self.has_started,
+            "has_ended": self.has_ended,
+            "has_bot": self.bot_strategy_factory is not None,
+        }
+
+    @classmethod
+    def from_checkpoint(
+        cls,
+        checkpoint: Checkpoint,
+        board_factory: BoardFactory = BitBoard,
+        bot_strategy_factory: StrategyFactory = RandomStrategy,
+        rng: Optional[Random] = None,
+    ) -> "Match":
+        """
+        Resume a match, waiting for its players to be seated again. A bot gets a new strategy, which doesn't know its
+        previous shots: positions it already bombed are just skipped.
+        """
+        game = restore_checkpoint(checkpoint["game"], board_factory)
+        match = cls(game.player_1, game.player_2, bot_strategy_factory if checkpoint["has_bot"] else None, rng)
+        match.turn, match.has_started, match.has_ended = (
+            checkpoint["turn"],
+            checkpoint["has_started"],
+            checkpoint["has_ended"],
+        )
+        if match.has_started and match.bot_strategy_factory:
+            match.bot_strategy = create_attack_strategy(match.bot_strategy_factory, match.players[0], rng)
+        return match
+
+    def leave(self, seat: int):
+        self.writers[seat] = None
+        if not self.has_ended:
+            self.has_ended = True
+            self.send(seat ^ 1, "OPPONENT LEFT")
+
+
+class GameServer:
+    def __init__(
+        self,
+        game_option: Optional[GameOption] = None,
+        *,
+        length: int = 10,
+        width: int = 10,
+        board_factory: BoardFactory = BitBoard,
+        strategy_factory: StrategyFactory = RandomStrategy,
+        rng: Optional[Random] = None,
+    ):
+        self.game_option = game_option or DEFAULT_GAME_OPTION
+        self.length = length
+        self.width = width
+        self.board_factory = board_factory
+        self.strategy_factory = strategy_factory
+        self.rng = rng or Random()
+        self.connections = 0
+        self._waiting_match: Optional[Match] = None
+
+    def new_player(self, name: str) -> Player:
+        return Player(
+            name, game_option=self.game_option, length=self.length, width=self.width, board_factory=self.board_factory
+        )
+
+    def create_bot_match(self) -> Match:
+        fleet = generate_random_fleet(self.game_option, self.length, self.width, self.rng)
+        bot = prepare_headless_player(
+            "Bot", self.game_option, fleet, length=self.length, width=self.width, board_factory=self.board_factory
+        )
+        human = self.new_player("Player 1")
+        return Match(human, bot, self.strategy_factory, self.rng)
+
+    def join_match(self) -> Tuple[Match, int]:
+        """Take the seat left on the waiting match, or open a new match and wait on it."""
+        match = self._waiting_match
+        if match and not match.has_ended:
+            self._waiting_match = None
+            return match, 1
+        self._waiting_match = Match(self.new_player("Player 1"), self.new_player("Player 2"))
+        return self._waiting_match, 0
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 0, **kwargs) -> "Server":
+        """Start listening (on a free port by default, see `server.sockets`), e.g. `await server.serve_forever()`."""
+        return await asyncio.start_server(self.handle_connection, host, port, **kwargs)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        match: Optional[Match] = None
+        seat = 0
+        writer.write(b"WELCOME\n")
+        try:
+            while True:
+                try:
+                    received = await reader.readline()
+                except ValueError:  # Over the reader's limit (64 KiB by default): the reader drops what it buffered
+                    writer.write(b"ERROR line too long\n")
+                    await writer.drain()
+                    continue
+                line = received.decode(errors="replace").strip()
+                if not received or line == "QUIT":
+                    break
+                if not line:
+                    continue
+                if match is None:
+                    match, seat = self.open_match(line, writer)
+                elif match.has_ended:
+                    writer.write(b"ERROR match has ended\n")
+                else:
+                    match.handle(seat, line)
+                await writer.drain()
+                if match is not None:
+                    await drain_opponent(match.writers[seat ^ 1])
+        except ConnectionError:
+            logger.debug("Connection lost")
+        finally:
+            self.connections -= 1
+            if match:
+                match.leave(seat)
+                if match is self._waiting_match:
+                    self._waiting_match = None
+            if not writer.is_closing():
+                writer.write(b"BYE\n")
+                writer.close()
+
+    def open_match(self, line: str, writer: asyncio.StreamWriter) -> Tuple[Optional[Match], int]:
+        if line == "BOT":
+            match = self.create_bot_match()
+            match.seat(0, writer)
+            return match, 0
+        if line == "JOIN":
+            match, seat = self.join_match()
+            if seat == 0:
+                match.writers[0] = writer
+                writer.write(b"WAITING\n")
+                return match, seat
+            match.ask_for_placements(0)
+            match.seat(1, writer)
+            return match, seat
+
+        writer.write(b"ERROR expected JOIN or BOT\n")
+        return None, 0
+
+
+async def drain_opponent(writer: Optional[asyncio.StreamWriter]):
+    """
+    Wait until what was sent to the opponent is written, so a slow reader holds back whoever writes to it. A lost
+    opponent connection is left to its own handler.
+    """
+    if writer and not writer.is_closing():
+        with suppress(ConnectionError):
+            await writer.drain()
+
+
+class GameClient:
+    """Small client for the game server, e.g. to play or test against it from the same process."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "GameClient":
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def send(self, line: str):
+        self.writer.write(f"{line}\n".encode())
+        await self.writer.drain()
+
+    async def receive(self) -> str:
+        return (await self.reader.readline()).decode().rstrip("\n")
+
+    async def receive_until(self, *prefixes: str) -> List[str]:
+        """Receive lines until one starts with any of `prefixes` (included), or the connection closes."""
+        lines: List[str] = []
+        while True:
+            line = await self.receive()
+            if not line:
+                return lines
+            lines.append(line)
+            if line.startswith(prefixes):
+                return lines
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def run_server(host: str = "127.0.0.1", port: int = 8888, **kwargs):
+    server = await GameServer(**kwargs).serve(host, port)
+    logger.info("Serving on %s", ", ".join(str(socket.getsockname()) for socket in server.sockets))
+    async with server:
+        await server.serve_forever()
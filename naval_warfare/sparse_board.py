@@ -0,0 +1,147 @@
+from collections import namedtuple
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from naval_warfare.exceptions import NoSnapshotToRestore
+from naval_warfare.models import STATUS_CHARS
+from naval_warfare.models import BoardSnapshot
+from naval_warfare.models import Position
+from naval_warfare.models import PositionStatus
+from naval_warfare.models import Ship
+from naval_warfare.models import ShipDirection
+
+if TYPE_CHECKING:
+    from naval_warfare.placements import PlacementIndex
+
+Viewport = namedtuple("Viewport", ["x", "y", "length", "width"])  # top-left position and size of the rendered area
+
+DEFAULT_VIEWPORT_SIDE = 20
+
+_SparseJournalEntry = Tuple[int, bool, Optional[Ship]]  # a position index, if it was bombed and its ship before
+
+
+@dataclass(eq=False)
+class SparseBoard:
+    """
+    Same as `Board2D`, but only the positions holding something are kept, by their index `x * width + y`:
+        - `ships_at`: the ship on each occupied position
+        - `bombed`: the bombed positions
+
+    Every other position is free, so the memory grows with the ships and the shots, never with the area: a
+    100000x100000 ocean takes as much as a 10x10 one. Only the `viewport` is rendered by `rows` and `__str__`.
+    """
+
+    length: int  # horizontal - x
+    width: int  # vertical - y
+    ships_at: Dict[int, Ship] = field(default_factory=dict, init=False, repr=False)
+    bombed: Set[int] = field(default_factory=set, init=False, repr=False)
+    viewport: Viewport = field(init=False)
+    ships: List[Ship] = field(default_factory=list, init=False)
+    ships_afloat: int = field(default=0, init=False)
+    _journal: Optional[List[_SparseJournalEntry]] = field(default=None, init=False, repr=False)
+    placement_index: Optional["PlacementIndex"] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self.viewport = Viewport(0, 0, min(self.length, DEFAULT_VIEWPORT_SIDE), min(self.width, DEFAULT_VIEWPORT_SIDE))
+
+    def __str__(self) -> str:
+        return "\n".join(self.rows())
+
+    def rows(self, viewport: Optional[Viewport] = None) -> Iterator[str]:
+        """Render the rows of `viewport` (the board's own by default), clipped to the board."""
+        x, y, length, width = viewport or self.viewport
+        first_x, last_x = max(0, x), min(self.length, x + length)
+        first_y, last_y = max(0, y), min(self.width, y + width)
+
+        status_chars = STATUS_CHARS
+        for i in range(first_x, last_x):
+            yield " ".join([status_chars[self.status_at(Position(i, j))] for j in range(first_y, last_y)])
+
+    def status_at(self, position: Position) -> PositionStatus:
+        index = position.x * self.width + position.y
+        if index in self.bombed:
+            return PositionStatus.BOMBED
+        if index in self.ships_at:
+            return PositionStatus.OCCUPIED
+        return PositionStatus.FREE
+
+    def ship_at(self, position: Position) -> Optional[Ship]:
+        return self.ships_at.get(position.x * self.width + position.y)
+
+    def occupy_position(self, position: Position, ship: Ship):
+        self._occupy_index(position.x * self.width + position.y, ship)
+
+    def mark_bombed(self, position: Position) -> bool:
+        """Mark the position as bombed, returning if there was a ship on it."""
+        index = position.x * self.width + position.y
+        self._journal_change(index)
+        has_hit_something = index in self.ships_at and index not in self.bombed
+        self.bombed.add(index)
+        return has_hit_something
+
+    def bombed_positions(self) -> Iterator[Position]:
+        """The bombed positions, row by row, without scanning the free ones."""
+        for index in sorted(self.bombed):
+            yield Position(*divmod(index, self.width))
+
+    def is_span_free(self, front_position: Position, length: int, direction: ShipDirection) -> bool:
+        """Check if the `length` positions from `front_position` towards `direction` are free (must be inside)."""
+        ships_at, bombed = self.ships_at, self.bombed
+        return not any(index in ships_at or index in bombed for index in self._span(front_position, length, direction))
+
+    def occupy_span(self, front_position: Position, length: int, direction: ShipDirection, ship: Ship):
+        for index in self._span(front_position, length, direction):
+            self._occupy_index(index, ship)
+
+    def _span(self, front_position: Position, length: int, direction: ShipDirection) -> range:
+        first_index = front_position.x * self.width + front_position.y
+        step = 1 if direction == ShipDirection.H else self.width
+        return range(first_index, first_index + length * step, step)
+
+    def _occupy_index(self, index: int, ship: Ship):
+        self._journal_change(index)
+        self.bombed.discard(index)  # As on `Board2D`, occupying a position overrides its status
+        self.ships_at[index] = ship
+
+    def _journal_change(self, index: int):
+        if self._journal is not None:
+            self._journal.append((index, index in self.bombed, self.ships_at.get(index)))
+
+    def snapshot(self) -> BoardSnapshot:
+        """Same as `Board2D.snapshot`: only the previous state of the changed positions is kept."""
+        if self._journal is None:
+            self._journal = []
+        return BoardSnapshot(
+            len(self._journal), len(self.ships), self.ships_afloat, tuple(ship.hits_taken for ship in self.ships)
+        )
+
+    def restore(self, snapshot: BoardSnapshot):
+        journal = self._journal
+        if journal is None:
+            raise NoSnapshotToRestore("No active snapshot: take one first (`discard_snapshots` drops them all)")
+        while len(journal) > snapshot.journal_length:
+            index, was_bombed, ship = journal.pop()
+            if was_bombed:
+                self.bombed.add(index)
+            else:
+                self.bombed.discard(index)
+            if ship is None:
+                self.ships_at.pop(index, None)
+            else:
+                self.ships_at[index] = ship
+
+        del self.ships[snapshot.ships_count :]
+        for ship, hits_taken in zip(self.ships, snapshot.hits_taken):
+            ship.hits_taken = hits_taken
+        self.ships_afloat = snapshot.ships_afloat
+        self.placement_index = None  # Not rolled back, so it would be stale
+
+    def discard_snapshots(self):
+        self._journal = None
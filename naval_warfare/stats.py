@@ -0,0 +1,58 @@
+"""
+Opt-in instrumentation of a game: give a `GameStats` to `prepare_game` (or set `Game.stats`) and `start` fills and
+returns it. Without it, the game only pays for an `is None` check per shot.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Iterator
+
+from naval_warfare.actions import BombOutcome
+
+if TYPE_CHECKING:
+    import cProfile
+
+
+@dataclass
+class GameStats:
+    placement_ns: int = 0  # time spent placing the ships of both players (reading stdin included)
+    battle_ns: int = 0  # time spent in `start`, output included
+    output_ns: int = 0  # time spent writing the output of the battle, flushes to stdout included
+    rejected_placements: int = 0  # lines that couldn't be parsed or placed
+    rejected_positions: int = 0  # positions given by a strategy that couldn't be bombed
+    shots: int = 0
+    misses: int = 0
+    hits: int = 0
+    sinks: int = 0
+
+    def register_outcome(self, outcome: BombOutcome):
+        self.shots += 1
+        if not outcome.has_hit_something:
+            self.misses += 1
+            return
+        self.hits += 1
+        if outcome.has_destroyed_a_ship:
+            self.sinks += 1
+
+    def __str__(self) -> str:
+        return (
+            f"Placement: {self.placement_ns / 1e6:.3f} ms ({self.rejected_placements} rejected lines)\n"
+            f"Battle: {self.battle_ns / 1e6:.3f} ms, of which output: {self.output_ns / 1e6:.3f} ms\n"
+            f"Shots: {self.shots} ({self.misses} misses, {self.hits} hits, {self.sinks} sinks), "
+            f"{self.rejected_positions} rejected positions"
+        )
+
+
+@contextmanager
+def profiling(path: str) -> Iterator["cProfile.Profile"]:
+    """Profile what runs inside the block with `cProfile`, e.g. `start(game)`, and dump its stats to `path`."""
+    import cProfile  # Only loaded when profiling, as every game imports this module
+
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield profile
+    finally:
+        profile.disable()
+        profile.dump_stats(path)
@@ -0,0 +1,195 @@
+import heapq
+from abc import ABC
+from abc import abstractmethod
+from array import array
+from collections import Counter
+from random import Random
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from naval_warfare.actions import BombOutcome
+from naval_warfare.exceptions import NoPositionsLeft
+from naval_warfare.models import Position
+from naval_warfare.scheduler import TargetScheduler
+
+
+class AttackStrategy(ABC):
+    """Chooses where an attacker shoots next on a `length` x `width` board holding ships of `ship_lengths`."""
+
+    def __init__(self, length: int, width: int, ship_lengths: Sequence[int], rng: Optional[Random] = None):
+        self.length = length
+        self.width = width
+
+    @abstractmethod
+    def next_position(self) -> Position:
+        pass
+
+    def register_outcome(self, position: Position, outcome: BombOutcome):
+        """Called with the outcome of every shot fired at the position given by `next_position`."""
+
+
+StrategyFactory = Callable[[int, int, Sequence[int], Optional[Random]], AttackStrategy]
+
+
+class RandomStrategy(AttackStrategy):
+    """Shoots every position once, in random order."""
+
+    def __init__(self, length: int, width: int, ship_lengths: Sequence[int], rng: Optional[Random] = None):
+        super().__init__(length, width, ship_lengths, rng)
+        self._scheduler = TargetScheduler(length, width, rng)
+
+    def next_position(self) -> Position:
+        return self._scheduler.next_position()
+
+
+class ProbabilityDensityStrategy(AttackStrategy):
+    """
+    Hunt/target strategy:
+        - target: after a hit, shoot the positions around it until a ship is destroyed
+        - hunt: shoot the position covered by most legal placements of the ship lengths still afloat
+
+    For each ship length, the number of placements covering each position (its coverage) is kept in an array and
+    only the placements crossing the newly bombed position are removed after a shot (O(length²) per length). The
+    best position comes from a lazy max-heap, so a shot never scans the whole board.
+
+    Each length still afloat counts once, however many ships of it are left: sinking a ship only changes the density
+    when it was the last one of its length, which takes a pass over the board at most once per distinct length.
+    Every other sink is O(1).
+    """
+
+    def __init__(self, length: int, width: int, ship_lengths: Sequence[int], rng: Optional[Random] = None):
+        super().__init__(length, width, ship_lengths, rng)
+        self._random = (rng or Random()).random
+        self._remaining_lengths = Counter(ship_lengths)
+        self._bombed = bytearray(length * width)
+        self._coverages: Dict[int, array] = {
+            ship_length: self._build_empty_board_coverage(ship_length) for ship_length in self._remaining_lengths
+        }
+        self._density = array("q", bytes(8 * length * width))
+        for coverage in self._coverages.values():
+            for index, covering_placements in enumerate(coverage):
+                self._density[index] += covering_placements
+
+        self._heap: List[Tuple[int, float, int]] = []
+        self._rebuild_heap()
+        self._targets: List[int] = []
+        self._hits_since_last_destroyed_ship = 0
+        self._first_maybe_unbombed = 0
+
+    def _build_empty_board_coverage(self, ship_length: int) -> array:
+        def placements_covering(index: int, size: int) -> int:
+            return max(0, min(index, size - ship_length) - max(0, index - ship_length + 1) + 1)
+
+        rows = [placements_covering(y, self.width) for y in range(self.width)]
+        columns = [placements_covering(x, self.length) for x in range(self.length)]
+        if ship_length == 1:  # Horizontal and vertical placements are the same
+            columns = [0] * self.length
+
+        return array("q", (columns[x] + rows[y] for x in range(self.length) for y in range(self.width)))
+
+    def _rebuild_heap(self):
+        self._heap = [
+            (-density, self._random(), index)
+            for index, density in enumerate(self._density)
+            if density > 0 and not self._bombed[index]
+        ]
+        heapq.heapify(self._heap)
+
+    def next_position(self) -> Position:
+        while self._targets:
+            index = self._targets.pop()
+            if not self._bombed[index]:
+                return Position(*divmod(index, self.width))
+
+        heap, density, bombed = self._heap, self._density, self._bombed
+        while heap:
+            negative_density, _, index = heapq.heappop(heap)
+            if not bombed[index] and -negative_density == density[index]:
+                return Position(*divmod(index, self.width))
+
+        # No placement fits anywhere anymore: shoot whatever is left, in order
+        while self._first_maybe_unbombed < len(bombed) and bombed[self._first_maybe_unbombed]:
+            self._first_maybe_unbombed += 1
+        if self._first_maybe_unbombed == len(bombed):
+            raise NoPositionsLeft
+        return Position(*divmod(self._first_maybe_unbombed, self.width))
+
+    def register_outcome(self, position: Position, outcome: BombOutcome):
+        index = position.x * self.width + position.y
+        self._remove_placements_crossing(position)
+        self._bombed[index] = 1
+
+        if outcome.has_hit_something:
+            self._hits_since_last_destroyed_ship += 1
+            self._push_targets_around(position)
+        if outcome.has_destroyed_a_ship:
+            self._remove_destroyed_ship()
+
+    def _remove_placements_crossing(self, position: Position):
+        x, y = position
+        width, bombed, density = self.width, self._bombed, self._density
+        changed_indexes = set()
+
+        for ship_length, coverage in self._coverages.items():
+            directions = ((0, 1),) if ship_length == 1 else ((0, 1), (1, 0))
+            for dx, dy in directions:
+                for offset in range(ship_length):
+                    first_x, first_y = x - offset * dx, y - offset * dy
+                    last_x, last_y = first_x + (ship_length - 1) * dx, first_y + (ship_length - 1) * dy
+                    if first_x < 0 or first_y < 0 or last_x >= self.length or last_y >= width:
+                        continue
+
+                    indexes = [(first_x + k * dx) * width + first_y + k * dy for k in range(ship_length)]
+                    if any(bombed[index] for index in indexes):
+                        continue  # This placement was already removed
+
+                    for index in indexes:
+                        coverage[index] -= 1
+                        density[index] -= 1
+                    changed_indexes.update(indexes)
+
+        for index in changed_indexes:
+            if density[index] > 0 and not bombed[index]:
+                heapq.heappush(self._heap, (-density[index], self._random(), index))
+
+    def _push_targets_around(self, position: Position):
+        x, y = position
+        neighbours = [
+            i * self.width + j
+            for i, j in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+            if 0 <= i < self.length and 0 <= j < self.width and not self._bombed[i * self.width + j]
+        ]
+        self._targets.extend(sorted(neighbours, key=self._density.__getitem__))  # Densest is popped first
+
+    def _remove_destroyed_ship(self):
+        hits = self._hits_since_last_destroyed_ship
+        remaining_lengths = [ship_length for ship_length, quantity in self._remaining_lengths.items() if quantity]
+        if not remaining_lengths:
+            return
+
+        # The shot only tells a ship was destroyed, so its length is guessed from the hits taken since the last one
+        fitting_lengths = [ship_length for ship_length in remaining_lengths if ship_length <= hits]
+        destroyed_length = max(fitting_lengths) if fitting_lengths else min(remaining_lengths)
+        self._hits_since_last_destroyed_ship = max(0, hits - destroyed_length)
+        if not self._hits_since_last_destroyed_ship:
+            self._targets.clear()
+
+        self._remaining_lengths[destroyed_length] -= 1
+        if self._remaining_lengths[destroyed_length]:
+            return  # Ships of this length are still afloat: their placements still count
+
+        coverage = self._coverages.pop(destroyed_length)
+        density = self._density
+        for index, covering_placements in enumerate(coverage):
+            density[index] -= covering_placements
+        self._rebuild_heap()
+
+
+STRATEGIES: Dict[str, StrategyFactory] = {
+    "random": RandomStrategy,
+    "density": ProbabilityDensityStrategy,
+}
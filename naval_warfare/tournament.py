@@ -0,0 +1,158 @@
+import logging
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from functools import partial
+from random import Random
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+from naval_warfare.fleet import generate_random_fleets
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import GameOption
+from naval_warfare.lockstep import LOCKSTEP_STRATEGIES
+from naval_warfare.lockstep import simulate_lockstep
+from naval_warfare.results import DEFAULT_PREFIX
+from naval_warfare.results import ResultsSink
+from naval_warfare.results import count_fleet_ships
+from naval_warfare.simulation import derive_game_seed
+from naval_warfare.simulation import simulate_batch
+from naval_warfare.strategies import RandomStrategy
+from naval_warfare.strategies import StrategyFactory
+
+logger = logging.getLogger(__name__)
+
+ChunkSummary = Tuple[List[int], Dict[int, int]]  # wins per player and turns histogram
+
+
+@dataclass
+class CampaignResult:
+    seed: int
+    games: int = 0
+    wins: List[int] = field(default_factory=lambda: [0, 0])  # wins of player 1 and player 2
+    turns_histogram: Dict[int, int] = field(default_factory=dict)  # turns -> how many games took that many turns
+
+    @property
+    def win_rates(self) -> Tuple[float, float]:
+        if not self.games:
+            return 0.0, 0.0
+        return self.wins[0] / self.games, self.wins[1] / self.games
+
+    def merge_chunk(self, chunk_games: int, chunk_summary: ChunkSummary):
+        chunk_wins, chunk_turns_histogram = chunk_summary
+        self.games += chunk_games
+        self.wins = [wins + chunk_wins[index] for index, wins in enumerate(self.wins)]
+        for turns, games in chunk_turns_histogram.items():
+            self.turns_histogram[turns] = self.turns_histogram.get(turns, 0) + games
+
+
+def play_campaign_chunk(
+    game_option: GameOption,
+    seed: int,
+    first_game: int,
+    games: int,
+    length: int,
+    width: int,
+    strategy_factory: StrategyFactory = RandomStrategy,
+    results_directory: Optional[str] = None,
+    lockstep: bool = False,
+) -> ChunkSummary:
+    """
+    Play games `first_game` up to `first_game + games` of a campaign, returning only their summary. The summary of
+    every game is also written to `results_directory` when given, in files named after `first_game`.
+
+    With `lockstep`, the whole chunk is played at once by `lockstep.simulate_lockstep`, seeded from `first_game`.
+    """
+    if lockstep:
+        chunk_seed = derive_game_seed(seed, first_game)
+        winners, turns, _ = simulate_lockstep(
+            game_option, games, chunk_seed, length=length, width=width, strategy_factory=strategy_factory
+        )
+        wins = np.bincount(winners, minlength=3)[1:].tolist()
+        turns_values, turns_games = np.unique(turns, return_counts=True)
+        return wins, dict(zip(turns_values.tolist(), turns_games.tolist()))
+
+    results_sink = None
+    if results_directory:
+        results_sink = ResultsSink(
+            results_directory,
+            count_fleet_ships(game_option),
+            chunk_size=games,
+            prefix=f"{DEFAULT_PREFIX}-{first_game:012d}",
+        )
+
+    results = simulate_batch(
+        game_option,
+        partial(generate_random_fleets, game_option, length, width),
+        games,
+        seed,
+        length=length,
+        width=width,
+        first_game=first_game,
+        strategy_factory=strategy_factory,
+        results_sink=results_sink,
+    )
+
+    wins = [0, 0]
+    for result in results:
+        wins[result.winner - 1] += 1
+    return wins, dict(Counter(result.turns for result in results))
+
+
+def run_campaign(
+    games: int,
+    seed: Optional[int] = None,
+    *,
+    game_option: Optional[GameOption] = None,
+    workers: int = 1,
+    chunk_size: int = 1000,
+    length: int = 10,
+    width: int = 10,
+    strategy_factory: StrategyFactory = RandomStrategy,
+    results_directory: Optional[str] = None,
+    lockstep: bool = False,
+) -> CampaignResult:
+    """
+    Play `games` headless games with random fleets, spreading chunks of `chunk_size` games over `workers` processes.
+
+    Every game gets its own seed derived from the master `seed` and the game number (see `derive_game_seed`), so
+    the result is the same for the same master seed no matter how many workers are used.
+
+    With `results_directory`, the summary of every game is kept there as columnar chunks (see `results.load_results`).
+
+    With `lockstep`, each chunk is played as NumPy batches (see `lockstep`), tens of times faster but only for the
+    strategies in `lockstep.LOCKSTEP_STRATEGIES`. The games then depend on `chunk_size` too, and the per-game
+    summaries of `results_directory` aren't available.
+    """
+    if lockstep and results_directory:
+        raise ValueError("Per-game results aren't recorded by lockstep campaigns")
+    if lockstep and strategy_factory not in LOCKSTEP_STRATEGIES:
+        raise ValueError(f"No lockstep version of {strategy_factory.__name__}")
+    if seed is None:
+        seed = Random().getrandbits(64)
+    game_option = game_option or DEFAULT_GAME_OPTION
+    chunks = [(first_game, min(chunk_size, games - first_game)) for first_game in range(0, games, chunk_size)]
+    logger.info("Running campaign of %s games (%s chunks) with seed %s", games, len(chunks), seed)
+
+    chunk_arguments = [
+        (game_option, seed, first_game, chunk_games, length, width, strategy_factory, results_directory, lockstep)
+        for first_game, chunk_games in chunks
+    ]
+    result = CampaignResult(seed)
+
+    if workers <= 1:
+        for arguments in chunk_arguments:
+            result.merge_chunk(arguments[3], play_campaign_chunk(*arguments))
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries = executor.map(play_campaign_chunk, *zip(*chunk_arguments))
+        for arguments, summary in zip(chunk_arguments, summaries):
+            result.merge_chunk(arguments[3], summary)
+
+    return result
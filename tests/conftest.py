@@ -0,0 +1,53 @@
+from random import Random
+
+import pytest
+
+from naval_warfare.fleet import generate_random_fleets
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.models import Position
+from naval_warfare.models import ShipDirection
+from naval_warfare.replay import ReplayWriter
+from naval_warfare.simulation import simulate
+
+
+@pytest.fixture
+def player_1_placements():
+    """The fleet of the first player of `games/game_1.in`."""
+    return [
+        ("AIR", Position(0, 1), ShipDirection.H),
+        ("BTL", Position(4, 5), ShipDirection.V),
+        ("SUB", Position(2, 3), ShipDirection.V),
+        ("DES", Position(9, 4), ShipDirection.H),
+        ("PTL", Position(4, 8), ShipDirection.V),
+    ]
+
+
+@pytest.fixture
+def player_2_placements():
+    """The fleet of the second player of `games/game_1.in`."""
+    return [
+        ("AIR", Position(1, 9), ShipDirection.V),
+        ("BTL", Position(0, 4), ShipDirection.H),
+        ("SUB", Position(1, 4), ShipDirection.V),
+        ("DES", Position(8, 1), ShipDirection.H),
+        ("PTL", Position(5, 5), ShipDirection.V),
+    ]
+
+
+@pytest.fixture
+def record_games():
+    """Play a game with random fleets per seed, writing them on a replay stream and returning their events."""
+
+    def record(stream, seeds):
+        writer, events = ReplayWriter(stream), []
+
+        def record_event(event):
+            events.append(event)
+            writer(event)
+
+        for seed in seeds:
+            placements = generate_random_fleets(DEFAULT_GAME_OPTION, rng=Random(seed))
+            simulate(DEFAULT_GAME_OPTION, placements, seed, event_hook=record_event)
+        return events
+
+    return record
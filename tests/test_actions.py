@@ -1,6 +1,9 @@
+import logging
+
 import pytest
 
 from naval_warfare.actions import bomb_position
+from naval_warfare.actions import bomb_position_quietly
 from naval_warfare.actions import place_ship_on_board
 from naval_warfare.exceptions import CannotBombPosition
 from naval_warfare.models import Board2D
@@ -85,3 +88,29 @@ def test_shouldnt_bomb_a_position_outside_the_board():
 
     with pytest.raises(CannotBombPosition):
         bomb_position(board, position)
+
+
+def test_should_bomb_quietly_with_the_same_outcome_and_without_logging(caplog):
+    board, ship = Board2D(4, 4), Ship("patrol-ship", 2)
+    place_ship_on_board(ship, board, Position(0, 0), ShipDirection.H)
+
+    with caplog.at_level(logging.INFO):
+        outcomes = [bomb_position_quietly(board, Position(0, j)) for j in range(3)]
+
+    assert outcomes == [(True, False), (True, True), (False, False)]
+    assert not caplog.records
+
+    with pytest.raises(CannotBombPosition):
+        bomb_position_quietly(board, Position(0, 0))
+
+
+def test_should_only_log_bombs_when_info_level_is_enabled(caplog):
+    board = Board2D(4, 4)
+
+    with caplog.at_level(logging.WARNING):
+        bomb_position(board, Position(0, 0))
+    assert not caplog.records
+
+    with caplog.at_level(logging.INFO):
+        bomb_position(board, Position(0, 1))
+    assert len(caplog.records) == 2
@@ -0,0 +1,81 @@
+from naval_warfare.benchmark import BOARD_FACTORIES
+from naval_warfare.benchmark import SCENARIOS
+from naval_warfare.benchmark import BenchmarkResult
+from naval_warfare.benchmark import compare_with_baseline
+from naval_warfare.benchmark import load_baseline
+from naval_warfare.benchmark import main
+from naval_warfare.benchmark import measure_allocated_bytes
+from naval_warfare.benchmark import measure_board_memory
+from naval_warfare.benchmark import measure_peak_bytes
+from naval_warfare.benchmark import run_benchmarks
+from naval_warfare.benchmark import run_scenario
+from naval_warfare.benchmark import save_baseline
+from naval_warfare.numpy_board import NumpyBoard2D
+
+
+def test_should_measure_the_bytes_allocated_by_a_function():
+    assert measure_allocated_bytes(lambda: bytearray(100_000)) >= 100_000
+    assert measure_allocated_bytes(lambda: None) < 1_000
+
+
+def test_should_keep_the_board_memory_per_position_small():
+    assert measure_board_memory(100, 100) / (100 * 100) < 64
+    assert measure_board_memory(100, 100, NumpyBoard2D) / (100 * 100) < 4
+
+
+def test_should_show_the_board_memory_of_every_board(capsys):
+    assert main(["--board-memory", "--sizes", "10", "20"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split(":")[0] for line in lines] == [
+        f"{board_factory.__name__} {size}x{size}" for board_factory in BOARD_FACTORIES for size in (10, 20)
+    ]
+
+
+def test_should_measure_the_peak_of_bytes_allocated_by_a_function():
+    assert measure_peak_bytes(lambda: len(bytearray(100_000))) >= 100_000
+
+
+def test_should_run_a_scenario_at_least_once():
+    result = run_scenario(SCENARIOS["self-play game"], 10, min_time=0)
+
+    assert result.scenario == "self-play game"
+    assert result.size == 10
+    assert result.ops_per_second > 0
+    assert result.peak_bytes > 0
+
+
+def test_should_leave_crowded_boards_out_of_the_benchmarks():
+    results = run_benchmarks(sizes=[10, 20], fleet_scales=[1, 10], scenarios=["bomb"], min_time=0)
+
+    assert [(result.size, result.fleet_scale) for result in results] == [(10, 1), (20, 1), (20, 10)]
+
+
+def test_should_report_scenarios_slower_than_the_baseline(tmp_path):
+    baseline_path = str(tmp_path / "baseline.json")
+    save_baseline(
+        [BenchmarkResult("bomb", 10, 1, 1000.0, 0), BenchmarkResult("bomb", 100, 1, 1000.0, 0)], baseline_path
+    )
+    results = [
+        BenchmarkResult("bomb", 10, 1, 950.0, 0),
+        BenchmarkResult("bomb", 100, 1, 850.0, 0),
+        BenchmarkResult("bomb", 1000, 1, 1.0, 0),
+    ]
+
+    regressions = compare_with_baseline(results, load_baseline(baseline_path), max_slowdown=0.1)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("bomb 100x100 fleet x1")
+
+
+def test_should_fail_the_benchmark_run_when_slower_than_the_baseline(tmp_path):
+    baseline_path = str(tmp_path / "baseline.json")
+    arguments = ["--sizes", "10", "--fleet-scales", "1", "--scenarios", "allocate board", "--min-time", "0"]
+
+    assert main(arguments + ["--save", baseline_path]) == 0
+    baseline = load_baseline(baseline_path)
+    save_baseline(
+        [result._replace(ops_per_second=result.ops_per_second * 100) for result in baseline.values()], baseline_path
+    )
+
+    assert main(arguments + ["--compare", baseline_path]) == 1
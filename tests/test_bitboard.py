@@ -0,0 +1,95 @@
+from random import Random
+
+import pytest
+
+from naval_warfare.actions import bomb_position
+from naval_warfare.actions import place_ship_on_board
+from naval_warfare.bitboard import BitBoard
+from naval_warfare.bitboard import bomb_bitboard_position
+from naval_warfare.bitboard import has_bitboard_all_ships_destroyed
+from naval_warfare.bitboard import is_bitboard_ship_destroyed
+from naval_warfare.board import has_all_ships_destroyed
+from naval_warfare.exceptions import CannotBombPosition
+from naval_warfare.exceptions import CannotOccupyPositions
+from naval_warfare.fleet import generate_random_fleet
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.models import Board2D
+from naval_warfare.models import Position
+from naval_warfare.models import PositionStatus
+from naval_warfare.models import Ship
+from naval_warfare.models import ShipDirection
+from naval_warfare.scheduler import TargetScheduler
+from naval_warfare.simulation import simulate
+
+
+def test_should_place_ships_on_the_bitboard_masks():
+    board, ship_1, ship_2 = BitBoard(3, 4), Ship("destroyer", 3), Ship("patrol-ship", 2)
+
+    place_ship_on_board(ship_1, board, Position(0, 1), ShipDirection.H)
+    place_ship_on_board(ship_2, board, Position(1, 0), ShipDirection.V)
+
+    assert board.ship_masks == [0b1110, 0b000100010000]
+    assert board.occupied == 0b000100011110
+    assert board.ship_at(Position(0, 3)) is ship_1
+    assert board.ship_at(Position(2, 0)) is ship_2
+    assert board.ship_at(Position(2, 1)) is None
+    assert board.status_at(Position(1, 0)) == PositionStatus.OCCUPIED
+    assert board.ships_afloat == 2
+
+    with pytest.raises(CannotOccupyPositions):
+        place_ship_on_board(Ship("patrol-ship", 2), board, Position(2, 0), ShipDirection.H)
+    with pytest.raises(CannotOccupyPositions):
+        place_ship_on_board(Ship("patrol-ship", 2), board, Position(2, 3), ShipDirection.V)
+
+
+def test_should_bomb_a_bitboard_until_the_fleet_is_destroyed():
+    board, ship = BitBoard(4, 4), Ship("patrol-ship", 2)
+    place_ship_on_board(ship, board, Position(2, 2), ShipDirection.V)
+
+    assert bomb_bitboard_position(board, Position(0, 0)) == (False, False)
+    assert bomb_bitboard_position(board, Position(2, 2)) == (True, False)
+    assert not is_bitboard_ship_destroyed(board, 0)
+    assert bomb_bitboard_position(board, Position(3, 2)) == (True, True)
+
+    assert is_bitboard_ship_destroyed(board, 0)
+    assert has_bitboard_all_ships_destroyed(board)
+    assert has_all_ships_destroyed(board)
+    assert ship.hits_taken == 2
+    assert str(board) == "B O O O\nO O O O\nO O B O\nO O B O"
+
+    with pytest.raises(CannotBombPosition):
+        bomb_bitboard_position(board, Position(3, 2))
+    with pytest.raises(CannotBombPosition):
+        bomb_bitboard_position(board, Position(0, 4))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_should_return_the_same_bomb_outcomes_as_the_list_board(seed: int):
+    rng = Random(seed)
+    boards = Board2D(10, 10), BitBoard(10, 10), BitBoard(10, 10)
+    for ship_slug, position, direction in generate_random_fleet(DEFAULT_GAME_OPTION, rng=rng):
+        for board in boards:
+            ship_option = DEFAULT_GAME_OPTION[ship_slug]
+            place_ship_on_board(Ship(ship_option["kind"], ship_option["length"]), board, position, direction)
+    scheduler = TargetScheduler(10, 10, rng)
+
+    outcomes = ([], [], [])
+    while not has_all_ships_destroyed(boards[0]):
+        position = scheduler.next_position()
+        outcomes[0].append(bomb_position(boards[0], position))
+        outcomes[1].append(bomb_bitboard_position(boards[1], position))
+        outcomes[2].append(bomb_position(boards[2], position))  # The generic path works on bitboards too
+
+    assert outcomes[0] == outcomes[1] == outcomes[2]
+    assert has_bitboard_all_ships_destroyed(boards[1]) and has_all_ships_destroyed(boards[1])
+    assert str(boards[0]) == str(boards[1]) == str(boards[2])
+
+
+def test_should_simulate_the_same_game_on_a_bitboard():
+    placements = generate_random_fleet(DEFAULT_GAME_OPTION, rng=Random(1)), generate_random_fleet(
+        DEFAULT_GAME_OPTION, rng=Random(2)
+    )
+
+    assert simulate(DEFAULT_GAME_OPTION, placements, seed=3) == simulate(
+        DEFAULT_GAME_OPTION, placements, seed=3, board_factory=BitBoard
+    )
@@ -2,9 +2,14 @@ import itertools
 
 import pytest
 
+from naval_warfare.board import bomb_board_position
 from naval_warfare.board import cannot_occupy_board_in_the_positions
+from naval_warfare.board import cannot_occupy_board_span
 from naval_warfare.board import has_all_ships_destroyed
+from naval_warfare.board import has_destroyed_ship_on_position
+from naval_warfare.board import is_ship_span_inside_the_board
 from naval_warfare.board import occupy_board_positions_with_ship
+from naval_warfare.board import occupy_board_span_with_ship
 from naval_warfare.board import retrieve_affected_positions
 from naval_warfare.exceptions import CannotOccupyPositions
 from naval_warfare.exceptions import UnknownDirection
@@ -14,6 +19,7 @@ from naval_warfare.models import Position
 from naval_warfare.models import PositionStatus
 from naval_warfare.models import Ship
 from naval_warfare.models import ShipDirection
+from naval_warfare.numpy_board import NumpyBoard2D
 
 
 def test_should_return_false_when_board_has_all_positions_free():
@@ -98,17 +104,106 @@ def test_should_raise_exception_that_cannot_occupy_board_position():
 
 def test_should_return_true_when_all_ships_from_a_board_was_destroyed():
     board, ship = Board2D(4, 4), Ship("destroyer", 3)
+    occupy_board_positions_with_ship(board, [Position(0, j) for j in range(3)], ship)
 
-    ship.hits_taken = 3  # Ship destroyed
-    board.ships.append(ship)  # Append ship to the board
+    for j in range(3):  # Ship destroyed
+        bomb_board_position(board, Position(0, j))
+        has_destroyed_ship_on_position(board, Position(0, j))
 
     assert has_all_ships_destroyed(board)
+    assert board.ships_afloat == 0
 
 
 def test_should_return_false_when_theres_a_not_destroyed_ship_on_board():
     board, ship = Board2D(4, 4), Ship("destroyer", 3)
+    occupy_board_positions_with_ship(board, [Position(0, j) for j in range(3)], ship)
 
-    ship.hits_taken = 2  # Ship almost destroyed
-    board.ships.append(ship)  # Append ship to the board
+    for j in range(2):  # Ship almost destroyed
+        bomb_board_position(board, Position(0, j))
+        has_destroyed_ship_on_position(board, Position(0, j))
 
     assert not has_all_ships_destroyed(board)
+    assert board.ships_afloat == 1
+
+
+def test_should_count_each_destroyed_ship_only_once():
+    board = Board2D(4, 4)
+    occupy_board_positions_with_ship(board, [Position(0, 0)], Ship("patrol-ship", 1))
+    occupy_board_positions_with_ship(board, [Position(1, 0)], Ship("patrol-ship", 1))
+
+    assert has_destroyed_ship_on_position(board, Position(0, 0))
+    assert has_destroyed_ship_on_position(board, Position(0, 0))  # Extra hits on an already destroyed ship
+
+    assert board.ships_afloat == 1
+    assert not has_all_ships_destroyed(board)
+
+
+@pytest.mark.parametrize(
+    "positions",
+    [[], [Position(0, 0), Position(0, 2)], [Position(0, 0), Position(1, 1)], [Position(0, 1), Position(0, 0)]],
+)
+def test_should_raise_exception_when_positions_are_not_a_single_span(positions):
+    board = Board2D(4, 4)
+
+    with pytest.raises(CannotOccupyPositions):
+        occupy_board_positions_with_ship(board, positions, Ship("destroyer", 3))
+    assert board.ships == []
+
+
+@pytest.mark.parametrize("board_factory", [Board2D, NumpyBoard2D])
+def test_should_occupy_vertical_positions_as_a_span(board_factory):
+    board, ship = board_factory(4, 4), Ship("destroyer", 3)
+
+    occupy_board_positions_with_ship(board, [Position(i, 2) for i in range(1, 4)], ship)
+
+    assert [board.ship_at(Position(i, 2)) for i in range(4)] == [None, ship, ship, ship]
+    assert board.ships_afloat == 1
+
+
+@pytest.mark.parametrize(
+    "front_position,direction,expected",
+    [
+        (Position(0, 0), ShipDirection.H, True),
+        (Position(3, 1), ShipDirection.H, True),
+        (Position(3, 2), ShipDirection.H, False),
+        (Position(1, 3), ShipDirection.V, True),
+        (Position(2, 3), ShipDirection.V, False),
+        (Position(-1, 0), ShipDirection.V, False),
+    ],
+)
+def test_should_check_if_a_ship_span_is_inside_the_board(front_position: Position, direction, expected: bool):
+    assert is_ship_span_inside_the_board(Board2D(4, 4), 3, front_position, direction) == expected
+
+
+def test_should_raise_exception_for_unknown_direction_on_a_ship_span():
+    with pytest.raises(UnknownDirection):
+        is_ship_span_inside_the_board(Board2D(4, 4), 2, Position(1, 1), "unknown_direction")
+
+
+@pytest.mark.parametrize("direction", [ShipDirection.H, ShipDirection.V])
+def test_should_return_true_when_a_ship_span_has_a_position_that_isnt_free(direction):
+    board = Board2D(4, 4)
+
+    board.chart[2][2] = BoardPosition(PositionStatus.BOMBED)
+
+    assert cannot_occupy_board_span(
+        board, 3, Position(2, 0) if direction == ShipDirection.H else Position(0, 2), direction
+    )
+    assert not cannot_occupy_board_span(board, 2, Position(0, 0), direction)
+
+
+@pytest.mark.parametrize("board_factory", [Board2D, NumpyBoard2D])
+@pytest.mark.parametrize("direction", [ShipDirection.H, ShipDirection.V])
+def test_should_occupy_a_ship_span_with_ship(board_factory, direction):
+    board, ship = board_factory(4, 4), Ship("destroyer", 3)
+
+    occupy_board_span_with_ship(board, Position(1, 1), direction, ship)
+
+    positions = retrieve_affected_positions(ship.length, Position(1, 1), direction)
+    assert all(board.status_at(position) == PositionStatus.OCCUPIED for position in positions)
+    assert all(board.ship_at(position) is ship for position in positions)
+    assert sum(board.status_at(Position(i, j)) == PositionStatus.OCCUPIED for i in range(4) for j in range(4)) == 3
+    assert board.ships == [ship]
+
+    with pytest.raises(CannotOccupyPositions):
+        occupy_board_span_with_ship(board, Position(1, 0), ShipDirection.H, Ship("patrol-ship", 2))
@@ -0,0 +1,56 @@
+import io
+
+import pytest
+
+from naval_warfare.actions import bomb_position
+from naval_warfare.bitboard import BitBoard
+from naval_warfare.checkpoint import create_checkpoint
+from naval_warfare.checkpoint import dump_checkpoint
+from naval_warfare.checkpoint import load_checkpoint
+from naval_warfare.checkpoint import restore_checkpoint
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import Game
+from naval_warfare.models import Board2D
+from naval_warfare.models import Position
+from naval_warfare.numpy_board import NumpyBoard2D
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.sparse_board import SparseBoard
+
+
+def prepare_game_in_progress(player_1_placements, player_2_placements) -> Game:
+    player_1, player_2 = (
+        prepare_headless_player(name, DEFAULT_GAME_OPTION, placements)
+        for name, placements in (("Player 1", player_1_placements), ("Player 2", player_2_placements[:3]))
+    )
+    for position in (Position(0, 1), Position(0, 2), Position(9, 9)):
+        bomb_position(player_1.board, position)
+    for position in (Position(5, 5), Position(6, 5)):
+        bomb_position(player_2.board, position)
+    return Game(player_1, player_2)
+
+
+@pytest.mark.parametrize("board_factory", [Board2D, NumpyBoard2D, BitBoard, SparseBoard])
+def test_should_resume_a_game_from_its_serialized_checkpoint(board_factory, player_1_placements, player_2_placements):
+    game = prepare_game_in_progress(player_1_placements, player_2_placements)
+    stream = io.StringIO()
+
+    dump_checkpoint(create_checkpoint(game), stream)
+    stream.seek(0)
+    resumed_game = restore_checkpoint(load_checkpoint(stream), board_factory)
+
+    for player, resumed_player in zip(game.players, resumed_game.players):
+        assert resumed_player.name == player.name
+        assert resumed_player.placements == player.placements
+        assert resumed_player.game_option == player.game_option
+        assert str(resumed_player.board) == str(player.board)
+        assert resumed_player.remaining_ships == player.remaining_ships
+        assert [ship.hits_taken for ship in resumed_player.board.ships] == [
+            ship.hits_taken for ship in player.board.ships
+        ]
+
+
+def test_should_keep_the_original_game_option_in_the_checkpoint(player_1_placements, player_2_placements):
+    checkpoint = create_checkpoint(prepare_game_in_progress(player_1_placements, player_2_placements))
+
+    assert checkpoint["game_option"] == DEFAULT_GAME_OPTION
+    assert checkpoint["players"][1]["bombed"] == [[5, 5], [6, 5]]
@@ -0,0 +1,89 @@
+import subprocess
+import sys
+
+import pytest
+
+from naval_warfare.cli import BOARD_FACTORIES
+from naval_warfare.cli import PLAY_IMPORT_BUDGET_MS
+from naval_warfare.cli import STRATEGY_NAMES
+from naval_warfare.cli import load_board_factory
+from naval_warfare.cli import main
+from naval_warfare.strategies import STRATEGIES
+
+
+def measure_imports(code: str):
+    """Cumulative microseconds of each top-level import of `code`, from `python -X importtime`."""
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    imports = {}
+    for line in completed.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  ") and cumulative.strip().isdigit():  # Nested imports are indented
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def test_should_import_what_play_needs_within_the_budget():
+    baseline = measure_imports("pass")
+    best_ms = min(
+        sum(cumulative for name, cumulative in imports.items() if name not in baseline) / 1000
+        for imports in (measure_imports("import naval_warfare.cli, naval_warfare.game") for _ in range(3))
+    )
+
+    assert best_ms < PLAY_IMPORT_BUDGET_MS
+
+
+def test_should_leave_heavy_modules_out_of_play():
+    code = "import sys, naval_warfare.cli, naval_warfare.game; print(sorted(sys.modules))"
+    modules = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    for heavy_module in ("numpy", "asyncio", "logging.config", "cProfile"):
+        assert f"'{heavy_module}'" not in modules
+
+
+def test_should_offer_every_strategy_and_board():
+    assert list(STRATEGY_NAMES) == list(STRATEGIES)
+    assert all(load_board_factory(name).__name__ == attribute for name, (_, attribute) in BOARD_FACTORIES.items())
+
+
+def test_should_simulate_a_campaign(capsys):
+    assert main(["simulate", "--games", "20", "--seed", "7", "--chunk-size", "5"]) == 0
+
+    seed, games, win_rates, mean_turns = capsys.readouterr().out.splitlines()
+    assert seed == "Seed: 7"
+    assert games == "Games: 20"
+    assert sum(float(rate) for rate in win_rates.split(": ")[1].split(" / ")) == pytest.approx(1)
+    assert float(mean_turns.split(": ")[1]) >= 2 * 17 - 1
+
+
+def test_should_compare_two_strategies(capsys):
+    assert main(["compare", "random", "density", "--seed", "3", "--min-games", "20", "--check-every", "20"]) == 0
+
+    games, difference, wall_time = capsys.readouterr().out.splitlines()
+    assert 20 <= int(games.split(": ")[1]) < 1_000_000
+    assert difference.endswith("(significant)")
+    assert wall_time.startswith("Wall time: ")
+
+
+def test_should_summarize_the_games_of_a_replay_file(tmp_path, capsys, record_games):
+    path = tmp_path / "games.replay"
+    with open(path, "wb") as replay_file:
+        record_games(replay_file, [1, 2])
+
+    assert main(["replay", str(path), "--board", "bit"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split(":")[0] for line in lines] == ["Game 1", "Game 2"]
+    assert all(" won after " in line for line in lines)
+
+
+def test_should_fail_on_an_invalid_replay_file(tmp_path, capsys):
+    path = tmp_path / "games.replay"
+    path.write_bytes(b"not a replay")
+
+    assert main(["replay", str(path)]) == 1
+    assert "Invalid replay" in capsys.readouterr().err
+
+
+def test_should_forward_the_arguments_to_the_benchmarks(capsys):
+    assert main(["bench", "--board-memory", "--sizes", "10"]) == 0
+    assert "10" in capsys.readouterr().out
@@ -0,0 +1,66 @@
+import statistics
+from random import Random
+
+import pytest
+
+from naval_warfare.comparison import RunningDifference
+from naval_warfare.comparison import compare_strategies
+from naval_warfare.comparison import play_paired_attacks
+from naval_warfare.comparison import prepare_paired_defender
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.models import Board2D
+from naval_warfare.strategies import ProbabilityDensityStrategy
+from naval_warfare.strategies import RandomStrategy
+
+
+def test_should_keep_the_running_mean_and_variance_of_the_differences():
+    rng = Random(1)
+    values = [rng.randint(-30, 30) for _ in range(200)]
+    differences = RunningDifference()
+    for value in values:
+        differences.add(value)
+
+    assert differences.count == 200
+    assert differences.mean == pytest.approx(statistics.fmean(values))
+    assert differences.variance == pytest.approx(statistics.variance(values))
+    low, high = differences.confidence_interval(1.96)
+    assert high - low == pytest.approx(2 * 1.96 * statistics.stdev(values) / 200**0.5)
+
+
+def test_should_attack_the_same_fleet_with_the_same_random_stream():
+    defender = prepare_paired_defender(DEFAULT_GAME_OPTION, 10, 10, Board2D, Random(2))
+    board_before = str(defender.board)
+
+    shots_a, shots_b = play_paired_attacks(defender, RandomStrategy, RandomStrategy, attack_seed=3)
+
+    assert shots_a == shots_b >= 17
+    assert str(defender.board) != board_before
+
+
+def test_should_stop_as_soon_as_the_difference_is_significant():
+    result = compare_strategies(
+        RandomStrategy, ProbabilityDensityStrategy, seed=4, min_games=20, check_every=20, max_games=100_000
+    )
+
+    assert result.is_significant
+    assert result.games < 200
+    assert result.mean_difference > result.confidence_interval[0] > 0  # The density strategy sinks fleets faster
+    assert result.saved_seconds > result.elapsed_seconds
+
+
+def test_should_play_every_game_when_the_strategies_are_the_same():
+    result = compare_strategies(RandomStrategy, RandomStrategy, seed=5, min_games=10, check_every=10, max_games=40)
+
+    assert not result.is_significant
+    assert result.games == 40
+    assert result.mean_difference == 0
+    assert result.saved_seconds == 0
+
+
+def test_should_compare_the_same_games_given_the_same_seed():
+    options = dict(seed=6, min_games=5, check_every=5, max_games=30)
+    result = compare_strategies(ProbabilityDensityStrategy, RandomStrategy, **options)
+    same_result = compare_strategies(ProbabilityDensityStrategy, RandomStrategy, **options)
+
+    assert (result.games, result.mean_difference) == (same_result.games, same_result.mean_difference)
+    assert result.confidence_interval == same_result.confidence_interval
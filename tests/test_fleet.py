@@ -0,0 +1,76 @@
+from random import Random
+
+import pytest
+
+from naval_warfare.exceptions import CannotOccupyPositions
+from naval_warfare.fleet import generate_random_fleet
+from naval_warfare.fleet import search_random_fleet
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import AvailableShip
+from naval_warfare.game import GameOption
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.simulation import simulate_batch
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_should_generate_a_fleet_that_can_be_placed_on_the_board(seed: int):
+    placements = generate_random_fleet(DEFAULT_GAME_OPTION, 10, 10, Random(seed))
+
+    player = prepare_headless_player("player_1", DEFAULT_GAME_OPTION, placements)
+
+    assert sorted(ship_slug for ship_slug, _, _ in placements) == sorted(DEFAULT_GAME_OPTION)
+    assert len(player.board.ships) == 5
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_should_fill_a_crowded_board_going_back_from_dead_ends(seed: int):
+    game_option: GameOption = {"DES": AvailableShip(kind="destroyer", length=3, quantity=4)}
+
+    placements = generate_random_fleet(game_option, 3, 4, Random(seed))
+
+    player = prepare_headless_player("player_1", game_option, placements, length=3, width=4)
+    assert len(player.board.ships) == 4
+
+
+def test_should_search_the_fleets_that_fit_a_crowded_board():
+    game_option: GameOption = {
+        "SUB": AvailableShip(kind="submarine", length=3, quantity=2),
+        "PTL": AvailableShip(kind="patrol-ship", length=2, quantity=3),
+    }
+    ships = [("SUB", 3), ("SUB", 3), ("PTL", 2), ("PTL", 2), ("PTL", 2)]
+
+    fleets = {tuple(search_random_fleet(ships, 3, 4, Random(seed))) for seed in range(200)}
+
+    for placements in fleets:
+        player = prepare_headless_player("player_1", game_option, list(placements), length=3, width=4)
+        assert len(player.board.ships) == 5
+    assert len(fleets) > 1
+
+
+def test_should_raise_exception_when_no_fleet_fits_a_crowded_board():
+    game_option: GameOption = {"DES": AvailableShip(kind="destroyer", length=3, quantity=3)}
+
+    with pytest.raises(CannotOccupyPositions):
+        generate_random_fleet(game_option, 2, 4, Random(1))  # More positions than the board has
+    with pytest.raises(CannotOccupyPositions):
+        generate_random_fleet(game_option, 2, 5, Random(1))  # A single destroyer fits on each row
+
+
+def test_should_raise_exception_when_a_ship_doesnt_fit_the_board():
+    with pytest.raises(CannotOccupyPositions):
+        generate_random_fleet(DEFAULT_GAME_OPTION, 4, 4, Random(1))
+
+
+def test_should_generate_the_same_fleet_given_the_same_seed():
+    assert generate_random_fleet(DEFAULT_GAME_OPTION, rng=Random(9)) == generate_random_fleet(
+        DEFAULT_GAME_OPTION, rng=Random(9)
+    )
+
+
+def test_should_simulate_games_with_generated_fleets():
+    def generate_fleets(rng: Random):
+        return generate_random_fleet(DEFAULT_GAME_OPTION, rng=rng), generate_random_fleet(DEFAULT_GAME_OPTION, rng=rng)
+
+    results = simulate_batch(DEFAULT_GAME_OPTION, generate_fleets, 10, seed=1)
+
+    assert all(result.winner in (1, 2) for result in results)
@@ -1,22 +1,40 @@
+import sys
+import time
+from random import Random
+
 import pytest
 
+from naval_warfare.actions import BombOutcome
+from naval_warfare.actions import bomb_position
+from naval_warfare.actions import place_ship_on_board
+from naval_warfare.bitboard import BitBoard
+from naval_warfare.events import BattleStarted
 from naval_warfare.exceptions import CannotOccupyPositions
 from naval_warfare.exceptions import InputWithError
+from naval_warfare.exceptions import NoSnapshotToRestore
 from naval_warfare.exceptions import UnavailableShip
 from naval_warfare.game import DEFAULT_GAME_OPTION
 from naval_warfare.game import AvailableShip
 from naval_warfare.game import Game
 from naval_warfare.game import GameOption
 from naval_warfare.game import Player
+from naval_warfare.game import get_random_position
 from naval_warfare.game import has_all_ships_destroyed
 from naval_warfare.game import parse_line_input
 from naval_warfare.game import place_ship
+from naval_warfare.game import prepare_game
 from naval_warfare.game import retrieve_available_ships
+from naval_warfare.game import start
+from naval_warfare.models import Board2D
 from naval_warfare.models import BoardPosition
 from naval_warfare.models import Position
 from naval_warfare.models import PositionStatus
 from naval_warfare.models import Ship
 from naval_warfare.models import ShipDirection
+from naval_warfare.numpy_board import NumpyBoard2D
+from naval_warfare.placements import attach_placement_index
+from naval_warfare.sparse_board import SparseBoard
+from naval_warfare.stats import GameStats
 
 
 def test_should_return_game_has_ended_when_all_board_players_has_all_ships_destroyed():
@@ -35,7 +53,7 @@ def test_should_return_game_has_ended_when_one_board_player_has_all_ships_destro
         "player_2", game_option=DEFAULT_GAME_OPTION
     )
     game = Game(player_1, player_2)
-    player_1.board.ships.append(Ship("destroyer", 3))
+    place_ship_on_board(Ship("destroyer", 3), player_1.board, Position(0, 0), ShipDirection.H)
 
     assert not has_all_ships_destroyed(player_1.board)
     assert has_all_ships_destroyed(player_2.board)
@@ -48,8 +66,8 @@ def test_should_return_game_hasnt_ended_when_board_players_has_ships_not_destroy
     )
     game = Game(player_1, player_2)
 
-    player_1.board.ships.append(Ship("destroyer", 3))
-    player_2.board.ships.append(Ship("destroyer", 3))
+    place_ship_on_board(Ship("destroyer", 3), player_1.board, Position(0, 0), ShipDirection.H)
+    place_ship_on_board(Ship("destroyer", 3), player_2.board, Position(0, 0), ShipDirection.H)
 
     assert not has_all_ships_destroyed(player_1.board)
     assert not has_all_ships_destroyed(player_2.board)
@@ -165,3 +183,154 @@ def test_should_raise_exception_when_cannot_occupy_all_positions_from_board():
 
     with pytest.raises(CannotOccupyPositions):
         place_ship(player, game_option["DEF"], Position(0, 0), ShipDirection.H)
+
+
+@pytest.mark.parametrize("length,width", [(1, 1), (2, 3)])
+def test_should_only_return_random_positions_inside_the_board(length: int, width: int):
+    positions = {get_random_position(length, width, Random(seed)) for seed in range(100)}
+
+    assert positions == {Position(i, j) for i in range(length) for j in range(width)}
+
+
+def test_should_count_the_remaining_ships_of_a_player():
+    player = Player("player_1", game_option=DEFAULT_GAME_OPTION)
+    place_ship(player, player.game_option["PTL"], Position(0, 0), ShipDirection.H)
+    place_ship(player, player.game_option["DES"], Position(1, 0), ShipDirection.H)
+
+    bomb_position(player.board, Position(0, 0))
+    bomb_position(player.board, Position(0, 1))
+
+    assert player.remaining_ships_count == 1
+    assert player.remaining_ships == ["destroyer"]
+
+
+def test_should_emit_battle_events_when_starting_a_game_with_an_event_hook(capsys):
+    player_1, player_2 = Player("player_1", game_option=DEFAULT_GAME_OPTION), Player(
+        "player_2", game_option=DEFAULT_GAME_OPTION
+    )
+    place_ship(player_1, player_1.game_option["PTL"], Position(0, 0), ShipDirection.H)
+    place_ship(player_2, player_2.game_option["PTL"], Position(0, 0), ShipDirection.V)
+    events = []
+
+    start(Game(player_1, player_2), event_hook=events.append)
+
+    started, *shots, ended = events
+    assert started == BattleStarted(player_1, player_2)
+    assert len(shots) == ended.turns
+    assert f"Battle result: {ended.winner.name} won!" in capsys.readouterr().out
+
+
+def test_should_fill_the_game_stats_when_starting_an_instrumented_game(capsys):
+    player_1, player_2 = Player("player_1", game_option=DEFAULT_GAME_OPTION), Player(
+        "player_2", game_option=DEFAULT_GAME_OPTION
+    )
+    place_ship(player_1, player_1.game_option["PTL"], Position(0, 0), ShipDirection.H)
+    place_ship(player_2, player_2.game_option["PTL"], Position(0, 0), ShipDirection.V)
+    events = []
+
+    stats = start(Game(player_1, player_2, GameStats()), event_hook=events.append)
+
+    assert stats.shots == events[-1].turns
+    assert stats.shots == stats.misses + stats.hits
+    assert stats.sinks == 1
+    assert stats.battle_ns > stats.output_ns > 0
+
+
+def test_should_count_the_flushes_to_stdout_as_output_time(monkeypatch):
+    class SlowStream:
+        def write(self, text):
+            time.sleep(0.05)
+
+        def flush(self):
+            pass
+
+    player_1, player_2 = Player("player_1", game_option=DEFAULT_GAME_OPTION), Player(
+        "player_2", game_option=DEFAULT_GAME_OPTION
+    )
+    place_ship(player_1, player_1.game_option["PTL"], Position(0, 0), ShipDirection.H)
+    place_ship(player_2, player_2.game_option["PTL"], Position(0, 0), ShipDirection.V)
+    monkeypatch.setattr(sys, "stdout", SlowStream())
+
+    stats = start(Game(player_1, player_2, GameStats()))
+
+    assert stats.battle_ns > stats.output_ns >= 50_000_000
+
+
+def test_should_not_return_stats_when_starting_a_game_without_them(capsys):
+    player_1, player_2 = Player("player_1", game_option=DEFAULT_GAME_OPTION), Player(
+        "player_2", game_option=DEFAULT_GAME_OPTION
+    )
+    place_ship(player_1, player_1.game_option["PTL"], Position(0, 0), ShipDirection.H)
+    place_ship(player_2, player_2.game_option["PTL"], Position(0, 0), ShipDirection.V)
+
+    assert start(Game(player_1, player_2)) is None
+
+
+def test_should_count_rejected_placements_when_preparing_an_instrumented_game(monkeypatch, capsys):
+    game_option = {"PTL": AvailableShip(kind="patrol-ship", length=2, quantity=1)}
+    lines = iter(["PTL 0 0", "PTL 0 9 H", "PTL 0 0 H", "PTL 0 0 V"])
+    monkeypatch.setattr("builtins.input", lambda: next(lines))
+
+    game = prepare_game(game_option, GameStats())
+
+    assert game.stats.rejected_placements == 2
+    assert game.stats.placement_ns > 0
+    assert game.player_1.placements == [("PTL", Position(0, 0), ShipDirection.H)]
+
+
+@pytest.mark.parametrize("board_factory", [Board2D, NumpyBoard2D, BitBoard, SparseBoard])
+def test_should_restore_a_game_snapshot(board_factory):
+    player_1, player_2 = (
+        Player(name, game_option=DEFAULT_GAME_OPTION, board_factory=board_factory) for name in ("player_1", "player_2")
+    )
+    place_ship(player_1, player_1.game_option["PTL"], Position(0, 0), ShipDirection.H)
+    place_ship(player_2, player_2.game_option["PTL"], Position(0, 0), ShipDirection.V)
+    game = Game(player_1, player_2)
+    boards_before = [str(player.board) for player in game.players]
+    snapshot = game.snapshot()
+
+    place_ship(player_1, player_1.game_option["DES"], Position(5, 5), ShipDirection.V)
+    bomb_position(player_2.board, Position(0, 0))
+    bomb_position(player_2.board, Position(1, 0))
+    bomb_position(player_1.board, Position(5, 5))
+    assert game.has_ended
+
+    game.restore(snapshot)
+
+    assert [str(player.board) for player in game.players] == boards_before
+    assert not game.has_ended
+    assert player_1.placements == [("PTL", Position(0, 0), ShipDirection.H)]
+    assert retrieve_available_ships(player_1.game_option) == ["AIR", "BTL", "SUB", "DES"]
+    assert player_1.board.ship_at(Position(5, 5)) is None
+    assert bomb_position(player_2.board, Position(0, 0)) == BombOutcome(True, False)
+
+
+@pytest.mark.parametrize("board_factory", [Board2D, NumpyBoard2D, SparseBoard])
+def test_should_raise_exception_when_restoring_without_an_active_snapshot(board_factory):
+    board = board_factory(3, 3)
+    snapshot = board.snapshot()
+    board.discard_snapshots()
+
+    with pytest.raises(NoSnapshotToRestore):
+        board.restore(snapshot)
+    with pytest.raises(NoSnapshotToRestore):
+        board_factory(3, 3).restore(snapshot)
+
+
+@pytest.mark.parametrize("board_factory", [Board2D, NumpyBoard2D, BitBoard, SparseBoard])
+def test_should_detach_the_placement_index_when_restoring(board_factory):
+    board = board_factory(3, 3)
+    snapshot = board.snapshot()
+    attach_placement_index(board, [2])
+
+    board.restore(snapshot)
+
+    assert board.placement_index is None
+
+
+def test_should_not_share_the_game_option_between_players():
+    player = Player("player_1", game_option=DEFAULT_GAME_OPTION)
+
+    place_ship(player, player.game_option["PTL"], Position(0, 0), ShipDirection.H)
+
+    assert DEFAULT_GAME_OPTION["PTL"]["quantity"] == 1
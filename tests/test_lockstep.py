@@ -0,0 +1,193 @@
+from random import Random
+
+import numpy as np
+import pytest
+
+from naval_warfare.actions import bomb_position
+from naval_warfare.bitboard import BitBoard
+from naval_warfare.exceptions import CannotBombPosition
+from naval_warfare.exceptions import CannotOccupyPositions
+from naval_warfare.fleet import generate_random_fleets
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import AvailableShip
+from naval_warfare.lockstep import LockstepBoards
+from naval_warfare.lockstep import LockstepDensityStrategy
+from naval_warfare.lockstep import play_lockstep_battles
+from naval_warfare.lockstep import simulate_lockstep
+from naval_warfare.models import Position
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.simulation import simulate_batch
+from naval_warfare.strategies import ProbabilityDensityStrategy
+from naval_warfare.strategies import RandomStrategy
+
+
+def prepare_random_fleets(games, seed, length=10, width=10):
+    rng = Random(seed)
+    return [generate_random_fleets(DEFAULT_GAME_OPTION, length, width, rng) for _ in range(games)]
+
+
+def prepare_scalar_boards(boards, game):
+    return [
+        prepare_headless_player(
+            f"Player {player + 1}",
+            DEFAULT_GAME_OPTION,
+            boards.retrieve_placements(2 * game + player),
+            length=boards.length,
+            width=boards.width,
+        ).board
+        for player in (0, 1)
+    ]
+
+
+def test_should_bomb_positions_as_the_scalar_bomb_position():
+    boards = LockstepBoards(DEFAULT_GAME_OPTION, 6, 8, 12)
+    boards.place_random_fleets(np.random.default_rng(3))
+    scalar_boards = [board for game in range(6) for board in prepare_scalar_boards(boards, game)]
+    rng = np.random.default_rng(4)
+    orders = rng.random((12, 8 * 12)).argsort(axis=1)
+
+    for shot in range(8 * 12):
+        board_indexes = np.flatnonzero(rng.random(12) < 0.8)  # Not every board is bombed at every step
+        positions = orders[board_indexes, shot]
+        hits, destroyed = boards.bomb(board_indexes, positions)
+
+        for board_index, position, has_hit, has_destroyed in zip(board_indexes, positions, hits, destroyed):
+            outcome = bomb_position(scalar_boards[board_index], Position(*divmod(int(position), 12)))
+            assert (outcome.has_hit_something, outcome.has_destroyed_a_ship) == (has_hit, has_destroyed)
+
+    assert boards.ships_afloat.tolist() == [board.ships_afloat for board in scalar_boards]
+
+
+@pytest.mark.parametrize("strategy_factory", [RandomStrategy, ProbabilityDensityStrategy])
+def test_should_play_games_whose_shots_give_the_same_outcomes_on_scalar_boards(strategy_factory):
+    boards = LockstepBoards(DEFAULT_GAME_OPTION, 20)
+    boards.place_fleets(prepare_random_fleets(20, seed=5))
+    shot_records = []
+    results = play_lockstep_battles(boards, np.random.default_rng(6), strategy_factory, shot_records)
+
+    scalar_boards = [prepare_scalar_boards(boards, game) for game in range(20)]
+    shots, winners = np.zeros((20, 2), dtype=int), np.zeros(20, dtype=int)
+    for record in shot_records:
+        for game, position, has_hit, has_destroyed in zip(
+            record.games, record.positions, record.hits, record.destroyed
+        ):
+            assert not winners[game]  # Finished games don't shoot anymore
+            defender_board = scalar_boards[game][record.attacker ^ 1]
+            outcome = bomb_position(defender_board, Position(*divmod(int(position), 10)))
+            assert (outcome.has_hit_something, outcome.has_destroyed_a_ship) == (has_hit, has_destroyed)
+            shots[game, record.attacker] += 1
+            if not defender_board.ships_afloat:
+                winners[game] = record.attacker + 1
+
+    assert results.winners.tolist() == winners.tolist()
+    assert results.shots.tolist() == shots.tolist()
+    assert results.turns.tolist() == shots.sum(axis=1).tolist()
+
+
+def test_should_raise_exception_when_bombing_a_position_twice():
+    boards = LockstepBoards(DEFAULT_GAME_OPTION, 1)
+    boards.bomb(np.array([0]), np.array([42]))
+
+    with pytest.raises(CannotBombPosition):
+        boards.bomb(np.array([0]), np.array([42]))
+    with pytest.raises(CannotBombPosition):
+        boards.bomb(np.array([1]), np.array([100]))
+
+
+def test_should_place_the_given_fleets(player_1_placements, player_2_placements):
+    boards = LockstepBoards(DEFAULT_GAME_OPTION, 1)
+    boards.place_fleets([(player_1_placements, player_2_placements)])
+
+    assert sorted(boards.retrieve_placements(0)) == sorted(player_1_placements)
+    assert sorted(boards.retrieve_placements(1)) == sorted(player_2_placements)
+    assert boards.ships_afloat.tolist() == [5, 5]
+    assert np.count_nonzero(boards.ship_ids[0]) == 17
+
+
+def test_should_raise_exception_when_placing_overlapping_ships(player_1_placements, player_2_placements):
+    boards = LockstepBoards(DEFAULT_GAME_OPTION, 1)
+
+    with pytest.raises(CannotOccupyPositions):
+        boards.place_fleets([(player_1_placements, player_2_placements[:1] + player_1_placements[:1])])
+
+
+def test_should_place_whole_random_fleets_without_overlaps():
+    boards = LockstepBoards(DEFAULT_GAME_OPTION, 50, 7, 9)
+    boards.place_random_fleets(np.random.default_rng(8))
+
+    assert boards.ships_afloat.tolist() == [5] * 100
+    for board in range(100):
+        assert len(boards.retrieve_placements(board)) == 5
+        ship_ids, positions = np.unique(boards.ship_ids[board], return_counts=True)
+        assert dict(zip(ship_ids.tolist(), positions.tolist())) == {0: 7 * 9 - 17, 1: 5, 2: 4, 3: 3, 4: 3, 5: 2}
+
+
+def test_should_raise_exception_when_random_fleets_do_not_fit():
+    boards = LockstepBoards({"AIR": AvailableShip(kind="Aircraft carrier", length=5, quantity=1)}, 2, 4, 4)
+
+    with pytest.raises(CannotOccupyPositions):
+        boards.place_random_fleets(np.random.default_rng(1))
+
+
+def test_should_compute_the_density_of_the_placements_left():
+    boards = LockstepBoards(DEFAULT_GAME_OPTION, 3, 6, 7)
+    strategy = LockstepDensityStrategy(boards, 0, np.random.default_rng(2))
+    rng = np.random.default_rng(9)
+    strategy.free[...] = rng.random(strategy.free.shape) < 0.7
+    strategy.free_counts[...] = strategy.free
+    strategy.remaining[:, 0] = 0  # Game 0 has only the length 5 ship afloat
+    strategy.remaining[-1, 0] = 1
+
+    expected = np.zeros(strategy.free.shape, dtype=int)
+    for game in range(3):
+        for ship_length, quantity in zip(strategy.lengths, strategy.remaining[:, game]):
+            for x in range(6):
+                for y in range(7):
+                    if y + ship_length <= 7 and strategy.free[x, y : y + ship_length, game].all():
+                        expected[x, y : y + ship_length, game] += quantity > 0  # Each length afloat counts once
+                    if x + ship_length <= 6 and strategy.free[x : x + ship_length, y, game].all():
+                        expected[x : x + ship_length, y, game] += quantity > 0
+
+    assert strategy._compute_density().tolist() == expected.tolist()
+
+
+def test_should_give_the_win_to_player_1_when_both_fleets_are_empty():
+    game_option = {"PTL": AvailableShip(kind="Patrol boat", length=2, quantity=0)}
+    results = simulate_lockstep(game_option, 3, seed=1)
+
+    assert results.winners.tolist() == [1, 1, 1]
+    assert results.turns.tolist() == [0, 0, 0]
+
+
+@pytest.mark.parametrize("strategy_factory", [RandomStrategy, ProbabilityDensityStrategy])
+def test_should_simulate_the_same_games_given_the_same_seed(strategy_factory):
+    results = simulate_lockstep(DEFAULT_GAME_OPTION, 30, seed=4, strategy_factory=strategy_factory, batch_size=8)
+    same_results = simulate_lockstep(DEFAULT_GAME_OPTION, 30, seed=4, strategy_factory=strategy_factory, batch_size=8)
+
+    assert len(results.winners) == 30
+    assert set(results.winners.tolist()) <= {1, 2}
+    assert all(np.array_equal(column, same_column) for column, same_column in zip(results, same_results))
+    assert (results.shots[:, 0] - results.shots[:, 1] == (results.winners == 1)).all()
+    assert (results.shots.max(axis=1) >= 17).all()  # Needs at least one shot per ship position to win
+
+
+def test_should_sink_fleets_faster_with_the_density_strategy():
+    random_results = simulate_lockstep(DEFAULT_GAME_OPTION, 200, seed=3)
+    density_results = simulate_lockstep(DEFAULT_GAME_OPTION, 200, seed=3, strategy_factory=ProbabilityDensityStrategy)
+
+    assert density_results.turns.mean() < 0.6 * random_results.turns.mean()
+
+
+def test_should_play_the_density_strategy_as_strong_as_the_scalar_one():
+    lockstep_results = simulate_lockstep(DEFAULT_GAME_OPTION, 200, seed=5, strategy_factory=ProbabilityDensityStrategy)
+    scalar_results = simulate_batch(
+        DEFAULT_GAME_OPTION,
+        lambda rng: generate_random_fleets(DEFAULT_GAME_OPTION, 10, 10, rng),
+        200,
+        5,
+        board_factory=BitBoard,
+        strategy_factory=ProbabilityDensityStrategy,
+    )
+
+    scalar_mean_turns = sum(result.turns for result in scalar_results) / len(scalar_results)
+    assert lockstep_results.turns.mean() == pytest.approx(scalar_mean_turns, rel=0.06)
@@ -2,6 +2,10 @@ import pytest
 
 from naval_warfare.models import Board2D
 from naval_warfare.models import BoardPosition
+from naval_warfare.models import Position
+from naval_warfare.models import PositionStatus
+from naval_warfare.models import Ship
+from naval_warfare.models import ShipDirection
 
 
 @pytest.mark.parametrize("length,width", [(1, 1), (2, 3), (3, 2)])
@@ -14,3 +18,46 @@ def test_should_create_a_2d_board_with_the_given_length_and_width(length: int, w
     expected_chart = [[BoardPosition() for _ in range(width)] for _ in range(length)]
 
     assert board.chart == expected_chart
+
+
+def test_should_create_board_positions_and_ships_without_instance_dict():
+    ship = Ship("destroyer", 3)
+    board_position = BoardPosition(PositionStatus.OCCUPIED, ship)
+
+    assert not hasattr(ship, "__dict__")
+    assert not hasattr(board_position, "__dict__")
+    assert ship == Ship("destroyer", 3)
+    assert ship.hits_taken == 0
+    assert board_position == BoardPosition(PositionStatus.OCCUPIED, Ship("destroyer", 3))
+    assert BoardPosition() == BoardPosition(PositionStatus.FREE, None)
+
+
+def test_should_restore_a_board_snapshot_undoing_only_the_changed_positions():
+    board = Board2D(3, 3)
+    ship = Ship("destroyer", 2)
+    board.occupy_span(Position(0, 0), 2, ShipDirection.H, ship)
+    board.ships.append(ship)
+    board.ships_afloat = 1
+    snapshot = board.snapshot()
+
+    board.mark_bombed(Position(0, 0))
+    ship.hits_taken += 1
+    board.mark_bombed(Position(2, 2))
+    assert len(board._journal) == 2
+
+    board.restore(snapshot)
+
+    assert str(board) == "X X O\nO O O\nO O O"
+    assert ship.hits_taken == 0
+    assert board.ships_afloat == 1
+    assert board._journal == []
+
+
+def test_should_stop_journaling_once_snapshots_are_discarded():
+    board = Board2D(2, 2)
+    board.snapshot()
+
+    board.discard_snapshots()
+    board.mark_bombed(Position(0, 0))
+
+    assert board._journal is None
@@ -0,0 +1,95 @@
+import pytest
+
+from naval_warfare.actions import bomb_position
+from naval_warfare.actions import place_ship_on_board
+from naval_warfare.exceptions import CannotBombPosition
+from naval_warfare.exceptions import CannotOccupyPositions
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import Player
+from naval_warfare.game import place_ship
+from naval_warfare.models import Board2D
+from naval_warfare.models import BoardPosition
+from naval_warfare.models import Position
+from naval_warfare.models import PositionStatus
+from naval_warfare.models import Ship
+from naval_warfare.models import ShipDirection
+from naval_warfare.numpy_board import MAX_SHIPS
+from naval_warfare.numpy_board import NumpyBoard2D
+
+
+@pytest.mark.parametrize("length,width", [(1, 1), (2, 3), (3, 2)])
+def test_should_create_a_numpy_board_with_the_given_length_and_width(length: int, width: int):
+    board = NumpyBoard2D(length, width)
+
+    assert board.status.shape == board.ship_ids.shape == (length, width)
+    assert board.status.dtype.name == "uint8"
+    assert all(board.status_at(Position(i, j)) == PositionStatus.FREE for i in range(length) for j in range(width))
+    assert all(board.ship_at(Position(i, j)) is None for i in range(length) for j in range(width))
+
+
+def test_should_place_ship_on_a_numpy_board():
+    board, ship = NumpyBoard2D(4, 4), Ship("destroyer", 3)
+
+    place_ship_on_board(ship, board, Position(1, 0), ShipDirection.H)
+
+    assert board.chart[1][0] == board.chart[1][1] == board.chart[1][2] == BoardPosition(PositionStatus.OCCUPIED, ship)
+    assert board.chart[1][3] == BoardPosition()
+    assert board.ship_at(Position(1, 2)) is ship
+    assert board.ships == [ship]
+
+    with pytest.raises(CannotOccupyPositions):
+        place_ship_on_board(Ship("patrol-ship", 2), board, Position(0, 1), ShipDirection.V)
+
+
+def test_should_bomb_a_numpy_board_until_the_ship_is_destroyed():
+    board, ship = NumpyBoard2D(4, 4), Ship("patrol-ship", 2)
+    place_ship_on_board(ship, board, Position(2, 2), ShipDirection.V)
+
+    assert not bomb_position(board, Position(0, 0)).has_hit_something
+    assert bomb_position(board, Position(2, 2)) == (True, False)
+    assert bomb_position(board, Position(3, 2)) == (True, True)
+    assert board.status_at(Position(3, 2)) == PositionStatus.BOMBED
+
+    with pytest.raises(CannotBombPosition):
+        bomb_position(board, Position(3, 2))
+
+    with pytest.raises(CannotBombPosition):
+        bomb_position(board, Position(4, 4))
+
+
+def test_should_raise_exception_when_ship_ids_run_out():
+    board = NumpyBoard2D(2, 2)
+    board._known_ships.extend(Ship("patrol-ship", 1) for _ in range(MAX_SHIPS))
+
+    with pytest.raises(CannotOccupyPositions):
+        place_ship_on_board(Ship("patrol-ship", 1), board, Position(0, 0), ShipDirection.H)
+    assert board.status_at(Position(0, 0)) == PositionStatus.FREE
+    assert board.ship_ids.max() == 0
+
+
+def test_should_allow_replacing_a_whole_position_of_a_numpy_board():
+    board = NumpyBoard2D(2, 2)
+
+    board.chart[0][1] = BoardPosition(PositionStatus.BOMBED)
+
+    assert board.status_at(Position(0, 1)) == PositionStatus.BOMBED
+
+
+def test_should_render_a_numpy_board_like_the_list_board():
+    boards = Board2D(3, 4), NumpyBoard2D(3, 4)
+
+    for board in boards:
+        place_ship_on_board(Ship("destroyer", 3), board, Position(0, 1), ShipDirection.H)
+        bomb_position(board, Position(0, 2))
+        bomb_position(board, Position(2, 0))
+
+    assert str(boards[1]) == str(boards[0]) == "O X B X\nO O O O\nB O O O"
+
+
+def test_should_create_a_player_with_a_numpy_board():
+    player = Player("player_1", game_option=DEFAULT_GAME_OPTION, board_factory=NumpyBoard2D)
+
+    place_ship(player, player.game_option["AIR"], Position(0, 0), ShipDirection.H)
+
+    assert isinstance(player.board, NumpyBoard2D)
+    assert len(player.board.ships) == 1
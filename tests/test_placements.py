@@ -0,0 +1,107 @@
+from random import Random
+
+import pytest
+
+from naval_warfare.actions import bomb_position
+from naval_warfare.actions import place_ship_on_board
+from naval_warfare.bitboard import BitBoard
+from naval_warfare.bitboard import bomb_bitboard_position
+from naval_warfare.board import cannot_occupy_board_span
+from naval_warfare.exceptions import CannotOccupyPositions
+from naval_warfare.models import Board2D
+from naval_warfare.models import Position
+from naval_warfare.models import PositionStatus
+from naval_warfare.models import Ship
+from naval_warfare.models import ShipDirection
+from naval_warfare.numpy_board import NumpyBoard2D
+from naval_warfare.placements import PlacementIndex
+from naval_warfare.placements import attach_placement_index
+from naval_warfare.sparse_board import SparseBoard
+
+SHIP_LENGTHS = [1, 2, 3, 5]
+
+
+def retrieve_legal_slots_by_brute_force(board: Board2D, ship_length: int) -> set:
+    directions = [ShipDirection.H] if ship_length == 1 else list(ShipDirection)
+    return {
+        (Position(x, y), direction)
+        for x in range(board.length)
+        for y in range(board.width)
+        for direction in directions
+        if not cannot_occupy_board_span(board, ship_length, Position(x, y), direction)
+    }
+
+
+def test_should_index_every_slot_of_an_empty_board():
+    placement_index = PlacementIndex(3, 4, SHIP_LENGTHS)
+
+    assert placement_index.count(1) == 12
+    assert placement_index.count(2) == 3 * 3 + 2 * 4
+    assert placement_index.count(3) == 3 * 2 + 1 * 4
+    assert placement_index.count(5) == 0
+    assert set(placement_index.slots(3)) == retrieve_legal_slots_by_brute_force(Board2D(3, 4), 3)
+
+
+@pytest.mark.parametrize("board_factory", [Board2D, NumpyBoard2D, BitBoard, SparseBoard])
+@pytest.mark.parametrize("seed", range(10))
+def test_should_keep_the_index_up_to_date_as_the_board_changes(board_factory, seed: int):
+    rng = Random(seed)
+    board = board_factory(rng.randint(4, 9), rng.randint(4, 9))
+    placement_index = attach_placement_index(board, SHIP_LENGTHS)
+
+    for _ in range(12):
+        position = Position(rng.randrange(board.length), rng.randrange(board.width))
+        if rng.random() < 0.5:
+            ship_length, direction = rng.choice([1, 2, 3]), rng.choice(list(ShipDirection))
+            if not cannot_occupy_board_span(board, ship_length, position, direction):
+                place_ship_on_board(Ship("ship", ship_length), board, position, direction)
+        elif board.status_at(position) != PositionStatus.BOMBED:
+            bomb_position(board, position)
+
+        for ship_length in SHIP_LENGTHS:
+            if placement_index.count(ship_length) and rng.random() < 0.5:
+                assert placement_index.is_legal(ship_length, *placement_index.choose(ship_length, rng))
+            expected_slots = retrieve_legal_slots_by_brute_force(board, ship_length)
+            assert set(placement_index.slots(ship_length)) == expected_slots
+            assert placement_index.count(ship_length) == len(expected_slots)
+
+
+def test_should_index_the_slots_left_on_a_board_in_progress():
+    board = BitBoard(5, 5)
+    place_ship_on_board(Ship("destroyer", 3), board, Position(2, 1), ShipDirection.H)
+    bomb_bitboard_position(board, Position(0, 0))
+
+    placement_index = PlacementIndex.from_board(board, [3])
+
+    assert set(placement_index.slots(3)) == retrieve_legal_slots_by_brute_force(board, 3)
+    assert not placement_index.is_legal(3, Position(0, 0), ShipDirection.V)
+    assert placement_index.is_legal(3, Position(0, 1), ShipDirection.H)
+    assert not placement_index.is_legal(3, Position(0, 3), ShipDirection.H)
+
+
+def test_should_draw_slots_uniformly():
+    placement_index = PlacementIndex(2, 3, [2])
+    rng = Random(1)
+
+    draws = [placement_index.choose(2, rng) for _ in range(7000)]
+
+    assert placement_index.count(2) == 7
+    assert all(900 < draws.count(slot) < 1100 for slot in placement_index.slots(2))
+
+
+def test_should_raise_exception_when_no_slot_is_left():
+    placement_index = PlacementIndex(1, 3, [2])
+    placement_index.block_position(Position(0, 1))
+
+    with pytest.raises(CannotOccupyPositions):
+        placement_index.choose(2, Random(1))
+
+
+def test_should_stop_indexing_a_forgotten_ship_length():
+    placement_index = PlacementIndex(4, 4, [2, 3])
+
+    placement_index.forget(3)
+    placement_index.block_span(Position(0, 0), 2, ShipDirection.H)
+
+    assert placement_index.ship_lengths == (2,)
+    assert placement_index.count(2) == 24 - 4
@@ -0,0 +1,113 @@
+import io
+
+import pytest
+
+from naval_warfare.exceptions import InputWithError
+from naval_warfare.game import AvailableShip
+from naval_warfare.game import GameOption
+from naval_warfare.models import Position
+from naval_warfare.models import PositionStatus
+from naval_warfare.models import ShipDirection
+from naval_warfare.reader import format_placement_line
+from naval_warfare.reader import open_games
+from naval_warfare.reader import read_games
+
+GAME_OPTION: GameOption = {
+    "DES": AvailableShip(kind="destroyer", length=3, quantity=1),
+    "PTL": AvailableShip(kind="patrol-ship", length=2, quantity=1),
+}
+GAME_LINES = ["DES 0 0 H", "PTL 1 0 H", "-----", "DES 0 0 V", "PTL 0 1 V"]
+
+
+def test_should_format_a_placement_as_a_line_input():
+    assert format_placement_line(("DES", Position(4, 2), ShipDirection.V)) == "DES 4 2 V"
+
+
+def test_should_read_the_game_from_the_games_folder():
+    with open_games("games/game_1.in") as games:
+        (game,) = list(games)
+
+    assert len(game.player_1.board.ships) == len(game.player_2.board.ships) == 5
+    assert game.player_1.board.status_at(Position(0, 1)) == PositionStatus.OCCUPIED
+    assert game.player_2.board.status_at(Position(1, 9)) == PositionStatus.OCCUPIED
+
+
+def test_should_read_every_game_from_a_batch_file():
+    with open_games("games/batch_1.in") as games:
+        assert sum(1 for _ in games) == 3
+
+
+def test_should_read_games_lazily_and_silently(capsys):
+    lines = io.StringIO("DES 0 0 H\nPTL 1 0 H\n---\nDES 0 0 V\nPTL 0 1 V\n=====\n" * 3 + "DES 0 0 H\n")
+    games = read_games(lines, GAME_OPTION, length=4, width=4)
+
+    first_game = next(games)
+
+    assert first_game.player_2.board.status_at(Position(2, 0)) == PositionStatus.OCCUPIED
+    assert lines.tell() < len(lines.getvalue()) / 2  # Only what the first game needs was read so far
+    assert sum(1 for _ in zip(range(2), games)) == 2
+    assert not capsys.readouterr().out
+
+
+def test_should_skip_lines_that_cannot_be_parsed_or_placed():
+    lines = [
+        *["DES 0 0 H", "XYZ 1 1 H", "DES 1 1 H", "PTL 0 1 V", "PTL 9 9 V", "PTL 1 0 H", ""],
+        *["-----", "DES 3 0 H", "PTL 1 2 V"],
+    ]
+
+    (game,) = list(read_games(lines, GAME_OPTION, length=4, width=4))
+
+    assert [ship.kind for ship in game.player_1.board.ships] == ["destroyer", "patrol-ship"]
+    assert game.player_1.board.ship_at(Position(1, 1)).kind == "patrol-ship"
+
+
+@pytest.mark.parametrize(
+    "lines,invalid_games",
+    [(["DES 0 0 H", "PTL 1 0 H", "DES 0 0 H"], 1), (["DES 0 0 H", "=====", "DES 0 0 H", "PTL 1 0 H"], 2)],
+)
+def test_should_report_every_incomplete_game(lines, invalid_games: int):
+    errors = []
+
+    assert not list(read_games(lines, GAME_OPTION, length=4, width=4, on_invalid_game=errors.append))
+    assert len(errors) == invalid_games
+    assert all(isinstance(error, InputWithError) for error in errors)
+
+
+def test_should_log_and_skip_an_invalid_game_by_default(caplog):
+    lines = ["DES 0 0 H", "-----", "DES 0 0 V", "PTL 0 1 V", "=====", *GAME_LINES]
+
+    (game,) = list(read_games(lines, GAME_OPTION, length=4, width=4))
+
+    assert game.player_2.board.status_at(Position(2, 0)) == PositionStatus.OCCUPIED
+    assert "Skipping game" in caplog.text
+
+
+def test_should_report_a_second_fleet_without_a_players_separator():
+    errors = []
+    lines = ["DES 0 0 H", "PTL 1 0 H", "DES 0 0 V", "PTL 0 1 V", "=====", *GAME_LINES]
+
+    games = list(read_games(lines, GAME_OPTION, length=4, width=4, on_invalid_game=errors.append))
+
+    assert len(games) == 1
+    assert len(errors) == 1
+    assert "missing separator at line 3" in str(errors[0])
+
+
+@pytest.mark.parametrize(
+    "invalid_lines",
+    [
+        ["DES 0 0 H", "XYZ 1 0 H", "-----", "DES 0 0 V", "PTL 0 1 V"],  # Player 1 misses a ship
+        ["DES 0 0 H", "PTL 1 0 H", "PTL 2 0 H", "-----", "DES 0 0 V", "PTL 0 1 V"],  # Player 1 has an extra ship
+    ],
+)
+def test_should_resynchronize_on_the_separators_after_an_invalid_game(invalid_lines):
+    errors = []
+    lines = [*GAME_LINES, "=====", *invalid_lines, "=====", *GAME_LINES]
+
+    games = list(read_games(lines, GAME_OPTION, length=4, width=4, on_invalid_game=errors.append))
+
+    assert len(games) == 2
+    assert len(errors) == 1
+    for game in games:
+        assert game.player_1.board.ship_at(Position(1, 0)).kind == "patrol-ship"
+        assert game.player_2.board.ship_at(Position(0, 1)).kind == "patrol-ship"
@@ -0,0 +1,100 @@
+import io
+
+import pytest
+
+from naval_warfare.actions import BombOutcome
+from naval_warfare.bitboard import BitBoard
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import Game
+from naval_warfare.game import Player
+from naval_warfare.game import place_ship
+from naval_warfare.game import show_final_boards
+from naval_warfare.game import start
+from naval_warfare.models import Board2D
+from naval_warfare.models import Position
+from naval_warfare.models import ShipDirection
+from naval_warfare.numpy_board import NumpyBoard2D
+from naval_warfare.render import BufferedRenderer
+from naval_warfare.render import format_outcome
+from naval_warfare.sparse_board import SparseBoard
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+def prepare_small_game(board_factory=Board2D) -> Game:
+    player_1, player_2 = (
+        Player(name, game_option=DEFAULT_GAME_OPTION, board_factory=board_factory) for name in ("player_1", "player_2")
+    )
+    place_ship(player_1, player_1.game_option["PTL"], Position(0, 0), ShipDirection.H)
+    place_ship(player_2, player_2.game_option["PTL"], Position(0, 0), ShipDirection.V)
+    return Game(player_1, player_2)
+
+
+def test_should_format_the_outcome_of_a_shot():
+    assert format_outcome("player_1", BombOutcome(True, False), Position(3, 4)) == (
+        "\n        player_1 attacked position (3, 4)..."
+        "\n        Outcome:"
+        "\n            - hit something: Yes"
+        "\n            - destroyed ship: No"
+        "\n        \n"
+    )
+
+
+@pytest.mark.parametrize("board_factory", [Board2D, NumpyBoard2D, BitBoard, SparseBoard])
+def test_should_render_the_same_rows_on_every_board(board_factory):
+    game = prepare_small_game(board_factory)
+    game.player_1.board.mark_bombed(Position(2, 3))
+
+    assert (
+        list(game.player_1.board.rows())
+        == [
+            "X X O O O O O O O O",
+            "O O O O O O O O O O",
+            "O O O B O O O O O O",
+        ]
+        + ["O O O O O O O O O O"] * 7
+    )
+
+
+def test_should_write_in_blocks_of_the_buffer_size():
+    stream = CountingStream()
+
+    with BufferedRenderer(stream, buffer_size=10) as renderer:
+        for _ in range(20):
+            renderer.write("abc")
+
+    assert stream.getvalue() == "abc" * 20
+    assert stream.writes == 5  # every 4 writes of 3 characters
+
+
+def test_should_write_a_whole_battle_at_once():
+    stream = CountingStream()
+    renderer = BufferedRenderer(stream)
+
+    start(prepare_small_game(), renderer=renderer)
+    show_final_boards(prepare_small_game(), renderer=renderer)
+
+    output = stream.getvalue()
+    assert stream.writes == 1
+    assert output.startswith("Time to battle!\n")
+    assert "won!\nRemaining ships: ['patrol-ship']\n\n" in output
+    assert output.endswith(
+        "Final board from player_2\nX O O O O O O O O O\n"
+        + "X O O O O O O O O O\n"
+        + "O O O O O O O O O O\n" * 8
+        + "\n"
+    )
+
+
+def test_should_print_the_battle_on_stdout_by_default(capsys):
+    start(prepare_small_game())
+
+    assert "attacked position" in capsys.readouterr().out
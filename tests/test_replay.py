@@ -0,0 +1,132 @@
+import io
+from random import Random
+
+import pytest
+
+from naval_warfare.events import BattleEnded
+from naval_warfare.exceptions import InvalidReplay
+from naval_warfare.fleet import generate_random_fleets
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import Game
+from naval_warfare.game import start
+from naval_warfare.models import Position
+from naval_warfare.numpy_board import NumpyBoard2D
+from naval_warfare.replay import MAGIC
+from naval_warfare.replay import MAX_BOARD_SIDE
+from naval_warfare.replay import ReplayWriter
+from naval_warfare.replay import iterate_records
+from naval_warfare.replay import iterate_shots
+from naval_warfare.replay import open_replays
+from naval_warfare.replay import replay_game
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.sparse_board import SparseBoard
+
+
+def test_should_write_a_compact_record_per_game(record_games):
+    stream = io.BytesIO()
+
+    events = record_games(stream, [1])
+
+    shots = len(events) - 2
+    assert stream.getvalue().startswith(MAGIC)
+    assert len(stream.getvalue()) < 5 * shots + 200  # 5 bytes per shot, plus the game option and fleets
+
+
+def test_should_read_back_what_was_recorded(record_games):
+    stream = io.BytesIO()
+    events = record_games(stream, [1, 2])
+    started, *shots = events[: next(i for i, event in enumerate(events) if isinstance(event, BattleEnded))]
+
+    first_record, second_record = iterate_records(stream.getvalue())
+
+    assert first_record.length == first_record.width == 10
+    assert first_record.game_option == DEFAULT_GAME_OPTION
+    assert first_record.placements == (started.player_1.placements, started.player_2.placements)
+    assert second_record.placements != first_record.placements
+
+    expected_shots = [(1 if shot.attacker is started.player_1 else 2, shot.position, shot.outcome) for shot in shots]
+    assert [tuple(shot) for shot in iterate_shots(first_record)] == expected_shots
+
+
+def test_should_replay_a_recorded_game_into_its_final_boards(tmp_path):
+    placements = generate_random_fleets(DEFAULT_GAME_OPTION, rng=Random(3))
+    players = [prepare_headless_player(name, DEFAULT_GAME_OPTION, fleet) for name, fleet in zip(("1", "2"), placements)]
+    game = Game(*players)
+    path = tmp_path / "games.replay"
+
+    with open(path, "wb") as replay_file:
+        start(game, event_hook=ReplayWriter(replay_file))
+
+    with open_replays(str(path)) as records:
+        (replayed_game,) = [replay_game(record, board_factory=NumpyBoard2D) for record in records]
+
+    for player, replayed_player in zip(game.players, replayed_game.players):
+        assert str(player.board) == str(replayed_player.board)
+        assert player.remaining_ships == replayed_player.remaining_ships
+
+
+def test_should_raise_exception_when_a_replay_doesnt_match_the_game(record_games):
+    stream = io.BytesIO()
+    record_games(stream, [4])
+    data = bytearray(stream.getvalue())
+    data[-1] ^= 1  # Flips the "hit" flag of the last shot
+
+    (record,) = iterate_records(data)
+    with pytest.raises(InvalidReplay):
+        replay_game(record)
+
+
+@pytest.mark.parametrize("data", [b"", b"NOPE!", MAGIC + b"\x10\x00"])
+def test_should_raise_exception_for_invalid_replay_files(data: bytes):
+    with pytest.raises(InvalidReplay):
+        list(iterate_records(data))
+
+
+@pytest.mark.parametrize("kept_bytes", [len(MAGIC) + 4, len(MAGIC) + 10, len(MAGIC) + 60, -1])
+def test_should_raise_exception_for_truncated_replay_files(tmp_path, kept_bytes, record_games):
+    stream = io.BytesIO()
+    record_games(stream, [6])
+    path = tmp_path / "games.replay"
+    path.write_bytes(stream.getvalue()[:kept_bytes])
+
+    with pytest.raises(InvalidReplay):
+        with open_replays(str(path)) as records:
+            list(records)
+
+
+def test_should_keep_records_valid_after_closing_the_replay_file(tmp_path, record_games):
+    path = tmp_path / "games.replay"
+    with open(path, "wb") as replay_file:
+        record_games(replay_file, [7, 8])
+
+    with open_replays(str(path)) as records:
+        first_record = next(records)
+    with open_replays(str(path)) as records:
+        all_records = list(records)
+
+    assert replay_game(first_record).has_ended
+    assert [replay_game(record).has_ended for record in all_records] == [True, True]
+    assert list(iterate_shots(first_record)) == list(iterate_shots(all_records[0]))
+
+
+def test_should_raise_exception_when_recording_a_board_too_large_for_the_format():
+    player_1, player_2 = (
+        prepare_headless_player(
+            name, DEFAULT_GAME_OPTION, [], length=MAX_BOARD_SIDE + 1, width=10, board_factory=SparseBoard
+        )
+        for name in ("1", "2")
+    )
+
+    with pytest.raises(ValueError):
+        ReplayWriter(io.BytesIO()).begin_game(player_1, player_2)
+
+
+def test_should_record_who_fired_each_shot(record_games):
+    stream = io.BytesIO()
+    record_games(stream, [5])
+
+    (record,) = iterate_records(stream.getvalue())
+    attackers = [shot.attacker for shot in iterate_shots(record)]
+
+    assert attackers[:4] == [1, 2, 1, 2]
+    assert all(isinstance(shot.position, Position) for shot in iterate_shots(record))
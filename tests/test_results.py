@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from naval_warfare.actions import BombOutcome
+from naval_warfare.events import ShotFired
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.models import Position
+from naval_warfare.results import NOT_YET
+from naval_warfare.results import ResultsSink
+from naval_warfare.results import count_fleet_ships
+from naval_warfare.results import load_results
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.simulation import simulate_batch
+from naval_warfare.tournament import run_campaign
+
+
+def test_should_count_the_ships_of_a_fleet():
+    assert count_fleet_ships(DEFAULT_GAME_OPTION) == 5
+
+
+def test_should_write_a_chunk_every_time_the_sink_is_full(tmp_path, player_1_placements, player_2_placements):
+    with ResultsSink(str(tmp_path), 5, chunk_size=4) as sink:
+        results = simulate_batch(
+            DEFAULT_GAME_OPTION, (player_1_placements, player_2_placements), 10, seed=3, results_sink=sink
+        )
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "results-000000.npz",
+        "results-000001.npz",
+        "results-000002.npz",
+    ]
+    columns = load_results(str(tmp_path))
+    assert columns["seed"].tolist() == [result.seed for result in results]
+    assert columns["winner"].tolist() == [result.winner for result in results]
+    assert columns["turns"].tolist() == [result.turns for result in results]
+    assert columns["shots"].tolist() == [list(result.shots) for result in results]
+
+
+def test_should_record_the_first_hits_and_when_each_ship_sank(tmp_path, player_1_placements, player_2_placements):
+    with ResultsSink(str(tmp_path), 5) as sink:
+        simulate_batch(DEFAULT_GAME_OPTION, (player_1_placements, player_2_placements), 20, seed=4, results_sink=sink)
+
+    columns = load_results(str(tmp_path))
+    winners = columns["winner"] - 1
+    games = np.arange(len(winners))
+    sunk_turn = columns["sunk_turn"]
+    assert sunk_turn.shape == (20, 2, 5)
+
+    # Every ship of the loser sank, the last one at the last turn, and each one after the attacker's first hit
+    loser_sunk_turn = sunk_turn[games, 1 - winners]
+    assert (loser_sunk_turn != NOT_YET).all()
+    assert (loser_sunk_turn.max(axis=1) == columns["turns"]).all()
+    assert (loser_sunk_turn.min(axis=1) >= columns["first_hit_turn"][games, winners]).all()
+    assert (sunk_turn[games, winners] != NOT_YET).sum() < 5 * 20
+
+
+def test_should_load_nothing_from_an_empty_directory(tmp_path):
+    assert load_results(str(tmp_path)) == {}
+
+
+def test_should_only_load_the_chunks_of_the_given_prefix(tmp_path, player_1_placements, player_2_placements):
+    np.savez(tmp_path / "other.npz", seed=np.arange(3))
+    with ResultsSink(str(tmp_path), 5, prefix="first") as sink:
+        simulate_batch(DEFAULT_GAME_OPTION, (player_1_placements, player_2_placements), 2, seed=1, results_sink=sink)
+    with ResultsSink(str(tmp_path), 5, prefix="second") as sink:
+        simulate_batch(DEFAULT_GAME_OPTION, (player_1_placements, player_2_placements), 3, seed=2, results_sink=sink)
+
+    assert len(load_results(str(tmp_path), "first")["seed"]) == 2
+    assert len(load_results(str(tmp_path), "second")["seed"]) == 3
+    assert load_results(str(tmp_path)) == {}
+
+
+def test_should_raise_exception_when_a_shot_is_recorded_before_the_battle_started(
+    tmp_path, player_1_placements, player_2_placements
+):
+    player_1, player_2 = (
+        prepare_headless_player(name, DEFAULT_GAME_OPTION, placements)
+        for name, placements in (("Player 1", player_1_placements), ("Player 2", player_2_placements))
+    )
+    sink = ResultsSink(str(tmp_path), 5)
+
+    with pytest.raises(ValueError):
+        sink.event_hook(ShotFired(1, player_1, player_2, Position(0, 0), BombOutcome(True, False)))
+
+
+def test_should_keep_the_results_of_a_campaign(tmp_path):
+    result = run_campaign(25, seed=6, chunk_size=10, workers=2, results_directory=str(tmp_path))
+
+    columns = load_results(str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 3
+    assert len(columns["seed"]) == 25
+    assert np.bincount(columns["winner"], minlength=3)[1:].tolist() == result.wins
@@ -0,0 +1,41 @@
+from random import Random
+
+import pytest
+
+from naval_warfare.exceptions import NoPositionsLeft
+from naval_warfare.models import Position
+from naval_warfare.scheduler import TargetScheduler
+
+
+@pytest.mark.parametrize("length,width", [(1, 1), (2, 3), (10, 10)])
+def test_should_return_every_board_position_exactly_once(length: int, width: int):
+    scheduler = TargetScheduler(length, width, Random(1))
+
+    positions = [scheduler.next_position() for _ in range(length * width)]
+
+    assert sorted(positions) == [Position(i, j) for i in range(length) for j in range(width)]
+    assert len(scheduler) == 0
+
+
+def test_should_raise_exception_when_there_are_no_positions_left():
+    scheduler = TargetScheduler(1, 1)
+    scheduler.next_position()
+
+    with pytest.raises(NoPositionsLeft):
+        scheduler.next_position()
+
+
+def test_should_return_the_same_positions_given_the_same_seed():
+    scheduler_1, scheduler_2 = TargetScheduler(5, 5, Random(3)), TargetScheduler(5, 5, Random(3))
+
+    assert [scheduler_1.next_position() for _ in range(25)] == [scheduler_2.next_position() for _ in range(25)]
+
+
+def test_should_only_keep_the_swapped_positions_on_huge_boards():
+    scheduler = TargetScheduler(100_000, 100_000, Random(1))
+
+    positions = {scheduler.next_position() for _ in range(1000)}
+
+    assert len(positions) == 1000
+    assert all(0 <= position.x < 100_000 and 0 <= position.y < 100_000 for position in positions)
+    assert len(scheduler._swapped) <= 1000
@@ -0,0 +1,121 @@
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import AvailableShip
+from naval_warfare.models import Position
+from naval_warfare.models import ShipDirection
+from naval_warfare.scoring import LayoutScore
+from naval_warfare.scoring import LayoutScoreCache
+from naval_warfare.scoring import LayoutScorer
+from naval_warfare.scoring import canonicalize_layout
+from naval_warfare.scoring import retrieve_symmetries
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.strategies import ProbabilityDensityStrategy
+
+
+def transform_layout(placements, symmetry):
+    """Image of a layout given as the positions of each ship, built without `canonicalize_layout`'s helpers."""
+    images = []
+    for ship_slug, (x, y), direction in placements:
+        step_x, step_y = (0, 1) if direction == ShipDirection.H else (1, 0)
+        ship_length = DEFAULT_GAME_OPTION[ship_slug]["length"]
+        positions = sorted(symmetry(x + offset * step_x, y + offset * step_y) for offset in range(ship_length))
+        image_direction = ShipDirection.H if positions[0][0] == positions[-1][0] else ShipDirection.V
+        images.append((ship_slug, Position(*positions[0]), image_direction))
+    return images
+
+
+def test_should_retrieve_8_symmetries_for_square_boards_and_4_for_rectangular_ones():
+    square_images = {
+        tuple(symmetry(x, y) for x in range(4) for y in range(4)) for symmetry in retrieve_symmetries(4, 4)
+    }
+    rectangle_images = {
+        tuple(symmetry(x, y) for x in range(3) for y in range(5)) for symmetry in retrieve_symmetries(3, 5)
+    }
+
+    assert len(square_images) == 8
+    assert len(rectangle_images) == 4
+    for image in square_images:
+        assert sorted(image) == [(x, y) for x in range(4) for y in range(4)]
+    for image in rectangle_images:
+        assert sorted(image) == [(x, y) for x in range(3) for y in range(5)]
+
+
+def test_should_canonicalize_every_image_of_a_layout_to_the_same_layout(player_1_placements):
+    canonical_layout = canonicalize_layout(DEFAULT_GAME_OPTION, player_1_placements, 10, 10)
+
+    for symmetry in retrieve_symmetries(10, 10):
+        image = transform_layout(player_1_placements, symmetry)
+        prepare_headless_player("player", DEFAULT_GAME_OPTION, image)  # Images are legal layouts
+        assert canonicalize_layout(DEFAULT_GAME_OPTION, image, 10, 10) == canonical_layout
+        assert canonicalize_layout(DEFAULT_GAME_OPTION, image[::-1], 10, 10) == canonical_layout
+
+
+def test_should_not_canonicalize_quarter_turns_of_rectangular_boards():
+    game_option = {"DES": AvailableShip(kind="Destroyer", length=3, quantity=1)}
+    layout = [("DES", Position(0, 0), ShipDirection.H)]
+    quarter_turn = [("DES", Position(0, 0), ShipDirection.V)]
+
+    assert canonicalize_layout(game_option, layout, 6, 6) == canonicalize_layout(game_option, quarter_turn, 6, 6)
+    assert canonicalize_layout(game_option, layout, 6, 8) != canonicalize_layout(game_option, quarter_turn, 6, 8)
+
+
+def test_should_score_a_layout_by_the_shots_needed_to_sink_it(player_1_placements):
+    score = LayoutScorer(DEFAULT_GAME_OPTION, games=20, seed=3).score(player_1_placements)
+
+    assert score.games == 20
+    assert 17 <= score.mean_shots <= 100
+    assert score.stdev_shots > 0
+
+
+def test_should_give_the_same_score_to_every_image_of_a_layout(player_1_placements):
+    scorer = LayoutScorer(DEFAULT_GAME_OPTION, games=10, seed=1, strategy_factory=ProbabilityDensityStrategy)
+    score = scorer.score(player_1_placements)
+
+    for symmetry in retrieve_symmetries(10, 10):
+        assert scorer.score(transform_layout(player_1_placements, symmetry)) == score
+
+
+def test_should_reuse_cached_scores_for_the_images_of_a_layout(player_1_placements):
+    cache = LayoutScoreCache()
+    scorer = LayoutScorer(DEFAULT_GAME_OPTION, games=5, cache=cache)
+
+    scores = {scorer.score(transform_layout(player_1_placements, symmetry)) for symmetry in retrieve_symmetries(10, 10)}
+
+    assert len(scores) == 1
+    assert len(cache) == 1
+    assert (cache.stats.hits, cache.stats.misses) == (7, 1)
+    assert cache.stats.hit_rate == 7 / 8
+
+
+def test_should_not_share_cached_scores_between_different_scorers(player_1_placements):
+    cache = LayoutScoreCache()
+    LayoutScorer(DEFAULT_GAME_OPTION, games=5, cache=cache).score(player_1_placements)
+    LayoutScorer(DEFAULT_GAME_OPTION, games=6, cache=cache).score(player_1_placements)
+
+    assert len(cache) == 2
+    assert cache.stats.hits == 0
+
+
+def test_should_evict_the_least_recently_used_scores():
+    cache = LayoutScoreCache(max_entries=2)
+    cache.put("a", LayoutScore(1, 10.0, 0.0))
+    cache.put("b", LayoutScore(1, 20.0, 0.0))
+    cache.get("a")
+    cache.put("c", LayoutScore(1, 30.0, 0.0))
+
+    assert cache.get("b") is None
+    assert cache.get("a") == LayoutScore(1, 10.0, 0.0)
+    assert cache.get("c") == LayoutScore(1, 30.0, 0.0)
+    assert cache.stats.evictions == 1
+    assert cache.stats.hit_rate == 3 / 4
+
+
+def test_should_persist_the_cache_on_disk(tmp_path, player_1_placements):
+    path = str(tmp_path / "scores.json")
+    with LayoutScoreCache(path=path) as cache:
+        LayoutScorer(DEFAULT_GAME_OPTION, games=5, cache=cache).score(player_1_placements)
+
+    reloaded_cache = LayoutScoreCache(path=path)
+    score = LayoutScorer(DEFAULT_GAME_OPTION, games=5, cache=reloaded_cache).score(player_1_placements)
+
+    assert reloaded_cache.stats.hits == 1
+    assert score == LayoutScorer(DEFAULT_GAME_OPTION, games=5).score(player_1_placements)
@@ -0,0 +1,176 @@
+import asyncio
+from random import Random
+
+from naval_warfare.server import GameClient
+from naval_warfare.server import GameServer
+from naval_warfare.server import Match
+
+PLACEMENTS = ["AIR 0 0 H", "BTL 1 0 H", "SUB 2 0 H", "DES 3 0 H", "PTL 4 0 H"]
+ALL_POSITIONS = [f"FIRE {x} {y}" for x in range(10) for y in range(10)]
+
+
+def run_with_server(scenario, **kwargs):
+    async def run():
+        server = GameServer(rng=Random(1), **kwargs)
+        listening = await server.serve()
+        port = listening.sockets[0].getsockname()[1]
+        async with listening:
+            return await scenario(server, port)
+
+    return asyncio.run(asyncio.wait_for(run(), timeout=30))
+
+
+async def connect(port: int, mode: str) -> GameClient:
+    client = await GameClient.connect("127.0.0.1", port)
+    assert await client.receive() == "WELCOME"
+    await client.send(mode)
+    return client
+
+
+async def place_fleet(client: GameClient) -> list:
+    lines = []
+    for placement in PLACEMENTS:
+        await client.send(placement)
+        lines.append(await client.receive())
+    return lines
+
+
+async def play_until_the_end(client: GameClient) -> list:
+    """Fire at every position, in order, whenever it's our turn, until the match ends."""
+    positions = iter(ALL_POSITIONS)
+    received = []
+    while True:
+        lines = await client.receive_until("YOUR TURN", "WIN", "LOSE")
+        received.extend(lines)
+        if lines[-1] in ("WIN", "LOSE"):
+            return received
+        await client.send(next(positions))
+
+
+def test_should_play_a_whole_match_against_a_bot():
+    async def scenario(server, port):
+        client = await connect(port, "BOT")
+        assert await client.receive() == "PLACE AIR BTL SUB DES PTL"
+        placed = await place_fleet(client)
+        received = await play_until_the_end(client)
+        await client.close()
+        return placed, received
+
+    placed, received = run_with_server(scenario)
+
+    assert placed == ["PLACED BTL SUB DES PTL", "PLACED SUB DES PTL", "PLACED DES PTL", "PLACED PTL", "FLEET READY"]
+    assert received[:2] == ["BATTLE", "YOUR TURN"]
+    assert received[2].startswith("RESULT 0 0 ")
+    assert received[3].startswith("INCOMING ")
+    results = [line for line in received if line.startswith("RESULT")]
+    incoming = [line for line in received if line.startswith("INCOMING")]
+    assert len(incoming) in (len(results), len(results) - 1)
+    assert received[-1] in ("WIN", "LOSE")
+
+
+def test_should_play_a_whole_match_between_two_clients():
+    async def scenario(server, port):
+        first = await connect(port, "JOIN")
+        assert await first.receive() == "WAITING"
+        second = await connect(port, "JOIN")
+        assert await first.receive() == "PLACE AIR BTL SUB DES PTL"
+        assert await second.receive() == "PLACE AIR BTL SUB DES PTL"
+
+        await place_fleet(first)
+        await second.send("FIRE 0 0")
+        assert await second.receive() == "ERROR battle hasn't started"
+        await place_fleet(second)
+
+        results = await asyncio.gather(play_until_the_end(first), play_until_the_end(second))
+        await first.close()
+        await second.close()
+        return results
+
+    first_received, second_received = run_with_server(scenario)
+
+    # Both fire at the same positions in order, so the first to shoot destroys the other fleet first
+    assert first_received[-1] == "WIN"
+    assert second_received[-1] == "LOSE"
+    assert "INCOMING 4 1 SUNK" in second_received
+
+
+def test_should_reply_with_errors_to_invalid_commands():
+    async def scenario(server, port):
+        client = await GameClient.connect("127.0.0.1", port)
+        await client.receive()
+        replies = []
+        for line in ["PLAY", "BOT", "AIR 0 0", "XYZ 0 0 H", "AIR 0 8 H", "FIRE 0 0"]:
+            await client.send(line)
+            replies.append(await client.receive())
+            if line == "BOT":
+                replies.pop()  # PLACE
+        await client.send("QUIT")
+        replies.append(await client.receive())
+        return replies
+
+    assert run_with_server(scenario) == [
+        "ERROR expected JOIN or BOT",
+        "ERROR expected SLG X Y H|V or FIRE X Y",
+        "ERROR expected SLG X Y H|V or FIRE X Y",
+        "ERROR cannot place ship on given position",
+        "ERROR battle hasn't started",
+        "BYE",
+    ]
+
+
+def test_should_reply_with_an_error_to_a_line_too_long_and_keep_the_connection():
+    async def scenario(server, port):
+        client = await GameClient.connect("127.0.0.1", port)
+        assert await client.receive() == "WELCOME"
+        await client.send("X" * 100_000)
+        too_long = await client.receive_until("ERROR line too long")
+        await client.send("BOT")
+        placing = await client.receive_until("PLACE")
+        await client.close()
+        return too_long, placing
+
+    too_long, placing = run_with_server(scenario)
+
+    assert too_long[-1] == "ERROR line too long"
+    assert placing[-1] == "PLACE AIR BTL SUB DES PTL"
+
+
+def test_should_tell_the_opponent_when_a_client_leaves():
+    async def scenario(server, port):
+        first = await connect(port, "JOIN")
+        second = await connect(port, "JOIN")
+        await second.close()
+        return await first.receive_until("OPPONENT LEFT")
+
+    assert run_with_server(scenario)[-1] == "OPPONENT LEFT"
+
+
+def test_should_hold_many_concurrent_matches():
+    async def scenario(server, port):
+        clients = await asyncio.gather(*(connect(port, "BOT") for _ in range(200)))
+        connections = server.connections
+        await asyncio.gather(*(client.receive() for client in clients))  # PLACE
+        endings = await asyncio.gather(*(place_fleet(client) for client in clients))
+        await asyncio.gather(*(client.close() for client in clients))
+        return connections, endings
+
+    connections, endings = run_with_server(scenario)
+
+    assert connections == 200
+    assert all(lines[-1] == "FLEET READY" for lines in endings)
+
+
+def test_should_resume_a_match_from_its_checkpoint():
+    match = GameServer(rng=Random(1)).create_bot_match()
+    for placement in PLACEMENTS:
+        match.handle(0, placement)
+    match.handle(0, "FIRE 0 0")
+
+    resumed_match = Match.from_checkpoint(match.checkpoint())
+
+    assert resumed_match.checkpoint() == match.checkpoint()
+    assert resumed_match.has_started
+    assert resumed_match.turn == 0
+    assert sum(len(player["bombed"]) for player in match.checkpoint()["game"]["players"]) == 2
+    resumed_match.handle(0, "FIRE 0 1")
+    assert resumed_match.turn == 0
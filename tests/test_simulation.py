@@ -0,0 +1,90 @@
+import pytest
+
+from naval_warfare.events import BattleEnded
+from naval_warfare.events import BattleStarted
+from naval_warfare.events import ShotFired
+from naval_warfare.exceptions import UnavailableShip
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.numpy_board import NumpyBoard2D
+from naval_warfare.simulation import derive_game_seed
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.simulation import simulate
+from naval_warfare.simulation import simulate_batch
+
+
+def test_should_place_every_ship_of_a_headless_player(player_1_placements):
+    player = prepare_headless_player("player_1", DEFAULT_GAME_OPTION, player_1_placements)
+
+    assert len(player.board.ships) == 5
+    assert all(ship_option["quantity"] == 0 for ship_option in player.game_option.values())
+    assert DEFAULT_GAME_OPTION["AIR"]["quantity"] == 1  # The given game option isn't changed!
+
+
+def test_should_raise_exception_when_placements_have_more_ships_than_available(player_1_placements):
+    with pytest.raises(UnavailableShip):
+        prepare_headless_player("player_1", DEFAULT_GAME_OPTION, player_1_placements + player_1_placements[:1])
+
+
+def test_should_simulate_a_whole_game(player_1_placements, player_2_placements):
+    result = simulate(DEFAULT_GAME_OPTION, (player_1_placements, player_2_placements), seed=42)
+
+    assert result.seed == 42
+    assert result.winner in (1, 2)
+    assert result.turns == sum(result.shots)
+    assert 17 <= result.shots[result.winner - 1] <= 100  # Needs at least one shot per ship position to win
+    assert result.shots[0] - result.shots[1] == (1 if result.winner == 1 else 0)
+
+
+def test_should_simulate_the_same_game_given_the_same_seed(player_1_placements, player_2_placements):
+    placements = (player_1_placements, player_2_placements)
+
+    assert simulate(DEFAULT_GAME_OPTION, placements, seed=7) == simulate(DEFAULT_GAME_OPTION, placements, seed=7)
+
+
+def test_should_end_the_game_right_away_when_a_player_has_no_ships(player_1_placements):
+    result = simulate(DEFAULT_GAME_OPTION, (player_1_placements, []), seed=1)
+
+    assert result.winner == 1
+    assert result.turns == 0
+
+
+def test_should_simulate_a_batch_of_games_with_derived_seeds(player_1_placements, player_2_placements):
+    results = simulate_batch(DEFAULT_GAME_OPTION, (player_1_placements, player_2_placements), 5, seed=3)
+
+    assert [result.seed for result in results] == [derive_game_seed(3, game_index) for game_index in range(5)]
+    assert results == simulate_batch(DEFAULT_GAME_OPTION, (player_1_placements, player_2_placements), 5, seed=3)
+
+
+def test_should_simulate_a_batch_of_games_with_generated_placements(player_1_placements, player_2_placements):
+    generated_rngs = []
+
+    def generate_placements(rng):
+        generated_rngs.append(rng)
+        return player_1_placements, player_2_placements
+
+    results = simulate_batch(DEFAULT_GAME_OPTION, generate_placements, 3, seed=3)
+
+    assert len(results) == 3
+    assert len(generated_rngs) == 3
+
+
+def test_should_simulate_the_same_game_on_a_numpy_board(player_1_placements, player_2_placements):
+    placements = (player_1_placements, player_2_placements)
+
+    assert simulate(DEFAULT_GAME_OPTION, placements, seed=5) == simulate(
+        DEFAULT_GAME_OPTION, placements, seed=5, board_factory=NumpyBoard2D
+    )
+
+
+def test_should_emit_an_event_per_shot_when_simulating_with_an_event_hook(player_1_placements, player_2_placements):
+    events = []
+
+    result = simulate(DEFAULT_GAME_OPTION, (player_1_placements, player_2_placements), seed=2, event_hook=events.append)
+
+    started, *shots, ended = events
+    assert isinstance(started, BattleStarted)
+    assert [shot.turn for shot in shots] == list(range(1, result.turns + 1))
+    assert all(isinstance(shot, ShotFired) for shot in shots)
+    assert shots[0].attacker is started.player_1 and shots[0].defender is started.player_2
+    assert shots[-1].outcome.has_destroyed_a_ship
+    assert ended == BattleEnded(shots[-1].attacker, result.turns)
@@ -0,0 +1,159 @@
+from random import Random
+
+import pytest
+
+from naval_warfare.actions import bomb_position
+from naval_warfare.actions import place_ship_on_board
+from naval_warfare.benchmark import measure_allocated_bytes
+from naval_warfare.benchmark import measure_board_memory
+from naval_warfare.checkpoint import create_checkpoint
+from naval_warfare.checkpoint import restore_checkpoint
+from naval_warfare.exceptions import CannotBombPosition
+from naval_warfare.exceptions import CannotOccupyPositions
+from naval_warfare.fleet import generate_random_fleet
+from naval_warfare.fleet import generate_random_fleets
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.game import Game
+from naval_warfare.models import Board2D
+from naval_warfare.models import Position
+from naval_warfare.models import PositionStatus
+from naval_warfare.models import Ship
+from naval_warfare.models import ShipDirection
+from naval_warfare.scheduler import TargetScheduler
+from naval_warfare.simulation import prepare_headless_player
+from naval_warfare.simulation import simulate
+from naval_warfare.sparse_board import SparseBoard
+from naval_warfare.sparse_board import Viewport
+
+
+def test_should_place_ships_on_a_sparse_board():
+    board, ship_1, ship_2 = SparseBoard(3, 4), Ship("destroyer", 3), Ship("patrol-ship", 2)
+
+    place_ship_on_board(ship_1, board, Position(0, 1), ShipDirection.H)
+    place_ship_on_board(ship_2, board, Position(1, 0), ShipDirection.V)
+
+    assert board.ships_at == {1: ship_1, 2: ship_1, 3: ship_1, 4: ship_2, 8: ship_2}
+    assert board.ship_at(Position(0, 3)) is ship_1
+    assert board.ship_at(Position(2, 1)) is None
+    assert board.status_at(Position(2, 0)) == PositionStatus.OCCUPIED
+    assert board.status_at(Position(2, 3)) == PositionStatus.FREE
+    assert board.ships_afloat == 2
+
+    with pytest.raises(CannotOccupyPositions):
+        place_ship_on_board(Ship("patrol-ship", 2), board, Position(2, 0), ShipDirection.H)
+    with pytest.raises(CannotOccupyPositions):
+        place_ship_on_board(Ship("patrol-ship", 2), board, Position(2, 3), ShipDirection.V)
+
+
+def test_should_bomb_a_sparse_board_until_the_ship_is_destroyed():
+    board, ship = SparseBoard(4, 4), Ship("patrol-ship", 2)
+    place_ship_on_board(ship, board, Position(2, 2), ShipDirection.V)
+
+    assert bomb_position(board, Position(0, 0)) == (False, False)
+    assert bomb_position(board, Position(2, 2)) == (True, False)
+    assert bomb_position(board, Position(3, 2)) == (True, True)
+    assert board.bombed == {0, 10, 14}
+    assert str(board) == "B O O O\nO O O O\nO O B O\nO O B O"
+
+    with pytest.raises(CannotBombPosition):
+        bomb_position(board, Position(3, 2))
+    with pytest.raises(CannotBombPosition):
+        bomb_position(board, Position(0, 4))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_should_return_the_same_bomb_outcomes_as_the_list_board(seed: int):
+    rng = Random(seed)
+    boards = Board2D(10, 10), SparseBoard(10, 10)
+    for ship_slug, position, direction in generate_random_fleet(DEFAULT_GAME_OPTION, rng=rng):
+        for board in boards:
+            ship_option = DEFAULT_GAME_OPTION[ship_slug]
+            place_ship_on_board(Ship(ship_option["kind"], ship_option["length"]), board, position, direction)
+    scheduler = TargetScheduler(10, 10, rng)
+
+    while boards[0].ships_afloat:
+        position = scheduler.next_position()
+        assert bomb_position(boards[0], position) == bomb_position(boards[1], position)
+
+    assert boards[1].ships_afloat == 0
+    assert str(boards[0]) == str(boards[1])
+
+
+def test_should_render_only_the_viewport_of_a_sparse_board():
+    board = SparseBoard(100_000, 100_000)
+    place_ship_on_board(Ship("destroyer", 3), board, Position(50_000, 49_999), ShipDirection.H)
+    bomb_position(board, Position(50_001, 50_000))
+
+    assert str(board) == "\n".join(["O " * 19 + "O"] * 20)
+    board.viewport = Viewport(49_999, 49_998, 3, 4)
+    assert str(board) == "O O O O\nO X X X\nO O B O"
+    assert list(board.rows(Viewport(99_999, 99_998, 5, 5))) == ["O O"]  # Clipped to the board
+
+
+def test_should_keep_a_huge_sparse_board_as_small_as_a_standard_one():
+    assert measure_board_memory(100_000, 100_000, SparseBoard) < 1024
+
+    def play_shots(shots: int):
+        player = prepare_headless_player(
+            "player",
+            DEFAULT_GAME_OPTION,
+            generate_random_fleet(DEFAULT_GAME_OPTION, 100_000, 100_000, Random(1)),
+            length=100_000,
+            width=100_000,
+            board_factory=SparseBoard,
+        )
+        scheduler = TargetScheduler(100_000, 100_000, Random(2))
+        for _ in range(shots):
+            bomb_position(player.board, scheduler.next_position())
+
+    assert measure_allocated_bytes(lambda: play_shots(2000)) < 1_000_000
+
+
+def test_should_restore_a_sparse_board_snapshot():
+    board, ship = SparseBoard(5, 5), Ship("patrol-ship", 2)
+    place_ship_on_board(ship, board, Position(0, 0), ShipDirection.H)
+    bomb_position(board, Position(4, 4))
+    before = str(board)
+    snapshot = board.snapshot()
+
+    bomb_position(board, Position(0, 0))
+    place_ship_on_board(Ship("destroyer", 3), board, Position(2, 1), ShipDirection.V)
+    board.restore(snapshot)
+
+    assert str(board) == before
+    assert board.ships_at == {0: ship, 1: ship}
+    assert board.bombed == {24}
+    assert (ship.hits_taken, board.ships_afloat) == (0, 1)
+
+
+def test_should_simulate_the_same_game_on_a_sparse_board():
+    placements = generate_random_fleet(DEFAULT_GAME_OPTION, rng=Random(1)), generate_random_fleet(
+        DEFAULT_GAME_OPTION, rng=Random(2)
+    )
+
+    assert simulate(DEFAULT_GAME_OPTION, placements, seed=3) == simulate(
+        DEFAULT_GAME_OPTION, placements, seed=3, board_factory=SparseBoard
+    )
+
+
+def test_should_checkpoint_a_huge_sparse_board_without_scanning_it():
+    placements = generate_random_fleets(DEFAULT_GAME_OPTION, 100_000, 100_000, Random(3))
+    game = Game(
+        *(
+            prepare_headless_player(
+                name, DEFAULT_GAME_OPTION, fleet, length=100_000, width=100_000, board_factory=SparseBoard
+            )
+            for name, fleet in zip(("1", "2"), placements)
+        )
+    )
+    bombed = [Position(99_999, 5), Position(12, 34_567)] + [position for _, position, _ in placements[1]]
+    for position in bombed:
+        bomb_position(game.player_2.board, position)
+
+    checkpoint = create_checkpoint(game)
+    restored_game = restore_checkpoint(checkpoint, board_factory=SparseBoard)
+
+    assert checkpoint["players"][1]["bombed"] == sorted([x, y] for x, y in bombed)
+    assert checkpoint["players"][0]["bombed"] == []
+    assert restored_game.player_2.board.bombed == game.player_2.board.bombed
+    assert restored_game.player_2.board.ships_afloat == game.player_2.board.ships_afloat
@@ -0,0 +1,24 @@
+import pstats
+
+from naval_warfare.actions import BombOutcome
+from naval_warfare.stats import GameStats
+from naval_warfare.stats import profiling
+
+
+def test_should_count_every_shot_outcome():
+    stats = GameStats()
+
+    for outcome in (BombOutcome(False, False), BombOutcome(True, False), BombOutcome(True, True)):
+        stats.register_outcome(outcome)
+
+    assert (stats.shots, stats.misses, stats.hits, stats.sinks) == (3, 1, 2, 1)
+    assert "Shots: 3 (1 misses, 2 hits, 1 sinks)" in str(stats)
+
+
+def test_should_dump_the_profile_of_the_block(tmp_path):
+    path = str(tmp_path / "game.pstats")
+
+    with profiling(path):
+        sorted(range(1000), key=str)
+
+    assert pstats.Stats(path).total_calls > 0
@@ -0,0 +1,123 @@
+from random import Random
+
+import pytest
+
+from naval_warfare.actions import BombOutcome
+from naval_warfare.actions import bomb_position
+from naval_warfare.actions import place_ship_on_board
+from naval_warfare.board import has_all_ships_destroyed
+from naval_warfare.exceptions import NoPositionsLeft
+from naval_warfare.fleet import generate_random_fleets
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.models import Board2D
+from naval_warfare.models import Position
+from naval_warfare.models import Ship
+from naval_warfare.models import ShipDirection
+from naval_warfare.simulation import simulate_batch
+from naval_warfare.strategies import AttackStrategy
+from naval_warfare.strategies import ProbabilityDensityStrategy
+from naval_warfare.strategies import RandomStrategy
+
+
+def test_should_shoot_every_position_once_with_the_random_strategy():
+    strategy = RandomStrategy(3, 4, [2], Random(1))
+
+    positions = [strategy.next_position() for _ in range(12)]
+
+    assert sorted(positions) == [Position(i, j) for i in range(3) for j in range(4)]
+    with pytest.raises(NoPositionsLeft):
+        strategy.next_position()
+
+
+def test_should_start_hunting_at_the_densest_position():
+    strategy = ProbabilityDensityStrategy(5, 5, [3], Random(1))
+
+    assert strategy.next_position() == Position(2, 2)  # Covered by 3 horizontal and 3 vertical placements
+
+
+def test_should_keep_the_density_updated_as_the_board_is_bombed():
+    strategy = ProbabilityDensityStrategy(1, 5, [2], Random(1))
+    assert list(strategy._density) == [1, 2, 2, 2, 1]
+
+    strategy.register_outcome(Position(0, 2), BombOutcome(False, False))
+
+    assert list(strategy._density) == [1, 1, 0, 1, 1]
+
+
+def test_should_target_the_positions_around_a_hit():
+    strategy = ProbabilityDensityStrategy(5, 5, [2], Random(1))
+
+    strategy.register_outcome(Position(2, 2), BombOutcome(True, False))
+
+    around = {Position(1, 2), Position(3, 2), Position(2, 1), Position(2, 3)}
+    assert strategy.next_position() in around
+
+
+def test_should_stop_counting_a_destroyed_ship():
+    strategy = ProbabilityDensityStrategy(1, 4, [2, 1], Random(1))
+
+    strategy.register_outcome(Position(0, 0), BombOutcome(True, True))
+
+    assert strategy._remaining_lengths == {2: 1, 1: 0}
+    assert list(strategy._density) == [0, 1, 2, 1]
+
+
+def test_should_keep_counting_a_length_while_ships_of_it_are_afloat():
+    strategy = ProbabilityDensityStrategy(1, 4, [1, 1], Random(1))
+
+    strategy.register_outcome(Position(0, 0), BombOutcome(True, True))
+
+    assert strategy._remaining_lengths == {1: 1}
+    assert list(strategy._density) == [0, 1, 1, 1]
+
+
+def test_should_not_create_a_strategy_without_next_position():
+    class IncompleteStrategy(AttackStrategy):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteStrategy(10, 10, [2])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_should_destroy_every_ship_with_the_density_strategy(seed: int):
+    board, rng = Board2D(10, 10), Random(seed)
+    for ship_slug, position, direction in generate_random_fleets(DEFAULT_GAME_OPTION, rng=rng)[0]:
+        ship_option = DEFAULT_GAME_OPTION[ship_slug]
+        place_ship_on_board(Ship(ship_option["kind"], ship_option["length"]), board, position, direction)
+    strategy = ProbabilityDensityStrategy(10, 10, [ship.length for ship in board.ships], rng)
+
+    shots = 0
+    while not has_all_ships_destroyed(board):
+        position = strategy.next_position()
+        strategy.register_outcome(position, bomb_position(board, position))
+        shots += 1
+
+    assert shots <= 100
+
+
+def test_should_shoot_what_is_left_when_no_ship_fits_anymore():
+    board = Board2D(1, 3)
+    place_ship_on_board(Ship("patrol-ship", 1), board, Position(0, 1), ShipDirection.H)
+    strategy = ProbabilityDensityStrategy(1, 3, [3], Random(1))  # Wrong lengths: a 3-long ship is never found
+
+    positions = []
+    while not has_all_ships_destroyed(board):
+        positions.append(strategy.next_position())
+        strategy.register_outcome(positions[-1], bomb_position(board, positions[-1]))
+
+    assert len(positions) == len(set(positions)) <= 3
+
+
+def test_should_win_faster_with_the_density_strategy_than_at_random():
+    def simulate_with(strategy_factory):
+        results = simulate_batch(
+            DEFAULT_GAME_OPTION,
+            lambda rng: generate_random_fleets(DEFAULT_GAME_OPTION, rng=rng),
+            30,
+            seed=1,
+            strategy_factory=strategy_factory,
+        )
+        return sum(result.turns for result in results) / len(results)
+
+    assert simulate_with(ProbabilityDensityStrategy) < 0.75 * simulate_with(RandomStrategy)
@@ -0,0 +1,69 @@
+import pytest
+
+from naval_warfare.game import DEFAULT_GAME_OPTION
+from naval_warfare.strategies import ProbabilityDensityStrategy
+from naval_warfare.tournament import CampaignResult
+from naval_warfare.tournament import play_campaign_chunk
+from naval_warfare.tournament import run_campaign
+
+
+def test_should_merge_chunk_summaries_into_the_campaign_result():
+    result = CampaignResult(seed=1)
+
+    result.merge_chunk(3, ([2, 1], {40: 2, 55: 1}))
+    result.merge_chunk(2, ([0, 2], {40: 1, 61: 1}))
+
+    assert result.games == 5
+    assert result.wins == [2, 3]
+    assert result.win_rates == (0.4, 0.6)
+    assert result.turns_histogram == {40: 3, 55: 1, 61: 1}
+
+
+def test_should_play_a_campaign_chunk():
+    wins, turns_histogram = play_campaign_chunk(DEFAULT_GAME_OPTION, 1, 10, 20, 10, 10)
+
+    assert sum(wins) == 20
+    assert sum(turns_histogram.values()) == 20
+
+
+def test_should_run_a_campaign():
+    result = run_campaign(30, seed=5, chunk_size=7)
+
+    assert result.seed == 5
+    assert result.games == 30
+    assert sum(result.wins) == 30
+    assert sum(result.turns_histogram.values()) == 30
+
+
+def test_should_return_the_same_campaign_result_regardless_of_chunks_and_workers():
+    single_worker = run_campaign(40, seed=11, chunk_size=40)
+
+    assert run_campaign(40, seed=11, chunk_size=6) == single_worker
+    assert run_campaign(40, seed=11, chunk_size=6, workers=2) == single_worker
+
+
+def test_should_run_a_campaign_with_the_given_attack_strategy():
+    random_result = run_campaign(10, seed=2)
+    density_result = run_campaign(10, seed=2, strategy_factory=ProbabilityDensityStrategy, workers=2, chunk_size=5)
+
+    assert density_result.games == 10
+    assert min(random_result.turns_histogram) > min(density_result.turns_histogram)
+
+
+def test_should_run_a_lockstep_campaign():
+    result = run_campaign(50, seed=3, chunk_size=20, lockstep=True, strategy_factory=ProbabilityDensityStrategy)
+
+    assert result.games == 50
+    assert sum(result.wins) == 50
+    assert sum(result.turns_histogram.values()) == 50
+    assert (
+        run_campaign(50, seed=3, chunk_size=20, lockstep=True, workers=2, strategy_factory=ProbabilityDensityStrategy)
+        == result
+    )
+
+
+def test_should_raise_exception_when_a_lockstep_campaign_can_not_be_run(tmp_path):
+    with pytest.raises(ValueError):
+        run_campaign(5, seed=1, lockstep=True, results_directory=str(tmp_path))
+    with pytest.raises(ValueError):
+        run_campaign(5, seed=1, lockstep=True, strategy_factory=lambda *args: None)